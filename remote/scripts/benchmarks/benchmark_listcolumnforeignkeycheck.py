@@ -0,0 +1,120 @@
+"""
+benchmark_listcolumnforeignkeycheck
+-----------------------------------
+
+Compares reading whole tables with type inference (as the foreign key checker used to) against reading only the
+checked column as strings with `_read_csv_columns`, on synthetic tables as wide as the widest in `data/`.
+
+Run from the `remote/scripts` directory with `python -m benchmarks.benchmark_listcolumnforeignkeycheck`.
+"""
+
+import csv
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+from typing import Set
+
+import pandas as pd
+from tabulate import tabulate
+
+from mbocsvwscripts.listcolumnforeignkeycheck import (
+    _get_unique_child_values_from_table,
+    _get_unique_parent_values_from_table,
+    _read_csv_columns,
+)
+
+_NUM_ROWS = [10_000, 100_000, 1_000_000]
+
+_NUM_COLUMNS = 60
+
+_ID_COLUMN = "MBO Permanent Identifier*"
+
+_LIST_COLUMN = "Is Based On (mPIDs)"
+
+
+def _generate_table(csv_file: Path, num_rows: int) -> None:
+    """
+    Writes a table with an identifier column, a list column referencing other rows and a mix of text, numeric,
+    boolean and empty columns.
+    """
+    other_columns = [f"Column {i}" for i in range(_NUM_COLUMNS - 2)]
+    with open(csv_file, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow([_ID_COLUMN, _LIST_COLUMN] + other_columns)
+        for i in range(num_rows):
+            writer.writerow(
+                [f"mbo_dataset_{i}", f"mbo_dataset_{i // 2}|mbo_dataset_{i // 3}"]
+                + [
+                    [f"Text {i}", str(i), "true", ""][column % 4]
+                    for column in range(len(other_columns))
+                ]
+            )
+
+
+def _get_invalid_values_whole_table(csv_file: Path) -> Set[str]:
+    """
+    The previous implementation, which parsed every column of the table, once for each side of the check.
+    """
+    parent_column = pd.read_csv(csv_file)[_ID_COLUMN]
+    parent_values = {str(v) for v in parent_column[~parent_column.isnull()]}
+    child_column = pd.read_csv(csv_file)[_LIST_COLUMN]
+    child_values = {
+        individual_value
+        for cell_value in child_column[~child_column.isnull()]
+        for individual_value in str(cell_value).split("|")
+    }
+    return child_values - parent_values
+
+
+def _get_invalid_values_projected(csv_file: Path) -> Set[str]:
+    table = _read_csv_columns(csv_file, {_ID_COLUMN, _LIST_COLUMN})
+    return _get_unique_child_values_from_table(
+        table, _LIST_COLUMN, "|"
+    ) - _get_unique_parent_values_from_table(table, _ID_COLUMN)
+
+
+def main() -> None:
+    rows = []
+    with TemporaryDirectory() as tmp_dir:
+        for num_rows in _NUM_ROWS:
+            csv_file = Path(tmp_dir) / f"table-{num_rows}.csv"
+            _generate_table(csv_file, num_rows)
+
+            start = default_timer()
+            whole_table_invalid_values = _get_invalid_values_whole_table(csv_file)
+            whole_table_seconds = default_timer() - start
+
+            start = default_timer()
+            projected_invalid_values = _get_invalid_values_projected(csv_file)
+            projected_seconds = default_timer() - start
+
+            assert whole_table_invalid_values == projected_invalid_values
+
+            rows.append(
+                [
+                    num_rows,
+                    csv_file.stat().st_size / 1024**2,
+                    whole_table_seconds,
+                    projected_seconds,
+                    whole_table_seconds / projected_seconds,
+                ]
+            )
+            csv_file.unlink()
+
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "Rows",
+                "Size (MiB)",
+                "Whole table (s)",
+                "Projected (s)",
+                "Speed-up",
+            ],
+            floatfmt=".3f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
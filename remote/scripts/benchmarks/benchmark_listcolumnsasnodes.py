@@ -0,0 +1,147 @@
+"""
+benchmark_listcolumnsasnodes
+----------------------------
+
+Compares converting list column literals into nodes with SPARQL (as it used to be done) against the single pass over
+the triples used by `_update_literals_to_nodes_in_graph_assert_success`.
+
+Run from the `remote/scripts` directory with `python -m benchmarks.benchmark_listcolumnsasnodes`.
+"""
+
+import logging
+from timeit import default_timer
+from typing import Callable
+
+import rdflib
+from rdflib.compare import isomorphic
+from rdflib.namespace import RDF
+from tabulate import tabulate
+
+from mbocsvwscripts.listcolumnsasnodes import (
+    CONVERT_IRI_TO_NODE_DATA_TYPE_URI,
+    CONVERT_MBO_ID_TO_NODE_DATA_TYPE_URI,
+    MBO_URI_PREFIX,
+    _update_literals_to_nodes_in_graph_assert_success,
+)
+
+_NUM_SUBJECTS = [1_000, 4_000, 16_000]
+
+_SCHEMA = rdflib.Namespace("https://schema.org/")
+
+
+def _update_literals_to_nodes_in_graph_sparql(graph: rdflib.Graph) -> rdflib.Graph:
+    """
+    The previous SPARQL implementation of `_update_literals_to_nodes_in_graph_assert_success`, including its count
+    before and after.
+    """
+    count_query = f"""
+        SELECT *
+        WHERE {{
+            ?s ?p ?mboNodePID.
+            FILTER(datatype(?mboNodePID) IN (<{CONVERT_MBO_ID_TO_NODE_DATA_TYPE_URI}>, <{CONVERT_IRI_TO_NODE_DATA_TYPE_URI}>)).
+        }}
+    """
+    assert len(list(graph.query(count_query))) > 0
+    graph.update(
+        f"""
+        DELETE {{
+            ?s ?p ?nodePID.
+        }}
+        INSERT {{
+            ?s ?p ?uriNode.
+        }}
+        WHERE {{
+            {{
+                ?s ?p ?nodePID.
+                FILTER(datatype(?nodePID) = <{CONVERT_MBO_ID_TO_NODE_DATA_TYPE_URI}>).
+                BIND (URI( CONCAT("{MBO_URI_PREFIX}", STR(?nodePID))) as ?uriNode).
+            }} UNION {{
+                ?s ?p ?nodePID.
+                FILTER(datatype(?nodePID) = <{CONVERT_IRI_TO_NODE_DATA_TYPE_URI}>).
+                BIND(URI(STR(?nodePID)) as ?uriNode).
+            }}
+        }}
+    """
+    )
+    assert len(list(graph.query(count_query))) == 0
+    return graph
+
+
+def _generate_bulk_graph(num_subjects: int) -> rdflib.Graph:
+    """
+    Generates a graph shaped like csv2rdf's output where each row has a couple of list column values to convert.
+    """
+    graph = rdflib.Graph()
+    for i in range(num_subjects):
+        subject = rdflib.URIRef(f"{MBO_URI_PREFIX}mbo_dataset_{i}")
+        graph.add((subject, RDF.type, _SCHEMA.Dataset))
+        graph.add((subject, _SCHEMA.name, rdflib.Literal(f"Dataset {i}")))
+        graph.add((subject, _SCHEMA.description, rdflib.Literal(f"Description {i}")))
+        graph.add(
+            (
+                subject,
+                _SCHEMA.isBasedOn,
+                rdflib.Literal(
+                    f"mbo_dataset_{i // 2}",
+                    datatype=CONVERT_MBO_ID_TO_NODE_DATA_TYPE_URI,
+                ),
+            )
+        )
+        graph.add(
+            (
+                subject,
+                _SCHEMA.url,
+                rdflib.Literal(
+                    f"https://example.com/dataset/{i}",
+                    datatype=CONVERT_IRI_TO_NODE_DATA_TYPE_URI,
+                ),
+            )
+        )
+    return graph
+
+
+def _time(
+    function: Callable[[rdflib.Graph], rdflib.Graph], graph: rdflib.Graph
+) -> float:
+    start = default_timer()
+    function(graph)
+    return default_timer() - start
+
+
+def main() -> None:
+    # The SPARQL implementation builds a URI from every literal before filtering them, which rdflib warns about.
+    logging.getLogger("rdflib.term").setLevel(logging.ERROR)
+
+    rows = []
+    for num_subjects in _NUM_SUBJECTS:
+        graph = _generate_bulk_graph(num_subjects)
+        num_triples = len(graph)
+
+        sparql_graph = rdflib.Graph() + graph
+        sparql_seconds = _time(_update_literals_to_nodes_in_graph_sparql, sparql_graph)
+        direct_graph = rdflib.Graph() + graph
+        direct_seconds = _time(
+            _update_literals_to_nodes_in_graph_assert_success, direct_graph
+        )
+        assert isomorphic(sparql_graph, direct_graph)
+
+        rows.append(
+            [
+                num_triples,
+                sparql_seconds,
+                direct_seconds,
+                sparql_seconds / direct_seconds,
+            ]
+        )
+
+    print(
+        tabulate(
+            rows,
+            headers=["Triples", "SPARQL (s)", "Single pass (s)", "Speed-up"],
+            floatfmt=".3f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+benchmark_partition
+-------------------
+
+Times partitioning synthetic bulk graphs of increasing size to show that it scales linearly with the number of triples.
+
+Run from the `remote/scripts` directory with `python -m benchmarks.benchmark_partition`.
+"""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from timeit import default_timer
+
+import rdflib
+from rdflib.namespace import RDF, XSD
+from tabulate import tabulate
+
+from mbocsvwscripts.partition import (
+    _partition_to_individual_files,
+    _partition_triples,
+)
+from mbocsvwscripts.processparametadata import (
+    MBO,
+    SCHEMA,
+    INPUT_METADATA_DATA_TYPE_URI,
+    IS_RESULT_OF_PREDICATE,
+)
+
+_NUM_SUBJECTS = [1_000, 2_000, 4_000, 8_000, 16_000]
+
+
+def _generate_bulk_graph(num_subjects: int) -> rdflib.Graph:
+    """
+    Generates a graph shaped like csv2rdf's output; each row's subject has a hash-URI input-metadata subject.
+    """
+    graph = rdflib.Graph()
+    for i in range(num_subjects):
+        subject = MBO[f"mbo_dataset_{i}"]
+        input_metadata = MBO[f"mbo_dataset_{i}#input-metadata"]
+        graph.add((subject, RDF.type, SCHEMA.Dataset))
+        graph.add((subject, SCHEMA.name, rdflib.Literal(f"Dataset {i}")))
+        graph.add((subject, SCHEMA.description, rdflib.Literal(f"Description {i}")))
+        graph.add((subject, SCHEMA.isBasedOn, MBO[f"mbo_dataset_{i // 2}"]))
+        graph.add((input_metadata, RDF.type, INPUT_METADATA_DATA_TYPE_URI))
+        graph.add((input_metadata, SCHEMA.about, subject))
+        graph.add((input_metadata, IS_RESULT_OF_PREDICATE, MBO.mbo_some_action))
+        graph.add(
+            (
+                input_metadata,
+                SCHEMA.dateCreated,
+                rdflib.Literal("2019-01-01", datatype=XSD.date),
+            )
+        )
+    return graph
+
+
+def main() -> None:
+    rows = []
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        for num_subjects in _NUM_SUBJECTS:
+            graph = _generate_bulk_graph(num_subjects)
+            num_triples = len(graph)
+
+            start = default_timer()
+            _partition_triples(graph)
+            bucketing_seconds = default_timer() - start
+
+            bulk_ttl_file = tmp_dir / f"bulk-{num_subjects}.ttl"
+            graph.serialize(bulk_ttl_file, format="ttl")
+            out_dir = tmp_dir / f"out-{num_subjects}"
+            out_dir.mkdir()
+
+            start = default_timer()
+            _partition_to_individual_files(bulk_ttl_file, out_dir)
+            end_to_end_seconds = default_timer() - start
+
+            rows.append(
+                [
+                    num_subjects,
+                    num_triples,
+                    bucketing_seconds,
+                    1e6 * bucketing_seconds / num_triples,
+                    end_to_end_seconds,
+                    1e6 * end_to_end_seconds / num_triples,
+                ]
+            )
+
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "Partitions",
+                "Triples",
+                "Bucketing (s)",
+                "Bucketing (µs/triple)",
+                "Parse + partition + write (s)",
+                "Parse + partition + write (µs/triple)",
+            ],
+            floatfmt=".3f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+benchmark_processparametadata
+-----------------------------
+
+Compares the per-file cost of extracting the input metadata from a partition file using SPARQL (as it used to be done)
+against the direct triple-pattern lookups used by `_extract_input_metadata_triples_and_remove`.
+
+Run from the `remote/scripts` directory with `python -m benchmarks.benchmark_processparametadata`.
+"""
+
+from pathlib import Path
+from timeit import default_timer
+from typing import Callable, List, Tuple
+
+import rdflib
+from rdflib.compare import isomorphic
+from rdflib.term import Node
+from tabulate import tabulate
+
+from mbocsvwscripts.processparametadata import (
+    INPUT_METADATA_DATA_TYPE_URI,
+    _extract_input_metadata_triples_and_remove,
+)
+
+_PARTITION_FILE = (
+    Path(__file__).parent.parent
+    / "test"
+    / "testcases"
+    / "parametadata"
+    / "mbo_TODO_LICENSE_1.json"
+)
+_NUM_REPETITIONS = 200
+
+
+def _extract_input_metadata_triples_and_remove_sparql(
+    metadata_file: Path,
+) -> Tuple[rdflib.Graph, List[Tuple[Node, Node, Node]]]:
+    """
+    The previous SPARQL implementation of `_extract_input_metadata_triples_and_remove`.
+    """
+    input_graph = rdflib.Graph()
+    input_graph.parse(metadata_file)
+    input_metadata_triples = list(
+        input_graph.query(
+            f"""
+        CONSTRUCT {{
+            ?inputMetadata ?p ?o.
+        }}
+        WHERE {{
+            ?inputMetadata a <{INPUT_METADATA_DATA_TYPE_URI}>;
+                           ?p ?o.
+        }}
+    """
+        )
+    )
+
+    input_graph.update(
+        f"""
+        DELETE 
+        WHERE {{
+            ?inputMetadata a <{INPUT_METADATA_DATA_TYPE_URI}>;
+                           ?p ?o.
+        }}
+    """
+    )
+
+    return input_graph, input_metadata_triples
+
+
+def _parse_only(metadata_file: Path) -> rdflib.Graph:
+    input_graph = rdflib.Graph()
+    input_graph.parse(metadata_file)
+    return input_graph
+
+
+def _time_per_file(function: Callable[[Path], object]) -> float:
+    # Warm up so that one-off costs (e.g. importing rdflib's SPARQL engine) aren't counted.
+    function(_PARTITION_FILE)
+
+    start = default_timer()
+    for _ in range(_NUM_REPETITIONS):
+        function(_PARTITION_FILE)
+    return (default_timer() - start) / _NUM_REPETITIONS
+
+
+def main() -> None:
+    sparql_graph, sparql_triples = _extract_input_metadata_triples_and_remove_sparql(
+        _PARTITION_FILE
+    )
+    direct_graph, direct_triples = _extract_input_metadata_triples_and_remove(
+        _PARTITION_FILE
+    )
+    assert set(sparql_triples) == set(direct_triples)
+    assert isomorphic(sparql_graph, direct_graph)
+
+    parse_seconds = _time_per_file(_parse_only)
+    rows = [
+        [name, 1e3 * seconds, 1e3 * (seconds - parse_seconds)]
+        for name, seconds in [
+            ("Parse only", parse_seconds),
+            (
+                "SPARQL CONSTRUCT + DELETE",
+                _time_per_file(_extract_input_metadata_triples_and_remove_sparql),
+            ),
+            (
+                "Triple-pattern lookups",
+                _time_per_file(_extract_input_metadata_triples_and_remove),
+            ),
+        ]
+    ]
+
+    print(
+        tabulate(
+            rows,
+            headers=["Implementation", "Per file (ms)", "Excluding parse (ms)"],
+            floatfmt=".3f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+benchmark_uritemplates
+----------------------
+
+Compares expanding the `aboutUrl`, `propertyUrl` and `valueUrl` templates of every column defined in `remote/` by
+parsing each template for every cell (as `csvwtordf` used to) against the functions `_compile_column` compiles once per
+table.
+
+Run from the `remote/scripts` directory with `python -m benchmarks.benchmark_uritemplates`.
+"""
+
+import gc
+import re
+from collections import deque
+from pathlib import Path
+from timeit import default_timer
+from typing import Callable, Dict, Iterator, List
+from urllib.parse import quote
+
+from tabulate import tabulate
+
+from mbocsvwscripts.csvwtordf import (
+    TableDefinition,
+    _compile_column,
+    _expand_curie,
+    _read_csvw_metadata,
+    _resolve_url,
+)
+from mbocsvwscripts.uritemplates import CellValue
+
+_NUM_ROWS = [1_000, 4_000, 16_000]
+
+_REMOTE_DIR = Path(__file__).parent.parent.parent
+
+_URI_TEMPLATE_EXPRESSION = re.compile(r"\{([^{}]*)\}")
+_PERCENT_ENCODED_TRIPLET = re.compile(r"%[0-9A-Fa-f]{2}")
+_URI_TEMPLATE_RESERVED_CHARACTERS = ":/?#[]@!$&'()*+,;="
+
+
+def _expand_uri_template_per_cell(template: str, values: Dict[str, CellValue]) -> str:
+    """
+    The previous implementation, which parses the template on every call.
+    """
+
+    def _expand_expression(match: re.Match) -> str:
+        expression = match.group(1)
+        operator = expression[:1]
+        if operator in ("+", "#"):
+            expression = expression[1:]
+
+        expanded_values = []
+        for variable_name in expression.split(","):
+            value = values.get(variable_name)
+            if value is None or value == []:
+                continue
+            items = value if isinstance(value, list) else [value]
+            expanded_values.append(
+                ",".join(
+                    _pct_encode(item, reserved_allowed=operator in ("+", "#"))
+                    for item in items
+                )
+            )
+
+        if not any(expanded_values):
+            return ""
+
+        return ("#" if operator == "#" else "") + ",".join(expanded_values)
+
+    return _URI_TEMPLATE_EXPRESSION.sub(_expand_expression, template)
+
+
+def _pct_encode(value: str, reserved_allowed: bool) -> str:
+    if not reserved_allowed:
+        return quote(value, safe="")
+
+    parts = _PERCENT_ENCODED_TRIPLET.split(value)
+    triplets = _PERCENT_ENCODED_TRIPLET.findall(value)
+    encoded = quote(parts[0], safe=_URI_TEMPLATE_RESERVED_CHARACTERS)
+    for triplet, part in zip(triplets, parts[1:]):
+        encoded += triplet + quote(part, safe=_URI_TEMPLATE_RESERVED_CHARACTERS)
+
+    return encoded
+
+
+def _expand_table_per_cell(
+    table: TableDefinition, rows: List[Dict[str, CellValue]]
+) -> Iterator[str]:
+    for values in rows:
+        for column_number, column in enumerate(table.columns, start=1):
+            if column.suppress_output:
+                continue
+            cell_values = {
+                **values,
+                "_column": str(column_number),
+                "_name": column.name,
+            }
+            for template in (column.about_url, column.property_url, column.value_url):
+                if template is not None:
+                    url = _expand_uri_template_per_cell(template, cell_values)
+                    yield f"<{_resolve_url(table.url, _expand_curie(url))}>"
+
+
+def _expand_table_compiled(
+    table: TableDefinition, rows: List[Dict[str, CellValue]]
+) -> Iterator[str]:
+    compiled_columns = [
+        _compile_column(column, column_number, table.url)
+        for column_number, column in enumerate(table.columns, start=1)
+        if not column.suppress_output
+    ]
+    # `_get_n_triples_for_row` never expands the default propertyUrl for the columns without one, so nor does this.
+    expanders_for_column = [
+        (
+            compiled_column.column_variables,
+            [
+                expand
+                for template, expand in (
+                    (compiled_column.definition.about_url, compiled_column.subject),
+                    (
+                        compiled_column.definition.property_url,
+                        compiled_column.predicate,
+                    ),
+                    (compiled_column.definition.value_url, compiled_column.object),
+                )
+                if template is not None
+            ],
+        )
+        for compiled_column in compiled_columns
+    ]
+
+    for values in rows:
+        for column_variables, expanders in expanders_for_column:
+            cell_values = (
+                values if column_variables is None else {**values, **column_variables}
+            )
+            for expand in expanders:
+                yield expand(cell_values)
+
+
+def _generate_rows(table: TableDefinition, num_rows: int) -> List[Dict[str, CellValue]]:
+    """
+    Generates rows of mPID-like values, with every list column holding two values.
+    """
+    return [
+        {
+            "_row": str(row_number),
+            "_sourceRow": str(row_number + 1),
+            **{
+                column.name: (
+                    [
+                        f"mbo_{column.name}_{row_number}",
+                        f"mbo_{column.name}_{row_number + 1}",
+                    ]
+                    if column.separator is not None
+                    else f"mbo_{column.name}_{row_number}"
+                )
+                for column in table.columns
+                if not column.virtual
+            },
+        }
+        for row_number in range(1, num_rows + 1)
+    ]
+
+
+def _time(
+    function: Callable[[TableDefinition, List[Dict[str, CellValue]]], Iterator[str]],
+    tables: List[TableDefinition],
+    rows_for_table: List[List[Dict[str, CellValue]]],
+) -> float:
+    # As with `timeit`, the garbage collector is disabled so that it doesn't repeatedly scan the generated rows.
+    gc.disable()
+    try:
+        start = default_timer()
+        for table, rows in zip(tables, rows_for_table):
+            deque(function(table, rows), maxlen=0)
+        return default_timer() - start
+    finally:
+        gc.enable()
+
+
+def main() -> None:
+    tables = [
+        table
+        for metadata_file in sorted(_REMOTE_DIR.glob("*.csv-metadata.json"))
+        for table in _read_csvw_metadata(metadata_file, "file:/work/remote/")
+        if not table.suppress_output
+    ]
+
+    rows = []
+    for num_rows in _NUM_ROWS:
+        rows_for_table = [_generate_rows(table, num_rows) for table in tables]
+        num_cells = sum(
+            len(table_rows)
+            * sum(1 for column in table.columns if not column.suppress_output)
+            for table_rows, table in zip(rows_for_table, tables)
+        )
+
+        for table, table_rows in zip(tables, rows_for_table):
+            assert list(_expand_table_per_cell(table, table_rows[:100])) == list(
+                _expand_table_compiled(table, table_rows[:100])
+            )
+
+        per_cell_seconds = _time(_expand_table_per_cell, tables, rows_for_table)
+        compiled_seconds = _time(_expand_table_compiled, tables, rows_for_table)
+
+        rows.append(
+            [
+                num_cells,
+                num_cells / per_cell_seconds / 1e6,
+                num_cells / compiled_seconds / 1e6,
+                per_cell_seconds / compiled_seconds,
+            ]
+        )
+
+    print(
+        f"Expanding the URI templates of the {len(tables)} tables defined in {_REMOTE_DIR.resolve()}, "
+        f"with the same number of rows in each table.\n"
+    )
+    print(
+        tabulate(
+            rows,
+            headers=[
+                "Cells",
+                "Parsed per cell (M cells/s)",
+                "Compiled (M cells/s)",
+                "Speed-up",
+            ],
+            floatfmt=".3f",
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
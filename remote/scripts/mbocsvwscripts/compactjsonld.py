@@ -0,0 +1,362 @@
+"""
+compactjsonld
+-------------
+
+Compacts raw JSON-LD documents against the schema.org JSON-LD context so that they read as tidy schema.org JSON-LD.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from dataclasses import dataclass
+from importlib.metadata import version
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO, Tuple
+
+import click
+from pyld import jsonld
+from pyld.context_resolver import ContextResolver
+from pyld.jsonld import JsonLdProcessor
+
+SCHEMA_ORG_OUTPUT_CONTEXT: Dict[str, str] = {
+    "@import": "https://schema.org/",
+    "schema": "https://schema.org/",
+}
+"""
+The context written into each compacted document. It makes use of the schema.org context, but tells it to use https
+URIs instead of http.
+"""
+
+_CONTEXT_CACHE_FORMAT_VERSION: int = 1
+"""
+Bump this whenever the structure of the context cache file changes.
+"""
+
+_PYLD_INTERNALS: List[Tuple[Any, str]] = [
+    (JsonLdProcessor, "_compact"),
+    (JsonLdProcessor, "_compact_iri"),
+    (JsonLdProcessor, "_get_initial_context"),
+    (JsonLdProcessor, "_get_inverse_context"),
+    (jsonld, "_inverse_context_cache"),
+]
+"""
+Processing the context once and reusing it relies upon these pyld internals. Where a pyld release doesn't have them,
+each document is compacted with the public `jsonld.compact` instead.
+"""
+
+
+@dataclass
+class CompactionContext:
+    processor: JsonLdProcessor
+    active_context: Optional[Dict[str, Any]]
+    """
+    The schema.org context as processed by pyld, ready to compact documents against. `None` where pyld's internals
+    aren't available.
+    """
+    options: Dict[str, Any]
+    context: Any = None
+    """
+    The unprocessed schema.org context, which is passed to `jsonld.compact` where pyld's internals aren't available.
+    """
+
+
+@click.command("compact")
+@click.option(
+    "-c",
+    "--context",
+    "context_file",
+    required=True,
+    type=click.Path(exists=True),
+    help="The schema.org JSON-LD context file to compact against.",
+)
+@click.option(
+    "--context-cache",
+    required=False,
+    type=click.Path(),
+    help="Where to cache the processed CONTEXT_FILE. Defaults to a `.pickle` file alongside CONTEXT_FILE.",
+)
+@click.option(
+    "-o", "--out", required=False, type=click.Path(), show_default=True, default="."
+)
+@click.option(
+    "-f",
+    "--file-list",
+    required=False,
+    type=click.File("r"),
+    help="A file listing further (whitespace separated) RAW_JSON_LD_FILES to compact. Use `-` to read from stdin.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Compact every file, even those whose output is newer than its input.",
+)
+@click.argument("raw_json_ld_files", nargs=-1, type=click.Path(exists=True))
+def main(
+    context_file: click.Path,
+    context_cache: Optional[click.Path],
+    out: click.Path,
+    file_list: Optional[TextIO],
+    force: bool,
+    raw_json_ld_files: List[click.Path],
+) -> None:
+    """
+    Compacts each of the RAW_JSON_LD_FILES against the schema.org JSON-LD CONTEXT_FILE, writing the result to a file of
+    the same name in the OUT directory.
+
+    1. All https://schema.org/ URIs are changed to http://schema.org/ in preparation for compaction against the
+        schema.org JSON-LD context (which uses exclusively http://schema.org URIs).
+    2. The document is compacted against the schema.org JSON-LD context so we can have things like
+        `"@type": "Dataset"` instead of `"@type": "https://schema.org/Dataset"`.
+    3. The context is then set to make use of the schema.org context, but tells it to use https URIs instead of http.
+
+    The CONTEXT_FILE is only processed once for the whole batch, and the result is cached in CONTEXT_CACHE for
+    subsequent runs. Files whose output is already newer than the input are skipped.
+    """
+    input_files = [Path(str(f)) for f in raw_json_ld_files]
+    if file_list is not None:
+        input_files += [Path(f) for f in file_list.read().split()]
+
+    context_file_path = Path(str(context_file))
+    context_cache_file = (
+        context_file_path.with_suffix(".pickle")
+        if context_cache is None
+        else Path(str(context_cache))
+    )
+
+    out_folder = Path(str(out))
+    compacted_files = _compact_json_ld_files(
+        {input_file: out_folder / input_file.name for input_file in input_files},
+        context_file_path,
+        force,
+        context_cache_file,
+    )
+
+    print(f"Compacted {len(compacted_files)} of {len(input_files)} JSON-LD file(s).")
+
+
+def _compact_json_ld_files(
+    files_out: Dict[Path, Path],
+    context_file: Path,
+    force: bool = False,
+    context_cache_file: Optional[Path] = None,
+) -> List[Path]:
+    """
+    Compacts each of the keys of `files_out` into the corresponding output file.
+
+    Returns the output files which were written.
+    """
+    files_to_compact = {
+        input_file: output_file
+        for input_file, output_file in files_out.items()
+        if force or not _is_up_to_date(input_file, output_file)
+    }
+    if not any(files_to_compact):
+        return []
+
+    compaction_context = _load_compaction_context(context_file, context_cache_file)
+
+    for input_file, output_file in files_to_compact.items():
+        try:
+            compacted_document = _compact_json_ld(
+                _read_raw_json_ld(input_file), compaction_context
+            )
+        except Exception as e:
+            raise Exception(f"Failed to compact {input_file}") from e
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_file, "w") as f:
+            json.dump(compacted_document, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+    return list(files_to_compact.values())
+
+
+def _is_up_to_date(input_file: Path, output_file: Path) -> bool:
+    return (
+        output_file.exists()
+        and output_file.stat().st_mtime_ns >= input_file.stat().st_mtime_ns
+    )
+
+
+def _read_raw_json_ld(raw_json_ld_file: Path) -> Any:
+    with open(raw_json_ld_file, "r") as f:
+        raw_json_ld = f.read()
+
+    # The schema.org JSON-LD context exclusively uses http://schema.org/ URIs.
+    return json.loads(raw_json_ld.replace("https://schema.org/", "http://schema.org/"))
+
+
+def _load_compaction_context(
+    context_file: Path, context_cache_file: Optional[Path] = None
+) -> CompactionContext:
+    """
+    Processes the JSON-LD `context_file` ready for compaction.
+
+    Where a `context_cache_file` is given, the processed context is loaded from it if it was generated from the same
+    `context_file` contents (by the same versions of this cache format and of pyld). Otherwise the cache is
+    (re)written.
+    """
+    processor = JsonLdProcessor()
+    options = _get_compaction_options()
+
+    if not _are_pyld_internals_available():
+        with open(context_file, "r") as f:
+            return CompactionContext(
+                processor=processor,
+                active_context=None,
+                options=options,
+                context=json.load(f),
+            )
+
+    cache_key = None
+    if context_cache_file is not None:
+        cache_key = _get_context_cache_key(context_file)
+        cached_context = _read_context_cache(context_cache_file, cache_key)
+        if cached_context is not None:
+            active_context, inverse_context = cached_context
+            # Seed pyld's inverse context cache so that it isn't rebuilt on the first compaction.
+            jsonld._inverse_context_cache[active_context["_uuid"]] = inverse_context
+            return CompactionContext(
+                processor=processor, active_context=active_context, options=options
+            )
+
+    with open(context_file, "r") as f:
+        context = json.load(f)
+
+    active_context = processor.process_context(
+        processor._get_initial_context(options), context, options
+    )
+
+    if context_cache_file is not None and cache_key is not None:
+        _write_context_cache(
+            context_cache_file,
+            cache_key,
+            active_context,
+            processor._get_inverse_context(active_context),
+        )
+
+    return CompactionContext(
+        processor=processor, active_context=active_context, options=options
+    )
+
+
+def _get_context_cache_key(context_file: Path) -> Dict[str, Any]:
+    with open(context_file, "rb") as f:
+        context_file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+
+    return {
+        "contextFileSha256": context_file_hash,
+        "formatVersion": _CONTEXT_CACHE_FORMAT_VERSION,
+        "pyldVersion": version("PyLD"),
+    }
+
+
+def _read_context_cache(
+    context_cache_file: Path, cache_key: Dict[str, Any]
+) -> Optional[Tuple[Any, Any]]:
+    """
+    Returns the active and inverse contexts recorded in the cache, or `None` where the cache is missing, unreadable or
+    was generated under a different `cache_key`.
+    """
+    if not context_cache_file.exists():
+        return None
+
+    try:
+        with open(context_cache_file, "rb") as f:
+            cache = pickle.load(f)
+    except Exception:
+        return None
+
+    if not isinstance(cache, dict) or cache.get("key") != cache_key:
+        return None
+
+    return cache["activeContext"], cache["inverseContext"]
+
+
+def _write_context_cache(
+    context_cache_file: Path,
+    cache_key: Dict[str, Any],
+    active_context: Any,
+    inverse_context: Any,
+) -> None:
+    cache = {
+        "key": cache_key,
+        "activeContext": active_context,
+        "inverseContext": inverse_context,
+    }
+
+    # Write to a temporary file first so that concurrent runs never see a half-written cache.
+    context_cache_file.parent.mkdir(parents=True, exist_ok=True)
+    temp_file = context_cache_file.with_name(
+        f"{context_cache_file.name}.{os.getpid()}.tmp"
+    )
+    with open(temp_file, "wb") as f:
+        pickle.dump(cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+    temp_file.replace(context_cache_file)
+
+
+def _get_compaction_options() -> Dict[str, Any]:
+    """
+    The options `jsonld.compact` would use by default.
+    """
+    options: Dict[str, Any] = {
+        "base": "",
+        "compactArrays": True,
+        "graph": False,
+        "skipExpansion": False,
+        "activeCtx": False,
+        "documentLoader": jsonld.get_document_loader(),
+        "extractAllScripts": False,
+        "processingMode": "json-ld-1.1",
+        "link": False,
+    }
+    options["contextResolver"] = ContextResolver({}, options["documentLoader"])
+    return options
+
+
+def _are_pyld_internals_available() -> bool:
+    return all(hasattr(owner, name) for owner, name in _PYLD_INTERNALS)
+
+
+def _compact_json_ld(document: Any, compaction_context: CompactionContext) -> Any:
+    """
+    Equivalent to `jsonld.compact(document, context)` followed by replacing the `@context` with
+    `SCHEMA_ORG_OUTPUT_CONTEXT`, except that the context has already been processed (where pyld's internals allow).
+    """
+    if compaction_context.active_context is None:
+        compacted = jsonld.compact(document, compaction_context.context)
+    else:
+        processor = compaction_context.processor
+        options = compaction_context.options
+
+        expanded = processor.expand(document, options)
+        compacted = processor._compact(
+            compaction_context.active_context, None, expanded, options
+        )
+        if isinstance(compacted, list) and len(compacted) > 1:
+            graph_keyword = processor._compact_iri(
+                compaction_context.active_context, "@graph"
+            )
+            compacted = {graph_keyword: compacted}
+
+    # A single node is unwrapped, and several nodes (which only `jsonld.compact` leaves in a list) go in an `@graph`.
+    if isinstance(compacted, list):
+        if len(compacted) == 1:
+            compacted = compacted[0]
+        elif len(compacted) == 0:
+            compacted = {}
+        else:
+            compacted = {"@graph": compacted}
+    elif compacted is None:
+        compacted = {}
+
+    # `@context` comes first.
+    return {"@context": SCHEMA_ORG_OUTPUT_CONTEXT} | {
+        key: value for key, value in compacted.items() if key != "@context"
+    }
+
+
+if __name__ == "__main__":
+    main()
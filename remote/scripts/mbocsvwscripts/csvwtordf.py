@@ -0,0 +1,500 @@
+"""
+csvwtordf
+---------
+
+Converts CSV-W into N-Triples within this process, rather than starting csv2rdf's JVM in a new container for each file.
+
+Only the subset of CSV-W which `generatecsvwdefinitions` emits is supported: `aboutUrl`, `propertyUrl` and `valueUrl`
+URI templates, `separator`, `virtual` columns, `suppressOutput` and `datatype`. The triples are those which csv2rdf
+outputs in its minimal mode. Tables aren't validated, that is left to csvw-check.
+
+Literals keep the lexical form their cell has in the CSV file. Unlike csv2rdf, numeric and boolean values aren't
+canonicalised (e.g. an `int` column's `01` isn't written as `1`), so the output only matches csv2rdf's where the data
+is already written canonically.
+"""
+
+import csv
+import json
+import re
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TextIO,
+    Union,
+)
+from urllib.parse import quote, urljoin
+
+import click
+
+from mbocsvwscripts.listcolumnsasnodes import _replace_atomically
+from mbocsvwscripts.uritemplates import CellValue, compile_uri_template
+
+_XSD_PREFIX = "http://www.w3.org/2001/XMLSchema#"
+_XSD_STRING = f"{_XSD_PREFIX}string"
+
+_CSVW_PREFIXES: Dict[str, str] = {
+    "csvw": "http://www.w3.org/ns/csvw#",
+    "dc": "http://purl.org/dc/terms/",
+    "dcat": "http://www.w3.org/ns/dcat#",
+    "foaf": "http://xmlns.com/foaf/0.1/",
+    "owl": "http://www.w3.org/2002/07/owl#",
+    "rdf": "http://www.w3.org/1999/02/22-rdf-syntax-ns#",
+    "rdfs": "http://www.w3.org/2000/01/rdf-schema#",
+    "schema": "http://schema.org/",
+    "skos": "http://www.w3.org/2004/02/skos/core#",
+    "xsd": _XSD_PREFIX,
+}
+"""
+The prefixes from the CSV-W initial context which CURIEs such as `rdf:type` may use.
+"""
+
+_CSVW_BASE_DATA_TYPES: Dict[str, str] = {
+    "string": _XSD_STRING,
+    "anyURI": f"{_XSD_PREFIX}anyURI",
+    "boolean": f"{_XSD_PREFIX}boolean",
+    "date": f"{_XSD_PREFIX}date",
+    "datetime": f"{_XSD_PREFIX}dateTime",
+    "dateTime": f"{_XSD_PREFIX}dateTime",
+    "decimal": f"{_XSD_PREFIX}decimal",
+    "double": f"{_XSD_PREFIX}double",
+    "float": f"{_XSD_PREFIX}float",
+    "int": f"{_XSD_PREFIX}int",
+    "integer": f"{_XSD_PREFIX}integer",
+    "long": f"{_XSD_PREFIX}long",
+    "time": f"{_XSD_PREFIX}time",
+}
+
+_INHERITED_PROPERTIES = ("aboutUrl", "propertyUrl", "valueUrl", "separator", "datatype")
+"""
+The inherited properties which are used here. A column takes them from its table schema unless it sets them itself.
+"""
+
+_COLUMN_TEMPLATE_VARIABLES = frozenset({"_column", "_name"})
+_ABSOLUTE_URL_PREFIX = re.compile(r"^[A-Za-z][A-Za-z0-9+.-]*:")
+_URI_TEMPLATE_BRACES = re.compile(r"[{}]")
+_N_TRIPLES_STRING_ESCAPES = str.maketrans(
+    {"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"}
+)
+
+
+@dataclass
+class ColumnDefinition:
+    name: str
+    titles: List[str]
+    about_url: Optional[str]
+    property_url: Optional[str]
+    value_url: Optional[str]
+    separator: Optional[str]
+    data_type_iri: str
+    suppress_output: bool
+    virtual: bool
+
+
+@dataclass
+class TableDefinition:
+    csv_path: Path
+    url: str
+    """
+    The URL relative URLs in the table are resolved against.
+    """
+    columns: List[ColumnDefinition]
+    suppress_output: bool
+
+
+@dataclass
+class CompiledColumn:
+    """
+    A column whose URI templates have been compiled, once per table, into functions of a row's values which return
+    the N-Triples term for the resolved URL.
+    """
+
+    definition: ColumnDefinition
+    column_variables: Optional[Dict[str, str]]
+    """
+    The `_column` and `_name` template variables, where the column's templates refer to them.
+    """
+    subject: Optional[Callable[[Mapping[str, CellValue]], str]]
+    """
+    None where the subject is the row's blank node.
+    """
+    predicate: Callable[[Mapping[str, CellValue]], str]
+    object: Optional[Callable[[Mapping[str, CellValue]], str]]
+    """
+    None where the object is the cell's literal value(s).
+    """
+
+
+@click.command()
+@click.argument("METADATA_FILE", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-o",
+    "--out",
+    type=click.Path(dir_okay=False),
+    required=True,
+    help="The N-Triples file to write.",
+)
+@click.option(
+    "--base-url",
+    type=str,
+    default=None,
+    help="The URL to treat the METADATA_FILE as being located at, e.g. `file:/work/remote/`. Relative URLs are "
+    "resolved against it. Defaults to the METADATA_FILE's own file URL.",
+)
+def main(metadata_file: click.Path, out: click.Path, base_url: Optional[str]) -> None:
+    """
+    Converts the tables in the CSV-W METADATA_FILE whose output isn't suppressed into N-Triples.
+
+    The output is written to a temporary file which replaces OUT once the conversion has completed.
+    """
+    _convert_csvw_to_n_triples_file(Path(str(metadata_file)), Path(str(out)), base_url)
+
+
+def _convert_csvw_to_n_triples_file(
+    metadata_file: Path, n_triples_file: Path, base_url: Optional[str] = None
+) -> None:
+    tables = _read_csvw_metadata(metadata_file, base_url)
+
+    n_triples_file = n_triples_file.resolve()
+    with _replace_atomically(n_triples_file) as temp_file:
+        with open(temp_file, "w", encoding="utf-8") as f_out:
+            for table_number, table in enumerate(tables, start=1):
+                if not table.suppress_output:
+                    _write_table_as_n_triples(table, table_number, f_out)
+
+
+def _read_csvw_metadata(
+    metadata_file: Path, base_url: Optional[str] = None
+) -> List[TableDefinition]:
+    metadata_file = metadata_file.resolve()
+    metadata_url = (
+        _resolve_url(base_url, metadata_file.name)
+        if base_url is not None
+        else metadata_file.as_uri()
+    )
+
+    with open(metadata_file, "r", encoding="utf-8") as f:
+        metadata = json.load(f)
+
+    tables = metadata["tables"] if "tables" in metadata else [metadata]
+    return [
+        _read_table_definition(table, metadata_file.parent, metadata_url)
+        for table in tables
+    ]
+
+
+def _read_table_definition(
+    table: Dict[str, Any], metadata_dir: Path, metadata_url: str
+) -> TableDefinition:
+    table_schema = table.get("tableSchema", {})
+    if isinstance(table_schema, str):
+        with open(metadata_dir / table_schema, "r", encoding="utf-8") as f:
+            table_schema = json.load(f)
+
+    inherited_from_table = {
+        key: table[key] for key in _INHERITED_PROPERTIES if key in table
+    }
+    inherited_from_schema = {
+        **inherited_from_table,
+        **{
+            key: table_schema[key]
+            for key in _INHERITED_PROPERTIES
+            if key in table_schema
+        },
+    }
+
+    return TableDefinition(
+        csv_path=metadata_dir / table["url"],
+        url=_resolve_url(metadata_url, table["url"]),
+        columns=[
+            _read_column_definition(column, column_number, inherited_from_schema)
+            for column_number, column in enumerate(
+                table_schema.get("columns", []), start=1
+            )
+        ],
+        suppress_output=table.get("suppressOutput", False),
+    )
+
+
+def _read_column_definition(
+    column: Dict[str, Any], column_number: int, inherited: Dict[str, Any]
+) -> ColumnDefinition:
+    properties = {**inherited, **column}
+
+    titles = column.get("titles", [])
+    if isinstance(titles, str):
+        titles = [titles]
+    elif isinstance(titles, dict):
+        titles = [
+            title
+            for language_titles in titles.values()
+            for title in (
+                [language_titles]
+                if isinstance(language_titles, str)
+                else language_titles
+            )
+        ]
+
+    if (
+        properties.get("separator") is not None
+        and properties.get("valueUrl") is not None
+    ):
+        raise Exception(
+            f"Column '{column.get('name', column_number)}' has both a separator and a valueUrl, which is not supported."
+        )
+
+    return ColumnDefinition(
+        name=column.get("name", f"_col.{column_number}"),
+        titles=titles,
+        about_url=properties.get("aboutUrl"),
+        property_url=properties.get("propertyUrl"),
+        value_url=properties.get("valueUrl"),
+        separator=properties.get("separator"),
+        data_type_iri=_get_data_type_iri(properties.get("datatype", "string")),
+        suppress_output=column.get("suppressOutput", False),
+        virtual=column.get("virtual", False),
+    )
+
+
+def _get_data_type_iri(data_type: Union[str, Dict[str, Any]]) -> str:
+    """
+    A derived data type is identified by its `@id` where it has one, otherwise by its base data type's XSD IRI.
+    """
+    if isinstance(data_type, dict):
+        if "@id" in data_type:
+            return _expand_curie(data_type["@id"])
+        data_type = data_type.get("base", "string")
+
+    if data_type in _CSVW_BASE_DATA_TYPES:
+        return _CSVW_BASE_DATA_TYPES[data_type]
+
+    raise Exception(f"Unsupported datatype '{data_type}'.")
+
+
+def _write_table_as_n_triples(
+    table: TableDefinition, table_number: int, f_out: TextIO
+) -> None:
+    column_count = sum(1 for column in table.columns if not column.virtual)
+    compiled_columns = [
+        _compile_column(column, column_number, table.url)
+        for column_number, column in enumerate(table.columns, start=1)
+        if not column.suppress_output
+    ]
+
+    with open(table.csv_path, "r", encoding="utf-8-sig", newline="") as f_in:
+        reader = csv.reader(f_in)
+        header = next(reader, None)
+        if header is None:
+            return
+        _assert_header_matches_columns(table, header)
+
+        for row_number, row in enumerate(reader, start=1):
+            f_out.writelines(
+                _get_n_triples_for_row(
+                    table,
+                    compiled_columns,
+                    table_number,
+                    row_number,
+                    reader.line_num,
+                    row[:column_count],
+                )
+            )
+
+
+def _assert_header_matches_columns(table: TableDefinition, header: List[str]) -> None:
+    non_virtual_columns = [column for column in table.columns if not column.virtual]
+    if len(header) != len(non_virtual_columns):
+        raise Exception(
+            f"{table.csv_path} has {len(header)} columns but its table schema defines {len(non_virtual_columns)}."
+        )
+
+    for column, title in zip(non_virtual_columns, header):
+        if any(column.titles) and title.strip() not in column.titles:
+            raise Exception(
+                f"{table.csv_path} has a column titled '{title}' where '{column.name}' was expected."
+            )
+
+
+def _get_n_triples_for_row(
+    table: TableDefinition,
+    compiled_columns: List[CompiledColumn],
+    table_number: int,
+    row_number: int,
+    source_row_number: int,
+    row: List[str],
+) -> Iterator[str]:
+    values: Dict[str, CellValue] = {
+        "_row": str(row_number),
+        "_sourceRow": str(source_row_number),
+    }
+    for column, cell in zip(table.columns, row):
+        values[column.name] = _parse_cell(cell, column.separator)
+
+    row_node = f"_:t{table_number}r{row_number}"
+    # Most columns share one of only a few subjects, so each is only expanded once per row.
+    subjects: Dict[Callable[[Mapping[str, CellValue]], str], str] = {}
+    # A row can express the same triple more than once, e.g. when a value is repeated in a list.
+    row_triples: Dict[str, None] = {}
+    for compiled_column in compiled_columns:
+        column = compiled_column.definition
+        value = values.get(column.name)
+        if value is None and (compiled_column.object is None or not column.virtual):
+            continue
+
+        if compiled_column.column_variables is None:
+            cell_values = values
+        else:
+            cell_values = {**values, **compiled_column.column_variables}
+
+        if compiled_column.subject is None:
+            subject = row_node
+        elif compiled_column.column_variables is None:
+            subject = subjects.get(compiled_column.subject)
+            if subject is None:
+                subject = subjects[compiled_column.subject] = compiled_column.subject(
+                    values
+                )
+        else:
+            subject = compiled_column.subject(cell_values)
+        predicate = compiled_column.predicate(cell_values)
+
+        if compiled_column.object is not None:
+            objects = [compiled_column.object(cell_values)]
+        elif isinstance(value, str):
+            objects = [_format_literal(value, column.data_type_iri)]
+        else:
+            # A list, since a null value only gets this far for virtual columns, which have a `valueUrl`.
+            objects = [_format_literal(v, column.data_type_iri) for v in value or []]
+
+        for obj in objects:
+            row_triples[f"{subject} {predicate} {obj} .\n"] = None
+
+    yield from row_triples
+
+
+def _parse_cell(cell: str, separator: Optional[str]) -> CellValue:
+    """
+    Cells are trimmed, and empty cells (or list items) are null.
+    """
+    cell = cell.strip()
+    if cell == "":
+        return None
+
+    if separator is None:
+        return cell
+
+    values = [value.strip() for value in cell.split(separator)]
+    return [value for value in values if value != ""]
+
+
+def _format_literal(value: str, data_type_iri: str) -> str:
+    escaped = value.translate(_N_TRIPLES_STRING_ESCAPES)
+    if data_type_iri == _XSD_STRING:
+        return f'"{escaped}"'
+
+    return f'"{escaped}"^^<{data_type_iri}>'
+
+
+def _compile_column(
+    column: ColumnDefinition, column_number: int, table_url: str
+) -> CompiledColumn:
+    templates = [
+        template
+        for template in (column.about_url, column.property_url, column.value_url)
+        if template is not None
+    ]
+    refers_to_column_variables = any(
+        not compile_uri_template(template).variable_names.isdisjoint(
+            _COLUMN_TEMPLATE_VARIABLES
+        )
+        for template in templates
+    )
+
+    return CompiledColumn(
+        definition=column,
+        column_variables=(
+            {"_column": str(column_number), "_name": column.name}
+            if refers_to_column_variables
+            else None
+        ),
+        subject=(
+            _compile_url_term(column.about_url, table_url)
+            if column.about_url is not None
+            else None
+        ),
+        predicate=(
+            _compile_url_term(column.property_url, table_url)
+            if column.property_url is not None
+            else _compile_url_term(f"#{quote(column.name, safe='')}", table_url)
+        ),
+        object=(
+            _compile_url_term(column.value_url, table_url)
+            if column.value_url is not None
+            else None
+        ),
+    )
+
+
+def _compile_url_term(
+    template: str, table_url: str
+) -> Callable[[Mapping[str, CellValue]], str]:
+    """
+    Returns a function which expands the URI template, expands the CURIE that may give and resolves the result against
+    the table's URL, returning it as an N-Triples IRI term.
+
+    Whatever can be told from the template's literal prefix is worked out here, so the common templates such as
+    `https://w3id.org/marco-bolo/{+id}` just need their expressions expanded.
+    """
+    compiled_template = compile_uri_template(template)
+    expand = compiled_template.expand
+    prefix = compiled_template.literal_prefix
+
+    if compiled_template.is_constant:
+        term = f"<{_resolve_url(table_url, _expand_curie(template))}>"
+        return lambda values: term
+
+    # Where the URL needs no further processing, the term's angle brackets are compiled into the template as literals.
+    document_url = table_url.partition("#")[0]
+    if prefix.startswith("#") and not _URI_TEMPLATE_BRACES.search(document_url):
+        # A fragment identifier resolves to the table's URL with its fragment replaced.
+        return compile_uri_template(f"<{document_url}{template}>").expand
+
+    if _ABSOLUTE_URL_PREFIX.match(prefix):
+        scheme, _, rest = prefix.partition(":")
+        if scheme not in _CSVW_PREFIXES or rest.startswith("//"):
+            return compile_uri_template(f"<{template}>").expand
+
+    return lambda values: f"<{_resolve_url(table_url, _expand_curie(expand(values)))}>"
+
+
+def _expand_curie(uri_or_curie: str) -> str:
+    prefix, _, local_name = uri_or_curie.partition(":")
+    if prefix in _CSVW_PREFIXES and not local_name.startswith("//"):
+        return _CSVW_PREFIXES[prefix] + local_name
+
+    return uri_or_curie
+
+
+def _resolve_url(base_url: str, url: str) -> str:
+    """
+    Java (and so csv2rdf) writes file URLs as `file:/path`, where python would normalise them to `file:///path`. The
+    base URL's form is kept.
+    """
+    if _ABSOLUTE_URL_PREFIX.match(url):
+        return url
+
+    resolved = urljoin(base_url, url)
+    if base_url.startswith("file:/") and not base_url.startswith("file://"):
+        resolved = re.sub("^file:///", "file:/", resolved)
+
+    return resolved
+
+
+if __name__ == "__main__":
+    main()
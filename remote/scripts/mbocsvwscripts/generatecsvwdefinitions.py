@@ -4,23 +4,26 @@ generatecsvwdefinitions
 
 Generate csv-w defintions from the linkml.
 
-N.B. There are no unit tests for this since it is designed to save development time and hence be run by a developer.
+N.B. There are few unit tests for this since it is designed to save development time and hence be run by a developer.
 """
 
 import csv
+import hashlib
 import json
 import os
 import re
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set
 from textwrap import dedent, indent
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from urllib.parse import urljoin
 from os import linesep
+from importlib.metadata import version
 
 import click
 import pandas as pd
 import rdflib
+import yaml
 from linkml_runtime.linkml_model import SchemaDefinition
 from linkml_runtime.utils.metamodelcore import URIorCURIE
 from linkml_runtime.utils.schemaview import (
@@ -34,6 +37,8 @@ from rdflib import URIRef
 from rdflib.namespace import XSD
 from tabulate import tabulate
 
+from mbocsvwscripts.parallel import run_tasks
+
 _PARA_METADATA_SLOT_NAMES = {"metadataPublisherId", "metadataDescribedForActionId"}
 """
 The set of slot names which identify the slot as contributing to the para-metadata document (which ends up stored separately)
@@ -54,6 +59,11 @@ _UNIONED_IDENTIFIERS_SCHEMA_FILE_NAME = "unioned-identifiers.schema.json"
 The schema file for the unioned identifiers table structure.
 """
 
+_GENERATION_CACHE_FILE_PATH: str = "out/generatecsvwdefinitions-cache.json"
+"""
+Where the hashes of the inputs and outputs of the last run are stored, relative to the output directory.
+"""
+
 _SEPARATOR_CHAR: str = "|"
 _SCHEMA_ORG_PREFIX = "https://schema.org/"
 _MBO_PREFIX = "https://w3id.org/marco-bolo/"
@@ -73,6 +83,10 @@ _TABLE_FORMAT: str = "pipe"
 _NON_TITLE_CHARS = re.compile("\\W+")
 _NEW_LINES_REGEX = re.compile("\\n")
 _PIPES_REGEX = re.compile("\\|")
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+"""
+libyaml's loader, where PyYAML was built with it, is many times quicker than the pure Python one.
+"""
 
 _MAP_CSV_NAME_TO_PID_URI: Dict[str, str] = {
     "Action.csv": f"{_MBO_PREFIX}mbo_0000004",
@@ -117,79 +131,357 @@ class ManualForeignKeyCheckConfig:
     separator: Optional[str]
 
 
+@dataclass
+class ModelIndex:
+    """
+    Lookups resolved from the schema view once per run, and read by every generation step.
+    """
+
+    classes: Dict[str, ClassDefinition]
+    slots_for_class: Dict[str, List[SlotDefinition]]
+    """
+    Each class's slots, including those inherited from its ancestors.
+    """
+    identifier_slots_for_class: Dict[str, List[SlotDefinition]]
+    csv_path_for_class: Dict[str, Path]
+    """
+    The path of the CSV file generated for each (non-abstract) class which has slots, in the model's order.
+    """
+    class_name_for_csv_path: Dict[Path, str]
+
+
+@dataclass
+class GeneratedClasses:
+    """
+    What is collected whilst generating the CSV files and table schemas for classes.
+    """
+
+    class_csv_map: Dict[str, Path] = field(default_factory=dict)
+    class_schema_map: Dict[str, Path] = field(default_factory=dict)
+    class_manual_foreign_key_checks: Dict[str, List[ManualForeignKeyCheckConfig]] = (
+        field(default_factory=dict)
+    )
+    map_class_name_to_csv_dependencies: Dict[str, Set[Path]] = field(
+        default_factory=dict
+    )
+
+    def merge(self, other: "GeneratedClasses") -> None:
+        self.class_csv_map.update(other.class_csv_map)
+        self.class_schema_map.update(other.class_schema_map)
+        self.class_manual_foreign_key_checks.update(
+            other.class_manual_foreign_key_checks
+        )
+        self.map_class_name_to_csv_dependencies.update(
+            other.map_class_name_to_csv_dependencies
+        )
+
+
 @click.command()
 @click.argument("CLASSES_YAML", type=click.Path(exists=True))
 @click.option("-o", "--output-dir", type=click.Path(), default=".")
-def main(classes_yaml: click.Path, output_dir: click.Path):
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The number of worker processes to generate each class's CSV file and table schema with.",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    show_default=True,
+    help=f"Skip generation when neither the model's YAML files nor the previously generated files have changed since "
+    f"the last run. The hashes are stored in `{_GENERATION_CACHE_FILE_PATH}` in the output directory.",
+)
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    default=False,
+    help="Report the classes whose CSV files depend upon one another.",
+)
+def main(
+    classes_yaml: click.Path,
+    output_dir: click.Path,
+    jobs: int,
+    cache: bool,
+    verbose: bool,
+):
     """
     Generates CSV-W files from the given all_classes.yaml configuration.
 
+    Files whose content hasn't changed are left untouched so that make doesn't consider anything depending upon them
+    to be out of date.
+
     If you're unsure whether you should be using this, you probably shouldn't.
     """
     classes_yaml_path = Path(str(classes_yaml))
     out_dir = Path(str(output_dir))
     out_dir.mkdir(exist_ok=True)
 
+    cache_file_path = out_dir / _GENERATION_CACHE_FILE_PATH
+    model_inputs_hash = _get_model_inputs_hash(classes_yaml_path)
+    if cache and _are_generated_files_current(
+        cache_file_path, model_inputs_hash, out_dir
+    ):
+        click.echo("The model is unchanged, nothing to generate.", err=True)
+        return
+
     schema_view = SchemaView(classes_yaml_path, merge_imports=True)
     all_classes = schema_view.all_classes()
     all_slots = schema_view.all_slots()
     all_literal_types = schema_view.all_types()
+    model_index = _build_model_index(all_classes, all_slots, out_dir)
 
     # Create both remote and data directories
     remote_dir = out_dir / _REMOTE_DIR_NAME
     remote_dir.mkdir(exist_ok=True)
-    
+
     data_dir = out_dir / _DATA_DIR_NAME
     data_dir.mkdir(exist_ok=True)
 
-    class_csv_map: Dict[str, Path] = {}
-    class_schema_map: Dict[str, Path] = {}
-    map_class_name_to_csv_dependencies: Dict[str, Set[Path]] = {}
-    class_manual_foreign_key_checks: Dict[str, List[ManualForeignKeyCheckConfig]] = {}
-    for _, clazz in all_classes.items():
-        slots_for_class = _get_slots_for_class(clazz, all_classes, all_slots)
-        if any(slots_for_class) and not clazz.abstract:
-            _generate_csv_and_schema_for_class(
-                clazz,
-                slots_for_class,
-                schema_view,
-                all_slots,
-                all_classes,
+    # Each worker is handed a share of the classes rather than one class at a time so that the model index is only
+    # pickled once per worker.
+    class_names = list(model_index.csv_path_for_class)
+    prefixes = {
+        prefix: str(namespace) for prefix, namespace in schema_view.namespaces().items()
+    }
+    generated_classes_by_task = run_tasks(
+        _generate_csv_and_schema_for_classes,
+        {
+            f"classes {task_number + 1} of {jobs}": (
+                class_names[task_number::jobs],
+                prefixes,
+                model_index,
                 all_literal_types,
                 out_dir,
-                class_csv_map,
-                class_schema_map,
-                class_manual_foreign_key_checks,
-                map_class_name_to_csv_dependencies,
             )
+            for task_number in range(min(jobs, len(class_names)))
+        },
+        jobs,
+    )
+
+    # Merged in the model's order so that the output doesn't depend on the number of jobs.
+    generated_classes = GeneratedClasses()
+    for generated_classes_for_task in generated_classes_by_task.values():
+        generated_classes.merge(generated_classes_for_task)
+    class_csv_map = {
+        class_name: generated_classes.class_csv_map[class_name]
+        for class_name in class_names
+    }
+    class_schema_map = {
+        class_name: generated_classes.class_schema_map[class_name]
+        for class_name in class_names
+    }
+    map_class_name_to_csv_dependencies = {
+        class_name: generated_classes.map_class_name_to_csv_dependencies[class_name]
+        for class_name in class_names
+    }
+    class_manual_foreign_key_checks = {
+        class_name: generated_classes.class_manual_foreign_key_checks[class_name]
+        for class_name in class_names
+        if class_name in generated_classes.class_manual_foreign_key_checks
+    }
 
     _generate_unioned_identifiers_schema(out_dir)
 
-    _perform_transitive_dependency_closure(
+    cycles = _perform_transitive_dependency_closure(
         map_class_name_to_csv_dependencies, class_csv_map
     )
+    if verbose:
+        for cycle in cycles:
+            click.echo(
+                f"Classes with cyclic CSV dependencies: {', '.join(cycle)}", err=True
+            )
 
     _generate_csv_metadata_documents(
-        class_csv_map, class_schema_map, out_dir, map_class_name_to_csv_dependencies
+        class_csv_map,
+        class_schema_map,
+        out_dir,
+        map_class_name_to_csv_dependencies,
+        model_index,
     )
 
-    with open(out_dir / "remote" / "foreign-keys.mk", "w+") as f:
-        f.writelines(
-            _generate_makefile_manual_foreign_key_checks(
-                class_manual_foreign_key_checks, out_dir
-            )
+    _write_file_if_changed(
+        out_dir / "remote" / "foreign-keys.mk",
+        _generate_makefile_manual_foreign_key_checks(
+            class_manual_foreign_key_checks, out_dir
+        ),
+    )
+
+    _write_file_if_changed(
+        out_dir / "remote" / "foreign-keys.json",
+        _generate_manual_foreign_key_checks_manifest(
+            class_manual_foreign_key_checks, out_dir
+        ),
+    )
+
+    _write_file_if_changed(
+        out_dir / "class-descriptions.md",
+        _generate_user_documentation_markdown(
+            model_index,
+            all_literal_types,
+            schema_view.namespaces(),
+            schema_view.schema,
+        ),
+    )
+
+    output_files = (
+        list(class_csv_map.values())
+        + list(class_schema_map.values())
+        + [
+            out_dir / _REMOTE_DIR_NAME / _get_metadata_file_name_for_class(class_name)
+            for class_name in class_csv_map
+        ]
+        + [
+            out_dir / _REMOTE_DIR_NAME / _UNIONED_IDENTIFIERS_SCHEMA_FILE_NAME,
+            out_dir / "remote" / "foreign-keys.mk",
+            out_dir / "remote" / "foreign-keys.json",
+            out_dir / "class-descriptions.md",
+        ]
+    )
+    if cache:
+        _write_generation_cache(
+            cache_file_path, model_inputs_hash, output_files, out_dir
         )
 
-    with open(out_dir / "class-descriptions.md", "w+") as f:
-        f.writelines(
-            _generate_user_documentation_markdown(
-                all_classes,
-                all_literal_types,
-                all_slots,
-                schema_view.namespaces(),
-                schema_view.schema,
+
+def _build_model_index(
+    all_classes: Dict[str, ClassDefinition],
+    all_slots: Dict[str, SlotDefinition],
+    out_dir: Path,
+) -> ModelIndex:
+    slots_for_class: Dict[str, List[SlotDefinition]] = {}
+
+    def _resolve_slots_for_class(clazz: ClassDefinition) -> List[SlotDefinition]:
+        if clazz.name not in slots_for_class:
+            inherited_slots = (
+                _resolve_slots_for_class(all_classes[str(clazz.is_a)])
+                if clazz.is_a
+                else []
             )
-        )
+            slots_for_class[clazz.name] = inherited_slots + [
+                all_slots[slot_name] for slot_name in clazz.slots
+            ]
+        return slots_for_class[clazz.name]
+
+    for clazz in all_classes.values():
+        _resolve_slots_for_class(clazz)
+
+    csv_path_for_class = {
+        class_name: out_dir / _DATA_DIR_NAME / _get_csv_name_for_class(class_name)
+        for class_name, clazz in all_classes.items()
+        if any(slots_for_class[class_name]) and not clazz.abstract
+    }
+
+    return ModelIndex(
+        classes=all_classes,
+        slots_for_class=slots_for_class,
+        identifier_slots_for_class={
+            class_name: [s for s in slots if s.identifier is True]
+            for class_name, slots in slots_for_class.items()
+        },
+        csv_path_for_class=csv_path_for_class,
+        class_name_for_csv_path={
+            csv_path: class_name for class_name, csv_path in csv_path_for_class.items()
+        },
+    )
+
+
+def _get_model_inputs_hash(classes_yaml_path: Path) -> str:
+    """
+    Hashes the model's YAML files (found by following the local `imports`), this script and the version of
+    linkml-runtime which resolves any non-local imports.
+    """
+    model_files: Set[Path] = set()
+    files_to_visit = [classes_yaml_path.resolve()]
+    while any(files_to_visit):
+        model_file = files_to_visit.pop()
+        if model_file in model_files:
+            continue
+        model_files.add(model_file)
+
+        for imported in _get_model_file_imports(model_file):
+            if URIorCURIE.is_curie(imported) or "://" in imported:
+                continue
+            files_to_visit.append((model_file.parent / f"{imported}.yaml").resolve())
+
+    model_inputs_hash = hashlib.sha256()
+    model_inputs_hash.update(version("linkml-runtime").encode())
+    model_inputs_hash.update(Path(__file__).read_bytes())
+    for model_file in sorted(model_files):
+        model_inputs_hash.update(model_file.name.encode())
+        model_inputs_hash.update(model_file.read_bytes())
+
+    return model_inputs_hash.hexdigest()
+
+
+def _get_model_file_imports(model_file: Path) -> List[str]:
+    with open(model_file, "r") as f:
+        model = yaml.load(f, Loader=_YAML_LOADER)
+
+    if not isinstance(model, dict):
+        return []
+
+    return [str(imported) for imported in model.get("imports") or []]
+
+
+def _get_file_hash(file_path: Path) -> str:
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
+def _are_generated_files_current(
+    cache_file_path: Path, model_inputs_hash: str, out_dir: Path
+) -> bool:
+    """
+    Whether the files generated by the last run were generated from the same inputs and haven't been altered since.
+    """
+    if not cache_file_path.exists():
+        return False
+
+    try:
+        generation_cache = json.loads(cache_file_path.read_text())
+    except ValueError:
+        return False
+
+    if generation_cache.get("modelInputsHash") != model_inputs_hash:
+        return False
+
+    for relative_path, file_hash in generation_cache.get("files", {}).items():
+        file_path = out_dir / relative_path
+        if not file_path.exists() or _get_file_hash(file_path) != file_hash:
+            return False
+
+    return True
+
+
+def _write_generation_cache(
+    cache_file_path: Path,
+    model_inputs_hash: str,
+    output_files: List[Path],
+    out_dir: Path,
+) -> None:
+    cache_file_path.parent.mkdir(parents=True, exist_ok=True)
+    generation_cache = {
+        "modelInputsHash": model_inputs_hash,
+        "files": {
+            str(file_path.relative_to(out_dir)): _get_file_hash(file_path)
+            for file_path in sorted(output_files)
+        },
+    }
+    _write_file_if_changed(cache_file_path, json.dumps(generation_cache, indent=4))
+
+
+def _write_file_if_changed(file_path: Path, content: str) -> None:
+    """
+    Leaves the file (and hence its mtime) alone if it already holds `content`.
+    """
+    if file_path.exists() and file_path.read_text() == content:
+        return
+
+    with open(file_path, "w+") as f:
+        f.write(content)
 
 
 def _expand_curie(uri_or_curie: URIorCURIE, namespaces: Namespaces) -> str:
@@ -203,169 +495,200 @@ def _expand_curie(uri_or_curie: URIorCURIE, namespaces: Namespaces) -> str:
 
 
 def _perform_transitive_dependency_closure(
-    map_class_name_to_csv_dependencies: Dict[str, Set[Path]], map_class_name_to_csv_path
-) -> None:
+    map_class_name_to_csv_dependencies: Dict[str, Set[Path]],
+    map_class_name_to_csv_path: Dict[str, Path],
+) -> List[List[str]]:
     """
-    This is NOT efficient.
+    Adds the CSV dependencies of every class whose CSV file a class depends upon to that class's dependencies, in place.
+
+    Each class is a node in a graph with an edge to each class whose CSV file it depends upon. The graph's strongly
+    connected components are found with Tarjan's algorithm, which yields each component only after every component
+    it depends upon, so all of the closures are computed in a single pass. The classes in a cycle all end up with the
+    same dependencies.
+
+    Returns the cycles found, each as a sorted list of the names of the classes involved.
     """
     map_csv_path_to_class_name: Dict[Path, str] = {
         csv_path: class_name
         for class_name, csv_path in map_class_name_to_csv_path.items()
     }
 
-    changed_in_last_cycle: bool = True
-    cycle_counter: int = 0
-    while changed_in_last_cycle:
-        changed_in_last_cycle = False
-        cycle_counter += 1
-        if cycle_counter > 1000:
-            raise Exception(
-                f"Reached cycle {cycle_counter} in transitive dependency closure. This means we probably won't ever complete the closure. Giving up."
-            )
+    map_class_name_to_dependency_class_names: Dict[str, List[str]] = {
+        class_name: sorted(
+            {
+                map_csv_path_to_class_name[csv_path]
+                for csv_path in dependency_paths
+                if csv_path in map_csv_path_to_class_name
+            }
+            - {class_name}
+        )
+        for class_name, dependency_paths in map_class_name_to_csv_dependencies.items()
+    }
 
-        for class_name, dependency_paths in list(
-            map_class_name_to_csv_dependencies.items()
-        ):
-            unmet_transitive_dependencies = _get_unmet_transitive_dependencies(
-                dependency_paths,
-                map_class_name_to_csv_dependencies,
-                map_csv_path_to_class_name,
-            )
-            if any(unmet_transitive_dependencies):
-                changed_in_last_cycle = True
-                map_class_name_to_csv_dependencies[class_name] = (
-                    dependency_paths | unmet_transitive_dependencies
-                )
+    cycles: List[List[str]] = []
+    for component in _get_strongly_connected_components(
+        map_class_name_to_dependency_class_names
+    ):
+        component_dependencies: Set[Path] = set()
+        for class_name in component:
+            component_dependencies |= map_class_name_to_csv_dependencies[class_name]
+            for dependency_class_name in map_class_name_to_dependency_class_names[
+                class_name
+            ]:
+                # Components this one depends upon have already been closed, the classes in this one add nothing new.
+                component_dependencies |= map_class_name_to_csv_dependencies[
+                    dependency_class_name
+                ]
 
+        for class_name in component:
+            map_class_name_to_csv_dependencies[class_name] = set(component_dependencies)
 
-def _get_unmet_transitive_dependencies(
-    existing_csv_dependencies: Set[Path],
-    map_class_name_to_csv_dependencies: Dict[str, Set[Path]],
-    map_csv_path_to_class_name: Dict[Path, str],
-) -> Set[Path]:
-    dependent_on_classes = {
-        map_csv_path_to_class_name[csv_path]
-        for csv_path in existing_csv_dependencies
-        if csv_path in map_csv_path_to_class_name
-    }
+        if len(component) > 1:
+            cycles.append(sorted(component))
 
-    transitive_csv_dependency_paths: Set[Path] = set()
-    for dependent_class_name in dependent_on_classes:
-        transitive_csv_dependency_paths |= map_class_name_to_csv_dependencies[
-            dependent_class_name
-        ]
+    return sorted(cycles)
+
+
+def _get_strongly_connected_components(
+    graph: Dict[str, List[str]],
+) -> List[List[str]]:
+    """
+    An iterative implementation of Tarjan's algorithm, so that long chains of dependencies can't exceed the recursion
+    limit.
 
-    return existing_csv_dependencies ^ transitive_csv_dependency_paths
+    Components are returned in reverse topological order: each component comes after every component it has an edge to.
+    """
+    index_counter = 0
+    node_index: Dict[str, int] = {}
+    node_low_link: Dict[str, int] = {}
+    stack: List[str] = []
+    on_stack: Set[str] = set()
+    components: List[List[str]] = []
+
+    for root in graph:
+        if root in node_index:
+            continue
+
+        node_index[root] = node_low_link[root] = index_counter
+        index_counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work_stack = [(root, iter(graph[root]))]
+        while any(work_stack):
+            node, successors = work_stack[-1]
+            for successor in successors:
+                if successor not in node_index:
+                    node_index[successor] = node_low_link[successor] = index_counter
+                    index_counter += 1
+                    stack.append(successor)
+                    on_stack.add(successor)
+                    work_stack.append((successor, iter(graph[successor])))
+                    break
+                elif successor in on_stack:
+                    node_low_link[node] = min(
+                        node_low_link[node], node_index[successor]
+                    )
+            else:
+                work_stack.pop()
+                if any(work_stack):
+                    parent = work_stack[-1][0]
+                    node_low_link[parent] = min(
+                        node_low_link[parent], node_low_link[node]
+                    )
+
+                if node_low_link[node] == node_index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.remove(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+
+    return components
 
 
 def _generate_unioned_identifiers_schema(out_dir: Path):
-    with open(
-        out_dir / _REMOTE_DIR_NAME / _UNIONED_IDENTIFIERS_SCHEMA_FILE_NAME, "w+"
-    ) as f:
-        unioned_identifiers_schema = {
-            "@context": "http://www.w3.org/ns/csvw",
-            "columns": [
-                {
-                    "name": "id",
-                    "required": True,
-                    "titles": {"en": ["MBO Permanent Identifier*"]},
-                    "suppressOutput": True,
-                }
-            ],
-            "aboutUrl": "https://w3id.org/marco-bolo/{+id}",
-            "primaryKey": ["id"],
-        }
-        f.writelines(json.dumps(unioned_identifiers_schema, indent=4))
+    unioned_identifiers_schema = {
+        "@context": "http://www.w3.org/ns/csvw",
+        "columns": [
+            {
+                "name": "id",
+                "required": True,
+                "titles": {"en": ["MBO Permanent Identifier*"]},
+                "suppressOutput": True,
+            }
+        ],
+        "aboutUrl": "https://w3id.org/marco-bolo/{+id}",
+        "primaryKey": ["id"],
+    }
+    _write_file_if_changed(
+        out_dir / _REMOTE_DIR_NAME / _UNIONED_IDENTIFIERS_SCHEMA_FILE_NAME,
+        json.dumps(unioned_identifiers_schema, indent=4),
+    )
 
 def _generate_makefile_manual_foreign_key_checks(
     class_manual_foreign_key_checks: Dict[str, List[ManualForeignKeyCheckConfig]],
     out_dir: Path,
 ) -> str:
-    makefile_config = dedent(
+    """
+    All of the checks listed in `foreign-keys.json` are run by a single `listcolumnforeignkeycheckbatch` process so
+    that each table is only read once.
+    """
+    dependent_files = sorted(
+        {
+            str(table_path.relative_to(out_dir))
+            for manual_foreign_key_checks in class_manual_foreign_key_checks.values()
+            for manual_fk_check in manual_foreign_key_checks
+            for table_path in [
+                manual_fk_check.child_table_path,
+                manual_fk_check.parent_table_path,
+            ]
+        }
+    )
+
+    return dedent(
         f"""
         MANUAL_FOREIGN_KEY_VALIDATION_LOGS_SHORT	:= {" ".join(sorted([_get_csv_name_for_class(class_name) for class_name in class_manual_foreign_key_checks]))}
         MANUAL_FOREIGN_KEY_VALIDATION_LOGS			:= $(MANUAL_FOREIGN_KEY_VALIDATION_LOGS_SHORT:%.csv=out/validation/%-csv-list-column-foreign-key.success.log)
         MANUAL_FOREIGN_KEY_VALIDATION_LOGS_ERRORS	:= $(MANUAL_FOREIGN_KEY_VALIDATION_LOGS_SHORT:%.csv=out/validation/%-csv-list-column-foreign-key.err.log)
+        MANUAL_FOREIGN_KEY_CHECKS_MANIFEST			:= remote/foreign-keys.json
 
+        $(MANUAL_FOREIGN_KEY_VALIDATION_LOGS) &: {" ".join(dependent_files)} $(MANUAL_FOREIGN_KEY_CHECKS_MANIFEST) out/validation
+        	@$(LIST_COLUMN_FOREIGN_KEY_CHECK_BATCH) --out out/validation "$(MANUAL_FOREIGN_KEY_CHECKS_MANIFEST)"
     """
     )
 
-    for (
-        class_name,
-        manual_foreign_key_checks,
-    ) in sorted(class_manual_foreign_key_checks.items()):
-        csv_file_name = _get_csv_name_for_class(class_name)
-        success_log_file_name = (
-            csv_file_name.removesuffix(".csv") + "-csv-list-column-foreign-key.success.log"
-        )
-        error_log_file_name = (
-            csv_file_name.removesuffix(".csv") + "-csv-list-column-foreign-key.err.log"
-        )
-
-        success_log_file_path = f"out/validation/{success_log_file_name}"
-        error_log_file_path = f"out/validation/{error_log_file_name}"
-
-        dependent_files = {
-            str(manual_fk_check.parent_table_path.relative_to(out_dir))
-            for manual_fk_check in manual_foreign_key_checks
-        }
-
-        makefile_config += f"{success_log_file_path}: {" ".join(dependent_files)} out/validation\n"
-        makefile_config += indent(f'@rm -f "{error_log_file_path}" "{success_log_file_path}"', "	")
-        makefile_config += indent(
-            "\n".join(
-                [
-                    _get_makefile_config_for_foreign_key_check(manual_fk_check, out_dir, error_log_file_path)
-                    for manual_fk_check in manual_foreign_key_checks
-                ]
-            ),
-            "	",
-        )
-        makefile_config += indent(
-            dedent(
-                f"""
-                @if [ -f "{error_log_file_path}" ]; then \\
-                   echo ""; \\
-                   printf '\033[0;31m'; # Red \\
-                   echo "Foreign Key errors detected:"; \\
-                   cat "{error_log_file_path}"; \\
-                   printf '\033[0m'; # Reset colour \\
-                 else \\
-                   touch "{success_log_file_path}"; \\
-                 fi
-                @echo ""
-            """
-            ),
-            "	",
-        )
-
-    return makefile_config
-
 
-def _get_makefile_config_for_foreign_key_check(
-    manual_foreign_key_check: ManualForeignKeyCheckConfig, out_dir: Path, err_log_file_path: str
+def _generate_manual_foreign_key_checks_manifest(
+    class_manual_foreign_key_checks: Dict[str, List[ManualForeignKeyCheckConfig]],
+    out_dir: Path,
 ) -> str:
-    child_table_path = manual_foreign_key_check.child_table_path.relative_to(out_dir)
-    parent_table_path = manual_foreign_key_check.parent_table_path.relative_to(out_dir)
-
-    foreign_key_check_command = (
-        f'$(LIST_COLUMN_FOREIGN_KEY_CHECK) "{child_table_path}" "{manual_foreign_key_check.child_table_column}" '
-        f'"{parent_table_path}" "{manual_foreign_key_check.parent_table_column}"'
-    )
-
-    if manual_foreign_key_check.separator is not None:
-        foreign_key_check_command += (
-            f' --separator "{manual_foreign_key_check.separator}"'
+    """
+    The manifest of foreign key checks read by `listcolumnforeignkeycheckbatch`, keyed by class name.
+    """
+    manifest = {
+        class_name: [
+            {
+                "childTable": str(
+                    manual_fk_check.child_table_path.relative_to(out_dir)
+                ),
+                "childColumn": manual_fk_check.child_table_column,
+                "parentTable": str(
+                    manual_fk_check.parent_table_path.relative_to(out_dir)
+                ),
+                "parentColumn": manual_fk_check.parent_table_column,
+                "separator": manual_fk_check.separator,
+            }
+            for manual_fk_check in manual_foreign_key_checks
+        ]
+        for class_name, manual_foreign_key_checks in sorted(
+            class_manual_foreign_key_checks.items()
         )
+    }
 
-    foreign_key_check_command = f'@RES=$$({foreign_key_check_command}) && echo "$$RES" || echo "$$RES" >> "{err_log_file_path}"'
-
-    return dedent(
-        f"""
-            @echo "=============================== Validating values in {child_table_path}['{manual_foreign_key_check.child_table_column}'] ==============================="
-            {foreign_key_check_command}
-        """
-    )
+    return json.dumps(manifest, indent=4) + "\n"
 
 
 def _generate_csv_metadata_documents(
@@ -373,10 +696,23 @@ def _generate_csv_metadata_documents(
     class_schema_map: Dict[str, Path],
     out_dir: Path,
     map_class_name_to_csv_dependencies: Dict[str, Set[Path]],
+    model_index: ModelIndex,
 ) -> None:
     def _get_relative_path_from_remote_dir(p: Path) -> str:
         return str(p.relative_to(out_dir / _REMOTE_DIR_NAME, walk_up=True))
 
+    relative_table_paths_for_class = {
+        class_name: (
+            _get_relative_path_from_remote_dir(csv_file_path),
+            _get_relative_path_from_remote_dir(class_schema_map[class_name]),
+        )
+        for class_name, csv_file_path in class_csv_map.items()
+    }
+    position_of_class = {
+        class_name: position
+        for position, class_name in enumerate(model_index.csv_path_for_class)
+    }
+
     for parent_class_name, parent_csv_file_path in class_csv_map.items():
         csv_dependencies_for_class: Set[Path] = map_class_name_to_csv_dependencies[
             parent_class_name
@@ -387,23 +723,25 @@ def _generate_csv_metadata_documents(
             "tables": [],
         }
 
-
-        for dependency_class_name, dependency_csv_file_path in class_csv_map.items():
-            if dependency_csv_file_path in csv_dependencies_for_class:
-                dependency_schema_file_path = class_schema_map[dependency_class_name]
-
-                metadata_document["tables"].append(
-                    {
-                        "url": _get_relative_path_from_remote_dir(
-                            dependency_csv_file_path
-                        ),
-                        "tableSchema": _get_relative_path_from_remote_dir(
-                            dependency_schema_file_path
-                        ),
-                        "suppressOutput": dependency_csv_file_path
-                        != parent_csv_file_path,
-                    }
-                )
+        dependency_class_names = sorted(
+            (
+                model_index.class_name_for_csv_path[csv_file_path]
+                for csv_file_path in csv_dependencies_for_class
+                if csv_file_path in model_index.class_name_for_csv_path
+            ),
+            key=position_of_class.__getitem__,
+        )
+        for dependency_class_name in dependency_class_names:
+            dependency_csv_url, dependency_schema_url = relative_table_paths_for_class[
+                dependency_class_name
+            ]
+            metadata_document["tables"].append(
+                {
+                    "url": dependency_csv_url,
+                    "tableSchema": dependency_schema_url,
+                    "suppressOutput": dependency_class_name != parent_class_name,
+                }
+            )
 
         for dependency_class_name, csv_file_name in _VIRTUAL_CSV_FILES.items():
             dependency_csv_file_path = _get_virtual_file_path(
@@ -426,21 +764,49 @@ def _generate_csv_metadata_documents(
                     }
                 )
 
-        with open(
+        _write_file_if_changed(
             out_dir
             / _REMOTE_DIR_NAME
             / _get_metadata_file_name_for_class(parent_class_name),
-            "w+",
-        ) as f:
-            f.writelines(json.dumps(metadata_document, indent=4))
+            json.dumps(metadata_document, indent=4),
+        )
+
+
+def _generate_csv_and_schema_for_classes(
+    class_names: List[str],
+    prefixes: Dict[str, str],
+    model_index: ModelIndex,
+    all_literal_types: Dict[str, TypeDefinition],
+    output_dir: Path,
+) -> GeneratedClasses:
+    """
+    Runs in a worker process. `Namespaces` can't be unpickled, so the prefixes are passed as a plain dictionary.
+    """
+    namespaces = Namespaces()
+    for prefix, namespace in prefixes.items():
+        namespaces[prefix] = namespace
+
+    generated_classes = GeneratedClasses()
+    for class_name in class_names:
+        _generate_csv_and_schema_for_class(
+            model_index.classes[class_name],
+            namespaces,
+            model_index,
+            all_literal_types,
+            output_dir,
+            generated_classes.class_csv_map,
+            generated_classes.class_schema_map,
+            generated_classes.class_manual_foreign_key_checks,
+            generated_classes.map_class_name_to_csv_dependencies,
+        )
+
+    return generated_classes
 
 
 def _generate_csv_and_schema_for_class(
     clazz: ClassDefinition,
-    slots_for_class: List[SlotDefinition],
-    schema_view: SchemaView,
-    all_slots: Dict[str, SlotDefinition],
-    all_classes: Dict[str, ClassDefinition],
+    namespaces: Namespaces,
+    model_index: ModelIndex,
     all_literal_types: Dict[str, TypeDefinition],
     output_dir: Path,
     class_csv_map: Dict[str, Path],
@@ -449,22 +815,23 @@ def _generate_csv_and_schema_for_class(
     map_class_name_to_csv_dependencies: Dict[str, Set[Path]],
 ) -> None:
     # Create Basic CSV in the data directory
-    namespaces = schema_view.namespaces()
+    slots_for_class = model_index.slots_for_class[clazz.name]
 
     csv_starter = pd.DataFrame(
         {_get_csv_col_title_for_slot(slot): [] for slot in slots_for_class}
     )
     csv_name_for_class = _get_csv_name_for_class(clazz.name)
     # Put CSV files in data/ directory
-    csv_file_path = output_dir / _DATA_DIR_NAME / csv_name_for_class
+    csv_file_path = model_index.csv_path_for_class[clazz.name]
     class_csv_map[clazz.name] = csv_file_path
-    csv_starter.to_csv(csv_file_path, index=False, quoting=csv.QUOTE_STRINGS)
+    _write_file_if_changed(
+        csv_file_path,
+        csv_starter.to_csv(index=False, quoting=csv.QUOTE_STRINGS, lineterminator="\n"),
+    )
 
     foreign_key_definitions: List[Dict[str, Any]] = []
     primary_key_definition: List[str] = []
-    identifier_slot = _get_primary_key_identifier_slot_definition(
-        clazz, slots_for_class
-    )
+    identifier_slot = _get_primary_key_identifier_slot_definition(clazz, model_index)
 
     manual_build_foreign_key_checks: List[ManualForeignKeyCheckConfig] = []
 
@@ -475,8 +842,7 @@ def _generate_csv_and_schema_for_class(
             clazz,
             identifier_slot,
             slot,
-            all_classes,
-            all_slots,
+            model_index,
             all_literal_types,
             primary_key_definition,
             foreign_key_definitions,
@@ -505,7 +871,6 @@ def _generate_csv_and_schema_for_class(
             }
         )
 
-
     column_definitions += [
         {
             "virtual": True,
@@ -553,9 +918,8 @@ def _generate_csv_and_schema_for_class(
     schema_file_path = (
         output_dir / _REMOTE_DIR_NAME / _get_schema_file_name_for_class(clazz.name)
     )
-    with open(schema_file_path, "w+") as f:
-        class_schema_map[clazz.name] = schema_file_path
-        f.writelines(json.dumps(basic_schema, indent=4))
+    class_schema_map[clazz.name] = schema_file_path
+    _write_file_if_changed(schema_file_path, json.dumps(basic_schema, indent=4))
 
 
 def _add_user_defined_virtual_columns_for_triples(
@@ -601,19 +965,6 @@ def _add_user_defined_virtual_columns_for_triples(
     return additional_virtual_columns
 
 
-def _get_slots_for_class(
-    clazz: ClassDefinition,
-    all_classes: Dict[str, ClassDefinition],
-    all_slots: Dict[str, SlotDefinition],
-) -> List[SlotDefinition]:
-    inherited_slots = []
-    if clazz.is_a:
-        parent_class = all_classes[str(clazz.is_a)]
-        inherited_slots = _get_slots_for_class(parent_class, all_classes, all_slots)
-
-    return inherited_slots + [all_slots[slot_name] for slot_name in clazz.slots]
-
-
 def _get_csv_name_for_class(class_name: str) -> str:
     return f"{class_name}.csv"
 
@@ -638,8 +989,7 @@ def _get_column_definition_for_slot(
     clazz: ClassDefinition,
     identifier_slot: SlotDefinition,
     slot: SlotDefinition,
-    all_classes: Dict[str, ClassDefinition],
-    all_slots: Dict[str, SlotDefinition],
+    model_index: ModelIndex,
     all_literal_types: Dict[str, TypeDefinition],
     primary_key_definition: List[str],
     foreign_key_definitions: List[Dict[str, Any]],
@@ -685,10 +1035,9 @@ def _get_column_definition_for_slot(
             slot.extensions[_LINKML_EXTENSION_ABOUT_URL].value,
         )
 
-    if slot.range in all_classes:
+    if slot.range in model_index.classes:
         _define_related_class_column(
-            all_classes,
-            all_slots,
+            model_index,
             clazz,
             column_definition,
             foreign_key_definitions,
@@ -797,8 +1146,7 @@ def _map_linkml_data_type_to_csvw(
 
 
 def _define_related_class_column(
-    all_classes: Dict[str, ClassDefinition],
-    all_slots: Dict[str, SlotDefinition],
+    model_index: ModelIndex,
     clazz: ClassDefinition,
     column_definition: Dict[str, Any],
     foreign_key_definitions: List[Dict[str, Any]],
@@ -808,10 +1156,8 @@ def _define_related_class_column(
     out_dir: Path,
     csv_dependencies_for_class: Set[Path],
 ) -> None:
-    range_class = all_classes[slot.range]
-    class_csv_name = _get_csv_name_for_class(clazz.name)
-    # CSV files are now in the data/ directory
-    class_csv_path = out_dir / _DATA_DIR_NAME / class_csv_name
+    range_class = model_index.classes[slot.range]
+    class_csv_path = model_index.csv_path_for_class[clazz.name]
 
     remote_dir_path = out_dir / _REMOTE_DIR_NAME
     range_csv_location = (
@@ -821,7 +1167,7 @@ def _define_related_class_column(
     )
     csv_dependencies_for_class.add(range_csv_location)
     range_class_pk_slot = _get_primary_key_identifier_slot_definition(
-        range_class, _get_slots_for_class(range_class, all_classes, all_slots)
+        range_class, model_index
     )
 
     if slot.multivalued:
@@ -889,9 +1235,9 @@ def _get_virtual_file_path(output_dir: Path, virtual_class_name: str) -> Path:
 
 
 def _get_primary_key_identifier_slot_definition(
-    clazz: ClassDefinition, slots_for_class: List[SlotDefinition]
-):
-    identifier_slots = [s for s in slots_for_class if s.identifier is True]
+    clazz: ClassDefinition, model_index: ModelIndex
+) -> SlotDefinition:
+    identifier_slots = model_index.identifier_slots_for_class[clazz.name]
     if len(identifier_slots) != 1:
         raise Exception(
             f"Expected to find 1 identifier slots in {clazz.name} but found {len(identifier_slots)}"
@@ -900,13 +1246,12 @@ def _get_primary_key_identifier_slot_definition(
 
 
 def _generate_user_documentation_markdown(
-    all_classes: Dict[str, ClassDefinition],
+    model_index: ModelIndex,
     all_literals: Dict[str, TypeDefinition],
-    all_slots: Dict[str, SlotDefinition],
     namespaces: Namespaces,
     schema: SchemaDefinition,
 ) -> str:
-    ordered_classes = sorted(all_classes.values(), key=lambda c: c.name)
+    ordered_classes = sorted(model_index.classes.values(), key=lambda c: c.name)
     markdown = "# MARCO-BOLO CSV Models" + _TWO_LINES
     markdown += (
         "This has been automatically generated by a python script. You should not attempt to edit it manually."
@@ -924,14 +1269,17 @@ def _generate_user_documentation_markdown(
     markdown += (
         tabulate(table_of_contents, tablefmt=_TABLE_FORMAT, headers="keys") + _TWO_LINES
     )
-    markdown += _TWO_LINES.join(
-        [
-            _get_markdown_docs_for_class(
-                clazz, all_classes, all_slots, all_literals, namespaces
-            )
-            for clazz in ordered_classes
-        ]
-    ) + _TWO_LINES
+    markdown += (
+        _TWO_LINES.join(
+            [
+                _get_markdown_docs_for_class(
+                    clazz, model_index, all_literals, namespaces
+                )
+                for clazz in ordered_classes
+            ]
+        )
+        + _TWO_LINES
+    )
 
     markdown += _generate_prefixes_section_markdown(namespaces) + _TWO_LINES
     return markdown
@@ -1002,8 +1350,7 @@ def _get_anchor_tag_identifier(title: str) -> str:
 
 def _get_markdown_docs_for_class(
     clazz: ClassDefinition,
-    all_classes: Dict[str, ClassDefinition],
-    all_slots: Dict[str, SlotDefinition],
+    model_index: ModelIndex,
     all_literals: Dict[str, TypeDefinition],
     namespaces: Namespaces,
 ) -> str:
@@ -1029,11 +1376,13 @@ def _get_markdown_docs_for_class(
             [
                 _get_csv_col_title_for_slot(slot),
                 "Yes" if slot.required else "No",
-                _get_range_str_for_slot(slot, all_classes, all_literals, namespaces),
+                _get_range_str_for_slot(
+                    slot, model_index.classes, all_literals, namespaces
+                ),
                 "Yes" if slot.multivalued else "No",
                 _get_slot_description(slot),
             ]
-            for slot in _get_slots_for_class(clazz, all_classes, all_slots)
+            for slot in model_index.slots_for_class[clazz.name]
         ],
         tablefmt=_TABLE_FORMAT,
         headers=["Column Title", "Required", "Contains", "Multivalued", "Description"],
@@ -1054,4 +1403,4 @@ def _get_slot_description(slot: SlotDefinition) -> str:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -5,13 +5,46 @@ listcolumnforeignkeycheck
 Enforces foreign key constraints on the literal values inside list columns.
 """
 
+import json
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Set, Any
+from typing import Dict, Iterable, List, Optional, Set, Any
 
 import click
 import pandas as pd
 
+_DEFAULT_SEPARATOR: str = "|"
+
+_FIRST_DATA_RECORD_NUMBER: int = 2
+"""
+The record number of a table's first row of data, counting the header as record 1.
+
+This is the row number a spreadsheet would show, but not necessarily the line number in the CSV file, since a quoted
+value may span several lines.
+"""
+
+
+@dataclass
+class ForeignKeyCheck:
+    child_table_path: Path
+    child_table_column: str
+    parent_table_path: Path
+    parent_table_column: str
+    separator: Optional[str]
+    """
+    The character separating values in the child table's column, `None` where the column holds a single value.
+    """
+
+
+@dataclass
+class TableCache:
+    table_columns: Dict[Path, Set[str]]
+    """
+    The columns to read from each table; the union of the columns used by every check.
+    """
+    tables: Dict[Path, pd.DataFrame] = field(default_factory=dict)
+
 
 @click.command()
 @click.argument(
@@ -34,7 +67,7 @@ import pandas as pd
     "--separator",
     "-s",
     type=str,
-    default="|",
+    default=_DEFAULT_SEPARATOR,
     show_default=True,
     help="The character separating values in LIST_COLUMN_TITLE_IN_CHILD_TABLE",
 )
@@ -49,7 +82,7 @@ def main(
     Validates the values of the `LIST_COLUMN_TITLE_IN_CHILD_TABLE` inside `CSV_CHILD_TABLE` against the authoritative
     values defined in `COLUMN_TITLE_IN_PARENT_TABLE` in `CSV_PARENT_TABLE`.
     """
-    invalid_values = _get_invalid_list_column_values(
+    invalid_value_rows = _get_invalid_list_column_value_rows(
         Path(str(csv_child_table)),
         list_column_title_in_child_table,
         Path(str(csv_parent_table)),
@@ -57,17 +90,193 @@ def main(
         separator,
     )
 
-    if any(invalid_values):
+    print(
+        _get_check_result_message(
+            ForeignKeyCheck(
+                Path(str(csv_child_table)),
+                list_column_title_in_child_table,
+                Path(str(csv_parent_table)),
+                column_title_in_parent_table,
+                separator,
+            ),
+            invalid_value_rows,
+        )
+    )
+    sys.exit(1 if any(invalid_value_rows) else 0)
+
+
+@click.command("batch")
+@click.argument("manifest_file", type=click.Path(exists=True))
+@click.option(
+    "-o",
+    "--out",
+    type=click.Path(),
+    default="out/validation",
+    show_default=True,
+    help="The directory to write each class's success and error logs to.",
+)
+def batch(manifest_file: click.Path, out: click.Path) -> None:
+    """
+    Runs every foreign key check listed in the MANIFEST_FILE (as generated by `generatecsvwdefinitions`) in a single
+    process, so each table is only read once however many checks it takes part in.
+
+    For each class, `<Class>-csv-list-column-foreign-key.err.log` is written in the OUT directory if any of its checks
+    fail, otherwise `<Class>-csv-list-column-foreign-key.success.log` is.
+    """
+    out_dir = Path(str(out))
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    class_foreign_key_checks = _read_foreign_key_checks_manifest(
+        Path(str(manifest_file))
+    )
+    table_cache = TableCache(
+        table_columns=_get_table_columns(
+            check
+            for foreign_key_checks in class_foreign_key_checks.values()
+            for check in foreign_key_checks
+        )
+    )
+    for class_name, foreign_key_checks in class_foreign_key_checks.items():
+        _run_foreign_key_checks_for_class(
+            class_name, foreign_key_checks, out_dir, table_cache
+        )
+
+
+def _read_foreign_key_checks_manifest(
+    manifest_file: Path,
+) -> Dict[str, List[ForeignKeyCheck]]:
+    with open(manifest_file, "r") as f:
+        manifest = json.load(f)
+
+    return {
+        class_name: [
+            ForeignKeyCheck(
+                child_table_path=Path(check["childTable"]),
+                child_table_column=check["childColumn"],
+                parent_table_path=Path(check["parentTable"]),
+                parent_table_column=check["parentColumn"],
+                separator=check["separator"],
+            )
+            for check in checks
+        ]
+        for class_name, checks in manifest.items()
+    }
+
+
+def _run_foreign_key_checks_for_class(
+    class_name: str,
+    foreign_key_checks: List[ForeignKeyCheck],
+    out_dir: Path,
+    table_cache: TableCache,
+) -> bool:
+    """
+    Writes the success or error log `foreign-keys.mk` expects for `class_name`, reading tables through the
+    `table_cache`.
+
+    Returns whether all of the checks passed.
+    """
+    success_log_file = out_dir / f"{class_name}-csv-list-column-foreign-key.success.log"
+    error_log_file = out_dir / f"{class_name}-csv-list-column-foreign-key.err.log"
+    success_log_file.unlink(missing_ok=True)
+    error_log_file.unlink(missing_ok=True)
+
+    for check in foreign_key_checks:
         print(
-            f"Unexpected values found in {csv_child_table}['{list_column_title_in_child_table}'] but not in "
-            f"{csv_parent_table}['{column_title_in_parent_table}']:\n{"\n".join([f"'{v}'" for v in invalid_values])}"
+            f"=============================== Validating values in {check.child_table_path}"
+            f"['{check.child_table_column}'] ==============================="
         )
-        sys.exit(1)
+        try:
+            invalid_value_rows = _get_invalid_value_rows(
+                _read_table(check.child_table_path, table_cache),
+                check.child_table_column,
+                check.separator or _DEFAULT_SEPARATOR,
+                _get_unique_parent_values_from_table(
+                    _read_table(check.parent_table_path, table_cache),
+                    check.parent_table_column,
+                ),
+            )
+            check_failed = any(invalid_value_rows)
+            message = _get_check_result_message(check, invalid_value_rows)
+        except Exception as e:
+            check_failed = True
+            message = f"Failed to validate {check.child_table_path}['{check.child_table_column}']: {e!r}"
+
+        if check_failed:
+            with open(error_log_file, "a") as f:
+                f.write(f"{message}\n")
+        else:
+            print(message)
+
+    if error_log_file.exists():
+        print("")
+        print("\033[0;31mForeign Key errors detected:")
+        print(error_log_file.read_text(), end="")
+        print("\033[0m", end="")
     else:
-        print(
-            f"All values found in {csv_child_table}['{list_column_title_in_child_table}'] appear to be valid."
+        success_log_file.touch()
+    print("")
+
+    return not error_log_file.exists()
+
+
+def _get_check_result_message(
+    check: ForeignKeyCheck, invalid_value_records: Dict[str, List[int]]
+) -> str:
+    if any(invalid_value_records):
+        return (
+            f"Unexpected values found in {check.child_table_path}['{check.child_table_column}'] but not in "
+            f"{check.parent_table_path}['{check.parent_table_column}']:\n"
+            + "\n".join(
+                f"'{value}' ({_describe_records(invalid_value_records[value])})"
+                for value in sorted(invalid_value_records)
+            )
         )
-        sys.exit(0)
+
+    return f"All values found in {check.child_table_path}['{check.child_table_column}'] appear to be valid."
+
+
+def _describe_records(record_numbers: List[int]) -> str:
+    plural = "s" if len(record_numbers) > 1 else ""
+    return f"record{plural} {', '.join(str(record) for record in record_numbers)}"
+
+
+def _get_table_columns(
+    foreign_key_checks: Iterable[ForeignKeyCheck],
+) -> Dict[Path, Set[str]]:
+    table_columns: Dict[Path, Set[str]] = {}
+    for check in foreign_key_checks:
+        table_columns.setdefault(check.child_table_path, set()).add(
+            check.child_table_column
+        )
+        table_columns.setdefault(check.parent_table_path, set()).add(
+            check.parent_table_column
+        )
+    return table_columns
+
+
+def _read_table(csv_table: Path, table_cache: TableCache) -> pd.DataFrame:
+    if csv_table not in table_cache.tables:
+        table_cache.tables[csv_table] = _read_csv_columns(
+            csv_table, table_cache.table_columns[csv_table]
+        )
+    return table_cache.tables[csv_table]
+
+
+def _read_csv_columns(csv_table: Path, columns: Set[str]) -> pd.DataFrame:
+    """
+    Reads only the given `columns` of the `csv_table`, leaving every value as the string it is in the file.
+
+    Empty cells are read as `""`; no other values (such as `NA` or `null`) are treated as missing. Columns which
+    aren't in the table are ignored here, and so raise a `KeyError` when they are looked up.
+    """
+    return pd.read_csv(
+        csv_table,
+        usecols=lambda column: column in columns,
+        dtype=str,
+        na_filter=False,
+        # Keeps the record numbers reported against invalid values in step with the file.
+        skip_blank_lines=False,
+    )
 
 
 def _get_invalid_list_column_values(
@@ -80,35 +289,116 @@ def _get_invalid_list_column_values(
     """
     Returns missing values.
     """
-    unique_child_values = _get_unique_child_table_values(
-        csv_child_table, list_column_title_in_child_table, separator
+    return set(
+        _get_invalid_list_column_value_rows(
+            csv_child_table,
+            list_column_title_in_child_table,
+            csv_parent_table,
+            column_title_in_parent_table,
+            separator,
+        )
     )
+
+
+def _get_invalid_list_column_value_rows(
+    csv_child_table: Path,
+    list_column_title_in_child_table: str,
+    csv_parent_table: Path,
+    column_title_in_parent_table: str,
+    separator: str,
+) -> Dict[str, List[int]]:
+    """
+    Returns missing values along with the numbers of the records they appear in (see `_FIRST_DATA_RECORD_NUMBER`).
+    """
     unique_parent_values = _get_unique_parent_values(
         column_title_in_parent_table, csv_parent_table
     )
 
-    return unique_child_values - unique_parent_values
+    return _get_invalid_value_rows(
+        _read_csv_columns(csv_child_table, {list_column_title_in_child_table}),
+        list_column_title_in_child_table,
+        separator,
+        unique_parent_values,
+    )
+
+
+def _get_invalid_value_rows(
+    child_table: pd.DataFrame,
+    list_column_title_in_child_table: str,
+    separator: Optional[str],
+    unique_parent_values: Set[str],
+) -> Dict[str, List[int]]:
+    invalid_values = (
+        _get_unique_child_values_from_table(
+            child_table, list_column_title_in_child_table, separator
+        )
+        - unique_parent_values
+    )
+    if not any(invalid_values):
+        return {}
+
+    # Only go looking for the records once we know there's something to report.
+    child_values = _get_child_values_from_table(
+        child_table, list_column_title_in_child_table, separator
+    )
+    invalid_child_values = child_values[child_values.isin(invalid_values)]
+
+    invalid_value_records: Dict[str, Dict[int, None]] = {}
+    for row_index, value in invalid_child_values.items():
+        # Dictionary keys keep the records in order without repeating one which references the same value twice.
+        invalid_value_records.setdefault(value, {})[
+            int(row_index) + _FIRST_DATA_RECORD_NUMBER  # type: ignore
+        ] = None
+
+    return {value: list(records) for value, records in invalid_value_records.items()}
 
 
 def _get_unique_parent_values(column_title_in_parent_table, csv_parent_table):
-    parent_table = pd.read_csv(csv_parent_table)
+    return _get_unique_parent_values_from_table(
+        _read_csv_columns(csv_parent_table, {column_title_in_parent_table}),
+        column_title_in_parent_table,
+    )
+
+
+def _get_unique_parent_values_from_table(
+    parent_table: pd.DataFrame, column_title_in_parent_table: str
+) -> Set[str]:
     parent_table_column = parent_table[column_title_in_parent_table]
-    non_null_parent_values: pd.Series = parent_table_column[~parent_table_column.isnull()]  # type: ignore
-    unique_parent_values = {str(value) for (_, value) in non_null_parent_values.items()}
-    return unique_parent_values
+    return set(parent_table_column[parent_table_column != ""])
 
 
-def _get_unique_child_table_values(
-    csv_child_table: Path, list_column_title_in_child_table: str, separator: str
+def _get_unique_child_values_from_table(
+    child_table: pd.DataFrame,
+    list_column_title_in_child_table: str,
+    separator: Optional[str],
 ) -> Set[Any]:
-    child_table = pd.read_csv(csv_child_table)
     child_table_column = child_table[list_column_title_in_child_table]
-    non_null_child_values: pd.Series = child_table_column[~child_table_column.isnull()]  # type: ignore
-    return {
-        individual_value
-        for (_, cell_value) in non_null_child_values.items()
-        for individual_value in str.split(str(cell_value), separator)
-    }
+    non_empty_child_values = child_table_column[child_table_column != ""]
+    if separator is None:
+        return set(non_empty_child_values)
+    if non_empty_child_values.empty:
+        return set()
+
+    # Splitting the whole column in one go avoids a Python-level `split` per cell.
+    return set(separator.join(non_empty_child_values).split(separator))
+
+
+def _get_child_values_from_table(
+    child_table: pd.DataFrame,
+    list_column_title_in_child_table: str,
+    separator: Optional[str],
+) -> pd.Series:
+    """
+    Returns each individual value in the list column, indexed by the (zero-based) index of the row it appears in.
+
+    Where the `separator` is `None`, each cell holds a single value.
+    """
+    child_table_column = child_table[list_column_title_in_child_table]
+    non_empty_child_values = child_table_column[child_table_column != ""]
+    if separator is None:
+        return non_empty_child_values
+
+    return non_empty_child_values.str.split(separator, regex=False).explode()
 
 
 if __name__ == "__main__":
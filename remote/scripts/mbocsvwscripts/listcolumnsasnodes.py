@@ -7,23 +7,107 @@ Converts literals of type <https://w3id.org/marco-bolo/ConvertMboIdToNode> and <
 This makes up for a limitation in the CSV on the web standard, see <https://lists.w3.org/Archives/Public/public-csvw/2016Aug/0001.html>.
 """
 
+import os
+import re
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Iterator, List, Tuple
 
 import click
 import rdflib
+from rdflib.term import Literal, Node, URIRef
+
+Triple = Tuple[Node, Node, Node]
+
+MBO_URI_PREFIX: str = "https://w3id.org/marco-bolo/"
+"""
+The MBO URI Prefix.
+"""
+CONVERT_MBO_ID_TO_NODE_DATA_TYPE_URI: URIRef = URIRef(
+    f"{MBO_URI_PREFIX}ConvertMboIdToNode"
+)
+"""
+Literals of this type are MBO identifiers which should be mapped into full MBO PIDs pointing at resources.
+"""
+CONVERT_IRI_TO_NODE_DATA_TYPE_URI: URIRef = URIRef(f"{MBO_URI_PREFIX}ConvertIriToNode")
+"""
+Literals of this type are IRIs which should be mapped into references to those resources.
+"""
+
+_N_TRIPLES_DATA_TYPE_MARKERS: Tuple[str, ...] = (
+    f'"^^<{CONVERT_MBO_ID_TO_NODE_DATA_TYPE_URI}>',
+    f'"^^<{CONVERT_IRI_TO_NODE_DATA_TYPE_URI}>',
+)
+"""
+A cheap check for N-Triples lines which may need converting before attempting to match them.
+"""
+_N_TRIPLES_LITERAL_TO_BE_CONVERTED = re.compile(
+    r'^(?P<subject_predicate>[^"]*)"(?P<lexical_form>(?:[^"\\]|\\.)*)"'
+    r"\^\^<(?P<data_type>https://w3id\.org/marco-bolo/Convert(?:MboId|Iri)ToNode)>\s*\.\s*$"
+)
+"""
+Matches an N-Triples statement whose object is a literal which should be converted into a node.
+
+Neither the subject nor the predicate can contain a `"`, so the first `"` on the line begins the object literal.
+"""
+_N_TRIPLES_DATA_TYPE_TO_BE_CONVERTED = re.compile(
+    r"\^\^<https://w3id\.org/marco-bolo/Convert(?:MboId|Iri)ToNode>\s*\.\s*$"
+)
+_N_TRIPLES_ESCAPE_SEQUENCE = re.compile(
+    r"\\(?:u(?P<u>[0-9A-Fa-f]{4})|U(?P<U>[0-9A-Fa-f]{8})|(?P<echar>[tbnrf\"'\\]))"
+)
+_N_TRIPLES_ECHARS = {
+    "t": "\t",
+    "b": "\b",
+    "n": "\n",
+    "r": "\r",
+    "f": "\f",
+    '"': '"',
+    "'": "'",
+    "\\": "\\",
+}
+_INVALID_IRI_CHARACTERS = re.compile(r'[\x00-\x20<>"{}|^`\\]')
+"""
+Characters which may not appear in an N-Triples IRIREF.
+"""
 
 
 @click.command()
+@click.option(
+    "--streaming",
+    is_flag=True,
+    default=False,
+    help="Rewrite an N-Triples TTL_FILE line by line instead of loading it into memory.",
+)
+@click.option(
+    "--output-format",
+    type=click.Choice(["ttl", "nt"]),
+    default="ttl",
+    show_default=True,
+    help="Write pretty Turtle, or N-Triples (which is also valid Turtle) which is much faster to serialize. "
+    "Streaming always writes N-Triples.",
+)
 @click.argument("ttl_file", type=click.Path(exists=True))
-def main(ttl_file: click.Path):
+def main(ttl_file: click.Path, streaming: bool, output_format: str):
     """
     Loads the TTL_FILE and transforms all literals of type <https://w3id.org/marco-bolo/ConvertMboIdToNode> and
         <https://w3id.org/marco-bolo/ConvertIriToNode> into references to nodes in the graph.
+
+    TTL_FILE is only rewritten if there is something to convert, and is replaced atomically so that a failure never
+        leaves it half-written.
+
+    A value which can't be written as an N-Triples IRI, i.e. one containing whitespace, a control character or any of
+        <>"{}|^`\\, is an error rather than being converted into an invalid IRI.
     """
-    _convert_literals_to_nodes_in_file(Path(str(ttl_file)))
+    if streaming:
+        _convert_literals_to_nodes_in_n_triples_file(Path(str(ttl_file)))
+    else:
+        _convert_literals_to_nodes_in_file(Path(str(ttl_file)), output_format)
 
 
-def _convert_literals_to_nodes_in_file(ttl_file: Path) -> None:
+def _convert_literals_to_nodes_in_file(
+    ttl_file: Path, output_format: str = "ttl"
+) -> None:
     ttl_file = ttl_file.resolve()
 
     graph = rdflib.Graph()
@@ -33,57 +117,148 @@ def _convert_literals_to_nodes_in_file(ttl_file: Path) -> None:
 
     if num_to_be_converted > 0:
         graph = _update_literals_to_nodes_in_graph_assert_success(graph)
-        graph.serialize(ttl_file, format="ttl")
+        with _replace_atomically(ttl_file) as temp_file:
+            graph.serialize(temp_file, format=output_format, encoding="utf-8")
+
+
+@contextmanager
+def _replace_atomically(file: Path) -> Iterator[Path]:
+    """
+    Yields a temporary file alongside `file` to write to. It replaces `file` once the block completes successfully and
+    is removed otherwise. If the block removes the temporary file itself, `file` is left as it is.
+    """
+    temp_file = file.with_name(f"{file.name}.{os.getpid()}.tmp")
+    try:
+        yield temp_file
+    except BaseException:
+        temp_file.unlink(missing_ok=True)
+        raise
+
+    if temp_file.exists():
+        temp_file.replace(file)
 
 
 def _update_literals_to_nodes_in_graph_assert_success(
     graph: rdflib.Graph,
 ) -> rdflib.Graph:
-    graph.update(
-        """
-        DELETE {
-            ?s ?p ?nodePID.
-        }
-        INSERT {
-            ?s ?p ?uriNode.
-        }
-        WHERE {
-            {
-                # Map literals of type <https://w3id.org/marco-bolo/ConvertMboIdToNode> into full MBO PIDs pointing at resources.
-                ?s ?p ?nodePID.
-                FILTER(datatype(?nodePID) = <https://w3id.org/marco-bolo/ConvertMboIdToNode>).
-                BIND (URI( CONCAT("https://w3id.org/marco-bolo/", STR(?nodePID))) as ?uriNode).
-            } UNION {
-                # Map literals of type <https://w3id.org/marco-bolo/ConvertIriToNode> into IRIs pointing at resources.
-                ?s ?p ?nodePID.
-                FILTER(datatype(?nodePID) = <https://w3id.org/marco-bolo/ConvertIriToNode>).
-                BIND(URI(STR(?nodePID)) as ?uriNode).
-            }
-        }
-    """
-    )
+    triples_to_be_converted = _get_triples_to_be_converted_in_graph(graph)
+
+    # Every literal is converted before the graph is modified, so an invalid IRI leaves the graph as it was.
+    converted_triples = [
+        (s, p, _convert_literal_to_node(o))  # type: ignore
+        for (s, p, o) in triples_to_be_converted
+    ]
 
-    num_remaining = _get_number_to_be_converted_in_graph(graph)
-    if num_remaining != 0:
-        raise Exception(f"Failed to convert {num_remaining}literals.")
+    graph -= triples_to_be_converted
+    graph += converted_triples
 
     return graph
 
 
+def _convert_literal_to_node(literal: Literal) -> URIRef:
+    """
+    Raises an exception if the literal doesn't give a valid IRI.
+    """
+    if literal.datatype == CONVERT_MBO_ID_TO_NODE_DATA_TYPE_URI:
+        iri = f"{MBO_URI_PREFIX}{literal}"
+    else:
+        iri = str(literal)
+
+    if _INVALID_IRI_CHARACTERS.search(iri) is not None:
+        raise Exception(
+            f"Failed to convert the literal '{literal}', '{iri}' is not a valid IRI."
+        )
+
+    return URIRef(iri)
+
+
 def _get_number_to_be_converted_in_graph(graph: rdflib.Graph) -> int:
-    results = list(
-        graph.query(
-            """
-        SELECT *
-        WHERE {
-            ?s ?p ?mboNodePID.
-            FILTER(datatype(?mboNodePID) IN (<https://w3id.org/marco-bolo/ConvertMboIdToNode>, <https://w3id.org/marco-bolo/ConvertIriToNode>)).
-        }
-        """
+    return len(_get_triples_to_be_converted_in_graph(graph))
+
+
+def _get_triples_to_be_converted_in_graph(graph: rdflib.Graph) -> List[Triple]:
+    """
+    Finds the triples whose objects are literals of type <https://w3id.org/marco-bolo/ConvertMboIdToNode> or
+    <https://w3id.org/marco-bolo/ConvertIriToNode> in a single pass over the graph.
+    """
+    data_types_to_be_converted = {
+        CONVERT_MBO_ID_TO_NODE_DATA_TYPE_URI,
+        CONVERT_IRI_TO_NODE_DATA_TYPE_URI,
+    }
+
+    return [
+        (s, p, o)
+        for (s, p, o) in graph
+        if isinstance(o, Literal) and o.datatype in data_types_to_be_converted
+    ]
+
+
+def _convert_literals_to_nodes_in_n_triples_file(n_triples_file: Path) -> None:
+    """
+    Converts the literals as they stream through, so memory use doesn't depend upon the size of the file.
+
+    The output is written to a temporary file which then replaces `n_triples_file`. If there was nothing to convert,
+    the temporary file is discarded so that `n_triples_file` (and its modification time) is left untouched.
+    """
+    n_triples_file = n_triples_file.resolve()
+
+    with _replace_atomically(n_triples_file) as temp_file:
+        any_converted = False
+        with open(n_triples_file, "r", encoding="utf-8") as f_in, open(
+            temp_file, "w", encoding="utf-8"
+        ) as f_out:
+            for line_number, line in enumerate(f_in, start=1):
+                converted_line = _convert_literal_to_node_in_n_triples_line(
+                    line, line_number
+                )
+                any_converted = any_converted or converted_line is not line
+                f_out.write(converted_line)
+
+        if not any_converted:
+            temp_file.unlink()
+
+
+def _convert_literal_to_node_in_n_triples_line(line: str, line_number: int) -> str:
+    """
+    Returns `line` itself where there is nothing on it to convert.
+    """
+    if not any(marker in line for marker in _N_TRIPLES_DATA_TYPE_MARKERS):
+        return line
+
+    match = _N_TRIPLES_LITERAL_TO_BE_CONVERTED.match(line)
+    if match is None and _N_TRIPLES_DATA_TYPE_TO_BE_CONVERTED.search(line) is None:
+        # The data type's IRI only appears inside some other literal's text.
+        return line
+    elif match is None:
+        raise Exception(
+            f"Failed to convert the literal on line {line_number}. Is it an N-Triples statement?"
         )
-    )
 
-    return len(results)
+    value = _unescape_n_triples_string(match.group("lexical_form"))
+    if match.group("data_type") == str(CONVERT_MBO_ID_TO_NODE_DATA_TYPE_URI):
+        iri = f"{MBO_URI_PREFIX}{value}"
+    else:
+        iri = value
+
+    if _INVALID_IRI_CHARACTERS.search(iri) is not None:
+        raise Exception(
+            f"Failed to convert the literal on line {line_number}, '{iri}' is not a valid IRI."
+        )
+
+    return f"{match.group('subject_predicate')}<{iri}> .\n"
+
+
+def _unescape_n_triples_string(escaped: str) -> str:
+    if "\\" not in escaped:
+        return escaped
+
+    def _unescape(match: re.Match) -> str:
+        code_point = match.group("u") or match.group("U")
+        if code_point is not None:
+            return chr(int(code_point, 16))
+        return _N_TRIPLES_ECHARS[match.group("echar")]
+
+    return _N_TRIPLES_ESCAPE_SEQUENCE.sub(_unescape, escaped)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+"""
+parallel
+--------
+
+Fans independent pieces of work out across a pool of worker processes.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class TaskFailures(Exception):
+    """
+    Raised once all tasks have been attempted, describing every task which failed.
+    """
+
+    def __init__(self, failures: Dict[str, BaseException]):
+        self.failures = failures
+        failure_descriptions = "".join(
+            f"\n  {key}: {type(error).__name__}: {error}"
+            for key, error in sorted(failures.items())
+        )
+        super().__init__(f"{len(failures)} task(s) failed:{failure_descriptions}")
+
+
+def run_tasks(
+    function: Callable[..., T], tasks: Dict[str, Tuple[Any, ...]], jobs: int
+) -> Dict[str, T]:
+    """
+    Calls `function(*args)` for each of the `tasks`, spread over `jobs` worker processes where `jobs > 1`.
+
+    `function` and its arguments must be picklable. The results are keyed in the same order as `tasks` whatever
+    order the tasks complete in. Every task is attempted even if some of them fail, the failures are then raised
+    together in a `TaskFailures` exception.
+    """
+    results: Dict[str, T] = {}
+    failures: Dict[str, BaseException] = {}
+
+    if jobs <= 1:
+        for key, args in tasks.items():
+            try:
+                results[key] = function(*args)
+            except Exception as e:
+                failures[key] = e
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                key: executor.submit(function, *args) for key, args in tasks.items()
+            }
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception as e:
+                    failures[key] = e
+
+    if any(failures):
+        raise TaskFailures(failures)
+
+    return results
@@ -5,12 +5,46 @@ partition
 Partitions ttl files into multiple JSON-LD files with one subject per file.
 """
 
+import hashlib
+import json
+import math
+import zlib
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Set
+from tempfile import TemporaryDirectory
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import click
 import rdflib
+from rdflib.term import Node, URIRef
+
+from mbocsvwscripts.parallel import run_tasks
+
+Triple = Tuple[Node, Node, Node]
+
+_STREAMING_TARGET_SPILL_FILE_BYTES: int = 32 * 1024 * 1024
+"""
+The approximate size each spill file should be when partitioning in streaming mode.
+
+Only one spill file's worth of triples is held in memory at a time.
+"""
+_STREAMING_SPILL_BUFFER_BYTES: int = 8 * 1024 * 1024
+"""
+How many bytes of N-Triples lines are buffered in memory before being appended to the spill files.
+"""
+
+
+@dataclass
+class PartitionFiles:
+    digests: Dict[Path, str]
+    """
+    The content digest (see `_get_partition_digest`) of every partition file.
+    """
+    written: Set[Path]
+    """
+    The partition files which were (re)written, i.e. excluding those whose content was unchanged.
+    """
 
 
 @click.group()
@@ -27,35 +61,269 @@ def main():
 @click.option(
     "-o", "--out", required=False, type=click.Path(), show_default=True, default="."
 )
+@click.option(
+    "--streaming",
+    is_flag=True,
+    default=False,
+    help="Stream an N-Triples BULK_TTL_FILE through temporary spill files instead of loading it into memory.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The number of worker processes to serialize and write partitions with.",
+)
 @click.argument("bulk_ttl_file", type=click.Path(exists=True))
-def partition(out: click.Path, bulk_ttl_file: click.Path):
+def partition(out: click.Path, bulk_ttl_file: click.Path, streaming: bool, jobs: int):
     """
     Takes a BULK_TTL_FILE and splits it into one JSON-LD file per unique URI.
 
     Hash-URIs end up in the same file.
     """
-    _partition_to_individual_files(Path(str(bulk_ttl_file)), Path(str(out)))
+    if streaming:
+        _partition_to_individual_files_streaming(
+            Path(str(bulk_ttl_file)), Path(str(out)), jobs=jobs
+        )
+    else:
+        _partition_to_individual_files(
+            Path(str(bulk_ttl_file)), Path(str(out)), jobs=jobs
+        )
+
+
+@main.command("split")
+@click.option(
+    "-o", "--out", required=False, type=click.Path(), show_default=True, default="."
+)
+@click.option(
+    "-m",
+    "--manifest",
+    required=True,
+    type=click.Path(),
+    help="The JSON manifest file to record the generated partition files in.",
+)
+@click.option(
+    "--streaming",
+    is_flag=True,
+    default=False,
+    help="Stream an N-Triples BULK_TTL_FILE through temporary spill files instead of loading it into memory.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The number of worker processes to serialize and write partitions with.",
+)
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Rewrite every partition file, even those whose content is unchanged.",
+)
+@click.argument("bulk_ttl_file", type=click.Path(exists=True))
+def split(
+    out: click.Path,
+    manifest: click.Path,
+    bulk_ttl_file: click.Path,
+    streaming: bool,
+    jobs: int,
+    force: bool,
+):
+    """
+    Takes a BULK_TTL_FILE, splits it into one JSON-LD file per unique URI and records the files generated in the
+    MANIFEST so that `list` can answer without parsing BULK_TTL_FILE again.
+
+    Hash-URIs end up in the same file.
+
+    The MANIFEST also records a digest of each partition's triples. Partition files whose triples are unchanged since
+    the last split are left untouched so that their modification times don't trigger downstream rebuilds. The files
+    which were (re)written are printed.
+    """
+    partition_files = _split_to_individual_files(
+        Path(str(bulk_ttl_file)),
+        Path(str(out)),
+        Path(str(manifest)),
+        streaming,
+        jobs=jobs,
+        force=force,
+    )
+
+    cwd = Path(".").absolute()
+    for output_file in sorted(partition_files.written):
+        print(output_file.absolute().relative_to(cwd))
 
 
 @main.command("list")
 @click.option(
     "-o", "--out", required=False, type=click.Path(), show_default=True, default="."
 )
+@click.option(
+    "-m",
+    "--manifest",
+    required=False,
+    type=click.Path(),
+    help="A JSON manifest file (see `split`) used to cache the partition files for BULK_TTL_FILE.",
+)
+@click.option(
+    "--streaming",
+    is_flag=True,
+    default=False,
+    help="Stream an N-Triples BULK_TTL_FILE instead of loading it into memory.",
+)
 @click.argument("bulk_ttl_file", type=click.Path(exists=True))
-def list_partition_files_out(out: click.Path, bulk_ttl_file: click.Path):
+def list_partition_files_out(
+    out: click.Path,
+    manifest: Optional[click.Path],
+    bulk_ttl_file: click.Path,
+    streaming: bool,
+):
     """
     Takes a BULK_TTL_FILE and lists the hypothetical JSON-LD files that it would be generated when the triples
     were split into one file per URI.
 
     Hash-URIs end up in the same file.
+
+    If a MANIFEST is given which was generated from identical BULK_TTL_FILE contents, the files are listed from the
+    manifest without parsing BULK_TTL_FILE.
     """
+    if manifest is None:
+        list_partition_files = (
+            _list_partition_files_out_streaming
+            if streaming
+            else _list_partition_files_out
+        )
+        partition_files = list_partition_files(Path(str(bulk_ttl_file)), Path(str(out)))
+    else:
+        partition_files = _list_partition_files_out_cached(
+            Path(str(bulk_ttl_file)), Path(str(out)), Path(str(manifest)), streaming
+        )
+
     cwd = Path(".").absolute()
-    for output_file in _list_partition_files_out(
-        Path(str(bulk_ttl_file)), Path(str(out))
-    ):
+    for output_file in partition_files:
         print(output_file.absolute().relative_to(cwd))
 
 
+def _split_to_individual_files(
+    bulk_ttl_file: Path,
+    out_folder: Path,
+    manifest_file: Path,
+    streaming: bool,
+    jobs: int = 1,
+    force: bool = False,
+) -> PartitionFiles:
+    bulk_ttl_file_hash = _get_file_sha256(bulk_ttl_file)
+    previous_digests = (
+        {} if force else _read_partition_manifest_digests(manifest_file, out_folder)
+    )
+
+    if (
+        any(previous_digests)
+        and _read_partition_manifest(manifest_file, bulk_ttl_file_hash) is not None
+        and all(p.exists() for p in previous_digests)
+    ):
+        # The bulk file is identical to the one last split and every partition file still exists.
+        return PartitionFiles(digests=previous_digests, written=set())
+
+    partition_to_individual_files = (
+        _partition_to_individual_files_streaming
+        if streaming
+        else _partition_to_individual_files
+    )
+    partition_files = partition_to_individual_files(
+        bulk_ttl_file, out_folder, jobs=jobs, previous_digests=previous_digests
+    )
+
+    _write_partition_manifest(
+        manifest_file, bulk_ttl_file, bulk_ttl_file_hash, partition_files.digests
+    )
+
+    return partition_files
+
+
+def _list_partition_files_out_cached(
+    bulk_ttl_file: Path, out_folder: Path, manifest_file: Path, streaming: bool
+) -> Set[Path]:
+    bulk_ttl_file_hash = _get_file_sha256(bulk_ttl_file)
+
+    partition_file_names = _read_partition_manifest(manifest_file, bulk_ttl_file_hash)
+    if partition_file_names is not None:
+        return {out_folder / file_name for file_name in partition_file_names}
+
+    list_partition_files = (
+        _list_partition_files_out_streaming if streaming else _list_partition_files_out
+    )
+    return list_partition_files(bulk_ttl_file, out_folder)
+
+
+def _write_partition_manifest(
+    manifest_file: Path,
+    bulk_ttl_file: Path,
+    bulk_ttl_file_hash: str,
+    partition_digests: Dict[Path, str],
+) -> None:
+    """
+    Partition file names are recorded relative to the output folder since they only depend upon the subjects in the
+    bulk file.
+    """
+    manifest = {
+        "bulkFile": str(bulk_ttl_file),
+        "bulkFileSha256": bulk_ttl_file_hash,
+        "partitionDigests": {
+            p.name: digest
+            for p, digest in sorted(partition_digests.items(), key=lambda i: i[0].name)
+        },
+    }
+
+    manifest_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_file, "w") as f:
+        json.dump(manifest, f, indent=4)
+
+
+def _read_partition_manifest(
+    manifest_file: Path, bulk_ttl_file_hash: str
+) -> Optional[List[str]]:
+    """
+    Returns the partition file names recorded in the manifest, or `None` where the manifest is missing or was
+    generated from a different version of the bulk file.
+    """
+    if not manifest_file.exists():
+        return None
+
+    with open(manifest_file, "r") as f:
+        manifest = json.load(f)
+
+    if manifest.get("bulkFileSha256") != bulk_ttl_file_hash:
+        return None
+
+    return list(manifest["partitionDigests"].keys())
+
+
+def _read_partition_manifest_digests(
+    manifest_file: Path, out_folder: Path
+) -> Dict[Path, str]:
+    """
+    Returns the digests of the partitions as they were last written, whichever version of the bulk file they came from.
+    """
+    if not manifest_file.exists():
+        return {}
+
+    with open(manifest_file, "r") as f:
+        manifest = json.load(f)
+
+    return {
+        out_folder / file_name: digest
+        for file_name, digest in manifest.get("partitionDigests", {}).items()
+    }
+
+
+def _get_file_sha256(file: Path) -> str:
+    with open(file, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
 def _list_partition_files_out(bulk_ttl_file: Path, out_folder: Path) -> Set[Path]:
     bulk_ttl_graph = rdflib.Graph()
     bulk_ttl_graph.parse(bulk_ttl_file, format="ttl")
@@ -66,70 +334,239 @@ def _list_partition_files_out(bulk_ttl_file: Path, out_folder: Path) -> Set[Path
     }
 
 
-def _partition_to_individual_files(bulk_ttl_file: Path, out_folder: Path) -> None:
+def _partition_to_individual_files(
+    bulk_ttl_file: Path,
+    out_folder: Path,
+    jobs: int = 1,
+    previous_digests: Optional[Dict[Path, str]] = None,
+) -> PartitionFiles:
     bulk_ttl_graph = rdflib.Graph()
     bulk_ttl_graph.parse(bulk_ttl_file, format="ttl")
 
-    for part in _get_partition_uri_prefixes(bulk_ttl_graph):
-        partitioned_triples = _partition_triples(bulk_ttl_graph, part)
+    return _write_partitions(
+        {
+            _get_partition_file_path(out_folder, part): partitioned_triples
+            for part, partitioned_triples in _partition_triples(bulk_ttl_graph).items()
+        },
+        jobs,
+        previous_digests,
+    )
+
+
+def _list_partition_files_out_streaming(
+    bulk_n_triples_file: Path, out_folder: Path
+) -> Set[Path]:
+    return {
+        _get_partition_file_path(out_folder, part)
+        for part in {part for (part, _) in _read_n_triples_lines(bulk_n_triples_file)}
+    }
 
-        partition_file_path = _get_partition_file_path(out_folder, part)
-        partitioned_triples.serialize(partition_file_path, format="json-ld")
 
+def _partition_to_individual_files_streaming(
+    bulk_n_triples_file: Path,
+    out_folder: Path,
+    target_spill_file_bytes: int = _STREAMING_TARGET_SPILL_FILE_BYTES,
+    jobs: int = 1,
+    previous_digests: Optional[Dict[Path, str]] = None,
+) -> PartitionFiles:
+    """
+    Partitions an N-Triples file without ever loading the whole graph into memory.
+
+    The triples for a given partition can be spread throughout the file, so each line is first hash-spilled into one
+    of a number of temporary files according to its partition. Every partition's triples then live in exactly one
+    spill file, which is small enough to be grouped and serialized in memory.
+    """
+    num_spill_files = max(
+        1, math.ceil(bulk_n_triples_file.stat().st_size / target_spill_file_bytes)
+    )
+
+    partition_files = PartitionFiles(digests={}, written=set())
+    with TemporaryDirectory() as spill_dir:
+        spill_files = _spill_n_triples_lines_by_partition(
+            bulk_n_triples_file, Path(spill_dir), num_spill_files
+        )
+
+        for spill_file in spill_files:
+            partitioned_lines: Dict[str, List[str]] = {}
+            for part, line in _read_n_triples_lines(spill_file):
+                partitioned_lines.setdefault(part, []).append(line)
+
+            spill_file_partition_files = _write_partitions(
+                {
+                    _get_partition_file_path(out_folder, part): list(
+                        rdflib.Graph().parse(data="\n".join(lines), format="nt")
+                    )
+                    for part, lines in partitioned_lines.items()
+                },
+                jobs,
+                previous_digests,
+            )
+            partition_files.digests |= spill_file_partition_files.digests
+            partition_files.written |= spill_file_partition_files.written
+
+    return partition_files
+
+
+def _spill_n_triples_lines_by_partition(
+    bulk_n_triples_file: Path, spill_dir: Path, num_spill_files: int
+) -> List[Path]:
+    spill_files = [spill_dir / f"{i}.nt" for i in range(num_spill_files)]
+    for spill_file in spill_files:
+        spill_file.touch()
+
+    buffered_lines: Dict[int, List[str]] = {}
+    buffered_bytes = 0
+
+    def _flush_buffered_lines():
+        for spill_file_index, lines in buffered_lines.items():
+            with open(spill_files[spill_file_index], "a", encoding="utf-8") as f:
+                f.writelines(lines)
+        buffered_lines.clear()
+
+    for part, line in _read_n_triples_lines(bulk_n_triples_file):
+        spill_file_index = zlib.crc32(part.encode("utf-8")) % num_spill_files
+        buffered_lines.setdefault(spill_file_index, []).append(line + "\n")
+        buffered_bytes += len(line) + 1
+        if buffered_bytes >= _STREAMING_SPILL_BUFFER_BYTES:
+            _flush_buffered_lines()
+            buffered_bytes = 0
+
+    _flush_buffered_lines()
+
+    return spill_files
+
+
+def _read_n_triples_lines(n_triples_file: Path) -> Iterator[Tuple[str, str]]:
+    """
+    Yields each N-Triples statement in the file along with the partition its subject belongs to.
 
-def _get_partition_file_path(out_folder: Path, part: rdflib.term.Identifier) -> Path:
-    url_slug = Path(urlparse(str(part)).path).parts[-1]
+    Statements about blank nodes are skipped since they have no URI to partition on.
+    """
+    with open(n_triples_file, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            line = line.strip()
+            if not line or line.startswith("#") or line.startswith("_:"):
+                continue
+
+            if not line.startswith("<") or ">" not in line:
+                raise Exception(
+                    f"Line {line_number} of {n_triples_file} is not an N-Triples statement. Streaming partitioning "
+                    "requires N-Triples input."
+                )
+
+            subject = line[1 : line.index(">")]
+            yield str(_get_partition_uri_prefix(URIRef(subject))), line
+
+
+def _get_partition_file_path(out_folder: Path, part: str) -> Path:
+    url_slug = Path(urlparse(part).path).parts[-1]
     return out_folder / f"{url_slug}.json"
 
 
-def _partition_triples(bulk_ttl_graph: rdflib.Graph, part: rdflib.term.Identifier):
-    partitioned_triples_graph = rdflib.Graph()
-    partitioned_triple_results = bulk_ttl_graph.query(
-        """
-            prefix schema: <https://schema.org/>
-            prefix goos: <https://goosocean.org/document/>
-            prefix mbo: <https://w3id.org/marco-bolo/>
-            
-            CONSTRUCT {
-                ?s ?p ?o.
-            }
-            WHERE { 
-                ?s ?p ?o.
-                FILTER(str(?s) = ?v || strbefore(str(?s), '#') = ?v)
-            }
-        """,
-        initBindings={"v": part},
+def _write_partitions(
+    partitions: Dict[Path, List[Triple]],
+    jobs: int,
+    previous_digests: Optional[Dict[Path, str]] = None,
+) -> PartitionFiles:
+    """
+    Serializes each partition to its JSON-LD file, spreading the work over `jobs` worker processes.
+
+    Partitions whose digest matches `previous_digests` are not rewritten, so long as their file still exists.
+
+    Raises a `TaskFailures` exception listing every partition which could not be written.
+    """
+    previous_digests = previous_digests or {}
+    digests = {
+        partition_file_path: _get_partition_digest(partitioned_triples)
+        for partition_file_path, partitioned_triples in partitions.items()
+    }
+    partitions_to_write = {
+        partition_file_path: partitioned_triples
+        for partition_file_path, partitioned_triples in partitions.items()
+        if previous_digests.get(partition_file_path) != digests[partition_file_path]
+        or not partition_file_path.exists()
+    }
+
+    run_tasks(
+        _serialize_partition,
+        {
+            str(partition_file_path): (partitioned_triples, partition_file_path)
+            for partition_file_path, partitioned_triples in partitions_to_write.items()
+        },
+        jobs,
+    )
+
+    return PartitionFiles(digests=digests, written=set(partitions_to_write.keys()))
+
+
+def _get_partition_digest(partitioned_triples: List[Triple]) -> str:
+    """
+    A canonical hash of the partition's triples which doesn't depend upon the order they were found in.
+    """
+    sorted_statements = sorted(
+        " ".join(term.n3() for term in triple) for triple in partitioned_triples
     )
+    return hashlib.sha256("\n".join(sorted_statements).encode("utf-8")).hexdigest()
 
-    for partitioned_triple in partitioned_triple_results:
+
+def _serialize_partition(
+    partitioned_triples: List[Triple], partition_file_path: Path
+) -> None:
+    partitioned_triples_graph = rdflib.Graph()
+    for partitioned_triple in partitioned_triples:
         partitioned_triples_graph.add(partitioned_triple)
 
-    return partitioned_triples_graph
-
-
-def _get_partition_uri_prefixes(
-    bulk_ttl_graph: rdflib.Graph,
-) -> Set[rdflib.term.Identifier]:
-    partition_results = list(
-        bulk_ttl_graph.query(
-            """
-                SELECT DISTINCT ?partition WHERE {
-                     { 
-                        # Strip the hash parts off URLs where they exist
-                        ?s ?p ?o. 
-                        FILTER (contains(str(?s), '#')). 
-                        BIND (strbefore(str(?s), '#') as ?partition). 
-                    } UNION 
-                    { 
-                        ?s ?p ?o. 
-                        FILTER (! contains(str(?s), '#')). 
-                        BIND(str(?s) as ?partition). 
-                    } 
-                }
-            """
+    nodes = json.loads(partitioned_triples_graph.serialize(format="json-ld"))
+    # rdflib orders the top-level nodes by iterating over a set of subjects, which varies between processes. Sorting
+    # them keeps the output identical however (and wherever) the partition is serialized.
+    nodes.sort(key=lambda node: node.get("@id", ""))
+
+    with open(partition_file_path, "w", encoding="utf-8") as f:
+        json.dump(
+            nodes,
+            f,
+            indent=2,
+            separators=(",", ": "),
+            sort_keys=True,
+            ensure_ascii=False,
         )
-    )
-    return {r.asdict()["partition"] for r in partition_results}
+
+
+def _partition_triples(bulk_ttl_graph: rdflib.Graph) -> Dict[str, List[Triple]]:
+    """
+    Buckets every triple in the graph by the partition its subject belongs to in a single pass over the graph.
+
+    Triples are kept in the graph's iteration order so that the serialized partitions are stable.
+    """
+    partitions: Dict[str, List[Triple]] = {}
+    for triple in bulk_ttl_graph:
+        part = _get_partition_uri_prefix(triple[0])
+        if part is not None:
+            partitions.setdefault(part, []).append(triple)
+
+    return partitions
+
+
+def _get_partition_uri_prefixes(bulk_ttl_graph: rdflib.Graph) -> Set[str]:
+    partitions: Set[str] = set()
+    for subject in bulk_ttl_graph.subjects(unique=True):
+        part = _get_partition_uri_prefix(subject)
+        if part is not None:
+            partitions.add(part)
+
+    return partitions
+
+
+def _get_partition_uri_prefix(subject: Node) -> Optional[str]:
+    """
+    Strips the hash part off a subject's URI where it exists, so hash-URIs end up in the same partition as their parent.
+
+    Blank nodes have no URI to partition on, so `None` is returned for them.
+    """
+    if not isinstance(subject, URIRef):
+        return None
+
+    return str(subject).split("#", 1)[0]
 
 
 if __name__ == "__main__":
@@ -5,16 +5,20 @@ processparametadata
 Generate metadata describing the JSON-LD output. Augment (and improve the structure of input metadata that already exists.)
 """
 
+import json
 from datetime import date
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Any, Dict, Optional, Tuple, List
 
 import click
 import rdflib
+from pyld import jsonld
 from rdflib.namespace import Namespace, RDF
 from rdflib.term import Node, URIRef, Literal
 from rdflib.util import guess_format
 
+from mbocsvwscripts.parallel import run_tasks
+
 MBO: Namespace = Namespace("https://w3id.org/marco-bolo/")
 SCHEMA: Namespace = Namespace("https://schema.org/")
 
@@ -39,10 +43,18 @@ The URI Persistent Identifier for the MARCO-BOLO Organization.
 @click.argument("metadata_file", type=click.Path(exists=True))
 @click.argument("para_metadata_file_out", type=click.Path())
 @click.option("-g", "--git_repo_commit_file_url", type=str, required=False)
+@click.option(
+    "--frame",
+    "frame_file",
+    required=False,
+    type=click.Path(exists=True),
+    help="A JSON-LD frame to apply to the para-metadata before it is written out as JSON-LD.",
+)
 def main(
     metadata_file: click.Path,
     para_metadata_file_out: click.Path,
     git_repo_commit_file_url: Optional[str] = None,
+    frame_file: Optional[click.Path] = None,
 ) -> None:
     """
     1. Generates metadata describing the JSON-LD output generated in this build process.
@@ -54,6 +66,106 @@ def main(
         Path(str(para_metadata_file_out)),
         date.today(),
         git_repo_commit_file_url,
+        _read_frame(frame_file),
+    )
+
+
+@click.command("augment-batch")
+@click.argument("metadata_files", nargs=-1, type=click.Path(exists=True))
+@click.option(
+    "-f",
+    "--file-list",
+    required=False,
+    type=click.File("r"),
+    help="A file listing further (whitespace separated) METADATA_FILES to process. Use `-` to read from stdin.",
+)
+@click.option(
+    "-s",
+    "--suffix",
+    type=str,
+    show_default=True,
+    default="-input-metadata.json",
+    help="Each METADATA_FILE's para-metadata is written alongside it, named after it with this suffix.",
+)
+@click.option("-g", "--git_repo_commit_file_url", type=str, required=False)
+@click.option(
+    "--frame",
+    "frame_file",
+    required=False,
+    type=click.Path(exists=True),
+    help="A JSON-LD frame to apply to the para-metadata before it is written out as JSON-LD.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="The number of worker processes to process files with.",
+)
+def batch(
+    metadata_files: List[click.Path],
+    file_list: Optional[click.File],
+    suffix: str,
+    git_repo_commit_file_url: Optional[str],
+    frame_file: Optional[click.Path],
+    jobs: int,
+) -> None:
+    """
+    Does the same as `processparametadata` for each of the METADATA_FILES within a single process.
+
+    e.g. `mbo_some_thing.json` has its para-metadata written to `mbo_some_thing-input-metadata.json`.
+    """
+    input_files = [Path(str(f)) for f in metadata_files]
+    if file_list is not None:
+        input_files += [Path(f) for f in file_list.read().split()]
+
+    _process_para_metadata_files(
+        {
+            metadata_file: metadata_file.with_name(f"{metadata_file.stem}{suffix}")
+            for metadata_file in input_files
+        },
+        date.today(),
+        git_repo_commit_file_url,
+        jobs,
+        _read_frame(frame_file),
+    )
+
+
+def _read_frame(frame_file: Optional[click.Path]) -> Optional[Dict[str, Any]]:
+    if frame_file is None:
+        return None
+
+    with open(str(frame_file), "r") as f:
+        return json.load(f)
+
+
+def _process_para_metadata_files(
+    metadata_files_out: Dict[Path, Path],
+    dt_stamp: date,
+    git_repo_commit_file_url: Optional[str] = None,
+    jobs: int = 1,
+    frame: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Calls `_process_para_metadata` for each of the keys of `metadata_files_out`, writing the para-metadata to the
+    corresponding value.
+
+    Raises a `TaskFailures` exception listing every file which could not be processed.
+    """
+    run_tasks(
+        _process_para_metadata,
+        {
+            str(metadata_file): (
+                metadata_file,
+                para_metadata_file_out,
+                dt_stamp,
+                git_repo_commit_file_url,
+                frame,
+            )
+            for metadata_file, para_metadata_file_out in metadata_files_out.items()
+        },
+        jobs,
     )
 
 
@@ -62,7 +174,11 @@ def _process_para_metadata(
     para_metadata_file_out: Path,
     dt_stamp: date,
     git_repo_commit_file_url: Optional[str] = None,
+    frame: Optional[Dict[str, Any]] = None,
 ) -> None:
+    """
+    Where a JSON-LD `frame` is given, the para-metadata is framed and written to `para_metadata_file_out` as JSON-LD.
+    """
     input_graph, input_metadata_triples = _extract_input_metadata_triples_and_remove(
         metadata_file
     )
@@ -78,10 +194,19 @@ def _process_para_metadata(
         git_repo_commit_file_url,
     )
 
-    # Write everything out to disk now that we're confident it'll work.
-    para_metadata_graph.serialize(
-        para_metadata_file_out, format=guess_format(str(para_metadata_file_out))
-    )
+    # Write everything out to disk now that we're confident it'll work. The para-metadata is framed before anything is
+    # written.
+    if frame is not None:
+        framed_para_metadata = jsonld.frame(
+            json.loads(para_metadata_graph.serialize(format="json-ld")), frame
+        )
+        with open(para_metadata_file_out, "w", encoding="utf-8") as f:
+            # Like the `jsonld frame` CLI, non-ASCII characters are written as they are rather than escaped.
+            json.dump(framed_para_metadata, f, indent=2, ensure_ascii=False)
+    else:
+        para_metadata_graph.serialize(
+            para_metadata_file_out, format=guess_format(str(para_metadata_file_out))
+        )
     # Do this last, incase something fails earlier and the user needs to retry.
     input_graph.serialize(metadata_file, format=guess_format(str(metadata_file)))
 
@@ -205,32 +330,18 @@ def _extract_input_metadata_triples_and_remove(
 ) -> Tuple[rdflib.Graph, List[Tuple[Node, Node, Node]]]:
     input_graph = rdflib.Graph()
     input_graph.parse(metadata_file)
-    input_metadata_triples = list(
-        input_graph.query(
-            f"""
-        prefix mbo: <https://w3id.org/marco-bolo/>
-        prefix schema: <https://schema.org/>
-        
-        CONSTRUCT {{
-            ?inputMetadata ?p ?o.
-        }}
-        WHERE {{
-            ?inputMetadata a <{INPUT_METADATA_DATA_TYPE_URI}>;
-                           ?p ?o.
-        }}
-    """
+
+    # Equivalent to `CONSTRUCT { ?inputMetadata ?p ?o. } WHERE { ?inputMetadata a mbo:InputMetadataDescription; ?p ?o. }`
+    # followed by the corresponding `DELETE WHERE`, without the overhead of parsing and evaluating SPARQL.
+    input_metadata_triples = [
+        triple
+        for input_metadata in input_graph.subjects(
+            RDF.type, INPUT_METADATA_DATA_TYPE_URI, unique=True
         )
-    )
+        for triple in input_graph.triples((input_metadata, None, None))
+    ]
 
-    input_graph.update(
-        f"""
-        DELETE 
-        WHERE {{
-            ?inputMetadata a <{INPUT_METADATA_DATA_TYPE_URI}>;
-                           ?p ?o.
-        }}
-    """
-    )
+    input_graph -= input_metadata_triples
 
     return input_graph, input_metadata_triples
 
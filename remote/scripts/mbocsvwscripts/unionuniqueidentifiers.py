@@ -10,7 +10,13 @@ complete set of permitted MBO identifiers for both of these types. We can then p
 foreign key constraints.
 """
 
-from typing import Tuple, List, Set
+import csv
+import filecmp
+import heapq
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Iterable, Iterator, List, Optional, Set, Tuple
 
 import click
 
@@ -23,33 +29,131 @@ import click
     default="MBO PID",
     help="The identifiers column title in the output CSV file.",
 )
+@click.option(
+    "--max-identifiers-in-memory",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Sort the identifiers in chunks of this size on disk, rather than all at once in memory.",
+)
 @click.argument("csv_files", type=click.Path(exists=True), nargs=-1)
-def main(out: click.Path, column_name: str, csv_files: Tuple[click.Path, ...]):
+def main(
+    out: click.Path,
+    column_name: str,
+    max_identifiers_in_memory: Optional[int],
+    csv_files: Tuple[click.Path, ...],
+):
     """
-    Do the thing please.
+    Writes the sorted union of the identifiers in each of the CSV_FILES to OUT.
+
+    OUT is left untouched where it already contains the same identifiers, so that make doesn't rebuild anything
+    which depends upon it.
 
     N.B. This script is dumb and requires that the MBO PID column is the first column in all
     input CSV files.
     """
-    _union_identifiers([Path(str(p)) for p in csv_files], Path(str(out)), column_name)
-
-
-from pathlib import Path
-
-
-import pandas as pd
+    out_file = Path(str(out))
+    if _union_identifiers(
+        [Path(str(p)) for p in csv_files],
+        out_file,
+        column_name,
+        max_identifiers_in_memory,
+    ):
+        print(f"Wrote {out_file}")
+    else:
+        print(f"{out_file} is unchanged")
 
 
 def _union_identifiers(
-    csv_files: List[Path], out_file: Path, pid_column_name: str
-) -> None:
-    mbo_identifiers: Set[str] = set()
-    for csv_file in csv_files:
-        df = pd.read_csv(csv_file)
-        mbo_identifiers |= set(df[df.columns[0]])
-
-    df_out = pd.DataFrame({pid_column_name: sorted(mbo_identifiers)})
-    df_out.to_csv(out_file, index=False)
+    csv_files: List[Path],
+    out_file: Path,
+    pid_column_name: str,
+    max_identifiers_in_memory: Optional[int] = None,
+) -> bool:
+    """
+    Returns whether the `out_file` was (re)written.
+    """
+    identifiers = (
+        identifier
+        for csv_file in csv_files
+        for identifier in _read_identifiers(csv_file)
+    )
+
+    temp_out_file = out_file.with_name(f"{out_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_out_file, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow([pid_column_name])
+            writer.writerows(
+                [identifier]
+                for identifier in _sort_unique(identifiers, max_identifiers_in_memory)
+            )
+
+        if out_file.exists() and filecmp.cmp(temp_out_file, out_file, shallow=False):
+            temp_out_file.unlink()
+            return False
+
+        temp_out_file.replace(out_file)
+        return True
+    except BaseException:
+        temp_out_file.unlink(missing_ok=True)
+        raise
+
+
+def _read_identifiers(csv_file: Path) -> Iterator[str]:
+    """
+    Yields the non-empty values in the first column of the `csv_file`, one row at a time.
+    """
+    with open(csv_file, "r", newline="", encoding="utf-8-sig") as f:
+        reader = csv.reader(f)
+        next(reader, None)  # The header
+        for row in reader:
+            if row and row[0] != "":
+                yield row[0]
+
+
+def _sort_unique(
+    values: Iterable[str], max_values_in_memory: Optional[int] = None
+) -> Iterator[str]:
+    if max_values_in_memory is None:
+        yield from sorted(set(values))
+        return
+
+    with TemporaryDirectory() as tmp_dir:
+        chunk_files = []
+        chunk: Set[str] = set()
+        for value in values:
+            chunk.add(value)
+            if len(chunk) >= max_values_in_memory:
+                chunk_files.append(
+                    _write_sorted_chunk(chunk, Path(tmp_dir), len(chunk_files))
+                )
+                chunk = set()
+        if any(chunk):
+            chunk_files.append(
+                _write_sorted_chunk(chunk, Path(tmp_dir), len(chunk_files))
+            )
+
+        previous_value = None
+        for value in heapq.merge(
+            *[_read_chunk(chunk_file) for chunk_file in chunk_files]
+        ):
+            # The same value may appear in more than one chunk.
+            if value != previous_value:
+                yield value
+                previous_value = value
+
+
+def _write_sorted_chunk(chunk: Set[str], tmp_dir: Path, chunk_number: int) -> Path:
+    chunk_file = tmp_dir / f"chunk-{chunk_number}.csv"
+    with open(chunk_file, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f, lineterminator="\n").writerows([value] for value in sorted(chunk))
+    return chunk_file
+
+
+def _read_chunk(chunk_file: Path) -> Iterator[str]:
+    with open(chunk_file, "r", newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            yield row[0]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,190 @@
+"""
+uritemplates
+------------
+
+Compiles the RFC 6570 URI templates used in CSV-W's `aboutUrl`, `propertyUrl` and `valueUrl` properties.
+
+A template is parsed once into a callable which expands it with a few string concatenations, rather than being parsed
+again for every cell. Level 2 templates are supported, i.e. simple (`{var}`), reserved (`{+var}`) and fragment
+(`{#var}`) expansion, with lists expanded as comma-separated values.
+"""
+
+import re
+from dataclasses import dataclass
+from string import ascii_letters, digits
+from typing import Callable, FrozenSet, List, Mapping, Tuple, Union
+from urllib.parse import quote
+
+CellValue = Union[None, str, List[str]]
+
+_URI_TEMPLATE_EXPRESSION = re.compile(r"\{([^{}]*)\}")
+_PERCENT_ENCODED_TRIPLET = re.compile(r"%[0-9A-Fa-f]{2}")
+_URI_TEMPLATE_RESERVED_CHARACTERS = ":/?#[]@!$&'()*+,;="
+_UNRESERVED_CHARACTERS = frozenset(ascii_letters + digits + "-._~")
+_UNRESERVED_OR_RESERVED_CHARACTERS = _UNRESERVED_CHARACTERS | frozenset(
+    _URI_TEMPLATE_RESERVED_CHARACTERS
+)
+"""
+Values made up of only these characters can be expanded as they are. Checking this with `issuperset` is much quicker
+than a regular expression, or `quote`.
+"""
+
+
+@dataclass(frozen=True)
+class CompiledUriTemplate:
+    template: str
+    variable_names: FrozenSet[str]
+    """
+    The names of the variables the template's expressions refer to.
+    """
+    literal_prefix: str
+    """
+    The literal text before the first expression, i.e. the part of every expansion which is known in advance.
+    """
+    expand: Callable[[Mapping[str, CellValue]], str]
+    """
+    Expands the template with the given variables' values. Missing, null and empty list values are undefined and expand
+    to nothing, whereas empty strings are defined (so `{#var}` still expands to `#`).
+    """
+
+    @property
+    def is_constant(self) -> bool:
+        return self.literal_prefix == self.template
+
+
+def compile_uri_template(template: str) -> CompiledUriTemplate:
+    """
+    Raises an exception if the template uses an operator other than `+` or `#`.
+    """
+    literals = _URI_TEMPLATE_EXPRESSION.split(template)[::2]
+    expressions = [
+        _parse_expression(match.group(1))
+        for match in _URI_TEMPLATE_EXPRESSION.finditer(template)
+    ]
+
+    return CompiledUriTemplate(
+        template=template,
+        variable_names=frozenset(
+            name for _, variable_names in expressions for name in variable_names
+        ),
+        literal_prefix=literals[0],
+        expand=_get_template_expander(literals, expressions),
+    )
+
+
+def _parse_expression(expression: str) -> Tuple[str, List[str]]:
+    operator = expression[:1]
+    if operator in ("+", "#"):
+        expression = expression[1:]
+    elif not operator.isalnum() and operator not in ("_", "%"):
+        raise Exception(f"Unsupported URI template expression '{{{expression}}}'.")
+    else:
+        operator = ""
+
+    return operator, expression.split(",")
+
+
+def _get_template_expander(
+    literals: List[str], expressions: List[Tuple[str, List[str]]]
+) -> Callable[[Mapping[str, CellValue]], str]:
+    """
+    `literals` surround the `expressions`, so there is always one more of them.
+    """
+    prefix = literals[0]
+
+    if not expressions:
+        return lambda values: prefix
+
+    if len(expressions) == 1 and len(expressions[0][1]) == 1:
+        # The most common form of template, e.g. `https://w3id.org/marco-bolo/{+id}`, is expanded in a single call.
+        operator, (variable_name,) = expressions[0]
+        return _get_single_variable_template_expander(
+            prefix, operator, variable_name, literals[1]
+        )
+
+    parts = [
+        (_get_expression_expander(operator, variable_names), literal)
+        for (operator, variable_names), literal in zip(expressions, literals[1:])
+    ]
+
+    def _expand(values: Mapping[str, CellValue]) -> str:
+        expanded = prefix
+        for expand_expression, literal in parts:
+            expanded += expand_expression(values) + literal
+        return expanded
+
+    return _expand
+
+
+def _get_single_variable_template_expander(
+    prefix: str, operator: str, variable_name: str, suffix: str
+) -> Callable[[Mapping[str, CellValue]], str]:
+    is_reserved_expansion = operator in ("+", "#")
+    needs_no_encoding = (
+        _UNRESERVED_OR_RESERVED_CHARACTERS
+        if is_reserved_expansion
+        else _UNRESERVED_CHARACTERS
+    ).issuperset
+    encode = _pct_encode_reserved if is_reserved_expansion else _pct_encode_unreserved
+    expanded_prefix = prefix + ("#" if operator == "#" else "")
+    unexpanded = prefix + suffix
+
+    def _expand(values: Mapping[str, CellValue]) -> str:
+        value = values.get(variable_name)
+        if isinstance(value, str):
+            if needs_no_encoding(value):
+                return expanded_prefix + value + suffix
+            return expanded_prefix + encode(value) + suffix
+        if not value:
+            return unexpanded
+        return expanded_prefix + ",".join(map(encode, value)) + suffix
+
+    return _expand
+
+
+def _get_expression_expander(
+    operator: str, variable_names: List[str]
+) -> Callable[[Mapping[str, CellValue]], str]:
+    encode = _pct_encode_reserved if operator in ("+", "#") else _pct_encode_unreserved
+    first = "#" if operator == "#" else ""
+
+    def _expand_expression(values: Mapping[str, CellValue]) -> str:
+        expanded_values = []
+        for name in variable_names:
+            value = values.get(name)
+            if value is None or value == []:
+                continue
+            items = [value] if isinstance(value, str) else value
+            expanded_values.append(",".join(map(encode, items)))
+
+        # An empty string is still a defined value, so only an expression whose variables are all undefined expands
+        # to nothing.
+        if not expanded_values:
+            return ""
+
+        return first + ",".join(expanded_values)
+
+    return _expand_expression
+
+
+def _pct_encode_unreserved(value: str) -> str:
+    if _UNRESERVED_CHARACTERS.issuperset(value):
+        return value
+
+    return quote(value, safe="")
+
+
+def _pct_encode_reserved(value: str) -> str:
+    """
+    Reserved expansion leaves existing percent-encoded triplets alone, but encodes any other '%'.
+    """
+    if _UNRESERVED_OR_RESERVED_CHARACTERS.issuperset(value):
+        return value
+
+    parts = _PERCENT_ENCODED_TRIPLET.split(value)
+    triplets = _PERCENT_ENCODED_TRIPLET.findall(value)
+    encoded = quote(parts[0], safe=_URI_TEMPLATE_RESERVED_CHARACTERS)
+    for triplet, part in zip(triplets, parts[1:]):
+        encoded += triplet + quote(part, safe=_URI_TEMPLATE_RESERVED_CHARACTERS)
+
+    return encoded
@@ -0,0 +1,297 @@
+"""
+validatefast
+------------
+
+A quick referential integrity pre-check covering every foreign key in the CSV-W table schemas as well as the manual
+(list column) foreign key checks. Each CSV file is read once and all of the checks are run against the resulting
+index of values.
+
+It does not replace csvw-check; it only checks that each reference points at a row which exists and that primary
+keys are unique.
+"""
+
+import json
+import os
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import click
+import pandas as pd
+
+from mbocsvwscripts.listcolumnforeignkeycheck import (
+    ForeignKeyCheck,
+    TableCache,
+    _describe_records,
+    _FIRST_DATA_RECORD_NUMBER,
+    _get_check_result_message,
+    _get_invalid_value_rows,
+    _get_table_columns,
+    _get_unique_parent_values_from_table,
+    _read_foreign_key_checks_manifest,
+    _read_table,
+)
+
+
+@dataclass
+class TableSchemaForeignKey:
+    column: str
+    parent_table_path: Path
+    parent_column: str
+    """
+    The name of the column in the parent table's schema.
+    """
+
+
+@dataclass
+class TableSchema:
+    table_path: Path
+    column_titles: Dict[str, str]
+    """
+    Maps each column's `name` to the title it has in the CSV file's header.
+    """
+    primary_key: List[str]
+    """
+    The names of the primary key's columns.
+    """
+    foreign_keys: List[TableSchemaForeignKey]
+
+
+@click.command()
+@click.option(
+    "-r",
+    "--remote-dir",
+    type=click.Path(exists=True, file_okay=False),
+    default="remote",
+    show_default=True,
+    help="The directory containing the `*.csv-metadata.json` and `*.schema.json` files.",
+)
+@click.option(
+    "-m",
+    "--manual-foreign-keys",
+    type=click.Path(exists=True, dir_okay=False),
+    default="remote/foreign-keys.json",
+    show_default=True,
+    help="The manifest of list column foreign key checks generated by `generatecsvwdefinitions`.",
+)
+def main(remote_dir: click.Path, manual_foreign_keys: click.Path) -> None:
+    """
+    Checks that every foreign key reference made in any CSV file points at an existing row, and that no primary key
+    value is repeated.
+
+    Table paths in the table schemas and in the MANUAL_FOREIGN_KEYS are resolved relative to the current directory,
+    so this should be run from the root of the repository.
+    """
+    table_schemas = _read_table_schemas(Path(str(remote_dir)))
+    foreign_key_checks = _get_table_schema_foreign_key_checks(table_schemas) + [
+        check
+        for checks in _read_foreign_key_checks_manifest(
+            Path(str(manual_foreign_keys))
+        ).values()
+        for check in checks
+    ]
+
+    failure_messages = _validate(table_schemas, foreign_key_checks)
+    for message in failure_messages:
+        print(f"\033[0;31m{message}\033[0m")
+        print("")
+
+    print(
+        f"Checked the primary keys of {len(table_schemas)} table(s) and {len(foreign_key_checks)} foreign key(s): "
+        f"{len(failure_messages)} problem(s) found."
+    )
+    sys.exit(1 if any(failure_messages) else 0)
+
+
+def _read_table_schemas(remote_dir: Path) -> List[TableSchema]:
+    """
+    Reads the table schema of every table referenced by the `*.csv-metadata.json` files in the `remote_dir`.
+    """
+    table_schema_files: Dict[Path, Path] = {}
+    for csv_metadata_file in sorted(remote_dir.glob("*.csv-metadata.json")):
+        with open(csv_metadata_file, "r") as f:
+            csv_metadata = json.load(f)
+
+        for table in csv_metadata["tables"]:
+            table_path = _resolve_relative_to(remote_dir, table["url"])
+            table_schema_files.setdefault(
+                table_path, _resolve_relative_to(remote_dir, table["tableSchema"])
+            )
+
+    table_schemas = []
+    for table_path, table_schema_file in sorted(table_schema_files.items()):
+        with open(table_schema_file, "r") as f:
+            table_schema = json.load(f)
+
+        table_schemas.append(
+            TableSchema(
+                table_path=table_path,
+                column_titles={
+                    column["name"]: column["titles"]["en"][0]
+                    for column in table_schema["columns"]
+                    if "titles" in column
+                },
+                primary_key=table_schema.get("primaryKey", []),
+                foreign_keys=[
+                    TableSchemaForeignKey(
+                        column=foreign_key["columnReference"],
+                        # Resources are relative to the table schema file.
+                        parent_table_path=_resolve_relative_to(
+                            table_schema_file.parent,
+                            foreign_key["reference"]["resource"],
+                        ),
+                        parent_column=foreign_key["reference"]["columnReference"],
+                    )
+                    for foreign_key in table_schema.get("foreignKeys", [])
+                ],
+            )
+        )
+
+    return table_schemas
+
+
+def _resolve_relative_to(directory: Path, url: str) -> Path:
+    return Path(os.path.normpath(directory / url))
+
+
+def _get_table_schema_foreign_key_checks(
+    table_schemas: List[TableSchema],
+) -> List[ForeignKeyCheck]:
+    """
+    Converts the `foreignKeys` of each table schema into checks on column titles.
+    """
+    table_schemas_by_path = {
+        table_schema.table_path: table_schema for table_schema in table_schemas
+    }
+
+    foreign_key_checks = []
+    for table_schema in table_schemas:
+        for foreign_key in table_schema.foreign_keys:
+            parent_table_schema = table_schemas_by_path.get(
+                foreign_key.parent_table_path
+            )
+            if parent_table_schema is None:
+                raise Exception(
+                    f"No table schema found for {foreign_key.parent_table_path} referenced by "
+                    f"{table_schema.table_path}"
+                )
+
+            foreign_key_checks.append(
+                ForeignKeyCheck(
+                    child_table_path=table_schema.table_path,
+                    child_table_column=table_schema.column_titles[foreign_key.column],
+                    parent_table_path=foreign_key.parent_table_path,
+                    parent_table_column=parent_table_schema.column_titles[
+                        foreign_key.parent_column
+                    ],
+                    separator=None,
+                )
+            )
+
+    return foreign_key_checks
+
+
+def _validate(
+    table_schemas: List[TableSchema], foreign_key_checks: List[ForeignKeyCheck]
+) -> List[str]:
+    """
+    Returns a message describing each failed check.
+    """
+    primary_key_columns = {
+        table_schema.table_path: [
+            table_schema.column_titles[name] for name in table_schema.primary_key
+        ]
+        for table_schema in table_schemas
+        if any(table_schema.primary_key)
+    }
+
+    table_columns = _get_table_columns(foreign_key_checks)
+    for table_path, columns in primary_key_columns.items():
+        table_columns.setdefault(table_path, set()).update(columns)
+    table_cache = TableCache(table_columns=table_columns)
+
+    failure_messages = []
+    missing_tables = {
+        table_path for table_path in table_columns if not table_path.exists()
+    }
+    for table_path in sorted(missing_tables):
+        # Tables which only have their primary key checked don't need to exist (e.g. unbuilt out/validation/ files).
+        if table_path not in primary_key_columns or any(
+            table_path in {check.child_table_path, check.parent_table_path}
+            for check in foreign_key_checks
+        ):
+            failure_messages.append(f"Table {table_path} does not exist.")
+
+    for table_path, columns in sorted(primary_key_columns.items()):
+        if table_path in missing_tables:
+            continue
+        try:
+            duplicate_rows = _get_duplicate_primary_key_rows(
+                _read_table(table_path, table_cache), columns
+            )
+        except Exception as e:
+            failure_messages.append(f"Failed to read {table_path}: {e!r}")
+            continue
+
+        if any(duplicate_rows):
+            failure_messages.append(
+                f"Duplicate primary key values found in {table_path}{columns}:\n"
+                + "\n".join(
+                    f"{_describe_primary_key(primary_key)} ({_describe_records(rows)})"
+                    for primary_key, rows in sorted(duplicate_rows.items())
+                )
+            )
+
+    for check in foreign_key_checks:
+        if {check.child_table_path, check.parent_table_path} & missing_tables:
+            continue
+        try:
+            invalid_value_rows = _get_invalid_value_rows(
+                _read_table(check.child_table_path, table_cache),
+                check.child_table_column,
+                check.separator,
+                _get_unique_parent_values_from_table(
+                    _read_table(check.parent_table_path, table_cache),
+                    check.parent_table_column,
+                ),
+            )
+        except Exception as e:
+            failure_messages.append(
+                f"Failed to validate {check.child_table_path}['{check.child_table_column}']: {e!r}"
+            )
+            continue
+
+        if any(invalid_value_rows):
+            failure_messages.append(
+                _get_check_result_message(check, invalid_value_rows)
+            )
+
+    return failure_messages
+
+
+def _get_duplicate_primary_key_rows(
+    table: pd.DataFrame, primary_key_columns: List[str]
+) -> Dict[Tuple[str, ...], List[int]]:
+    primary_keys: pd.DataFrame = table.loc[:, primary_key_columns]
+    primary_keys = primary_keys.loc[(primary_keys != "").all(axis=1)]
+    duplicated_primary_keys = primary_keys.loc[primary_keys.duplicated(keep=False)]
+
+    duplicate_rows: Dict[Tuple[str, ...], List[int]] = {}
+    for row_index, primary_key in zip(
+        duplicated_primary_keys.index,
+        duplicated_primary_keys.itertuples(index=False, name=None),
+    ):
+        duplicate_rows.setdefault(primary_key, []).append(
+            int(row_index) + _FIRST_DATA_RECORD_NUMBER
+        )
+
+    return duplicate_rows
+
+
+def _describe_primary_key(primary_key: Tuple[str, ...]) -> str:
+    return ", ".join(f"'{value}'" for value in primary_key)
+
+
+if __name__ == "__main__":
+    main()
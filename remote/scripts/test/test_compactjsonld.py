@@ -0,0 +1,196 @@
+import json
+import os
+import shutil
+from importlib.metadata import version
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+from pyld import jsonld
+from pyld.jsonld import JsonLdProcessor
+
+from mbocsvwscripts import compactjsonld
+from mbocsvwscripts.compactjsonld import (
+    SCHEMA_ORG_OUTPUT_CONTEXT,
+    _are_pyld_internals_available,
+    _compact_json_ld,
+    _compact_json_ld_files,
+    _load_compaction_context,
+    _read_raw_json_ld,
+    _read_context_cache,
+    _get_context_cache_key,
+)
+from mbocsvwscripts.partition import _partition_to_individual_files
+from .utils import TEST_CASES_DIR
+
+
+def test_compacted_against_schema_org_context():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        raw_dir = tmp_dir / "raw-jsonld"
+        raw_dir.mkdir()
+        _partition_to_individual_files(TEST_CASES_DIR / "bulk-licenses.ttl", raw_dir)
+
+        compacted_files = _compact_json_ld_files(
+            {raw_dir / "mbo_TODO_LICENSE_2.json": tmp_dir / "mbo_TODO_LICENSE_2.json"},
+            TEST_CASES_DIR / "schema-context.json",
+        )
+
+        assert compacted_files == [tmp_dir / "mbo_TODO_LICENSE_2.json"]
+        with open(tmp_dir / "mbo_TODO_LICENSE_2.json", "r") as f:
+            compacted = json.load(f)
+
+        assert list(compacted.keys())[0] == "@context"
+        assert compacted == {
+            "@context": SCHEMA_ORG_OUTPUT_CONTEXT,
+            "@id": "https://w3id.org/marco-bolo/mbo_TODO_LICENSE_2",
+            "@type": "CreativeWork",
+            "name": "European Union Public License 1.0",
+            "url": "https://spdx.org/licenses/EUPL-1.0",
+            "description": "The European Commission has approved the EUPL on 9 January 2007.",
+        }
+
+
+def test_reused_context_matches_jsonld_compact():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        partition_files = _partition_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl", tmp_dir
+        )
+        with open(TEST_CASES_DIR / "schema-context.json", "r") as f:
+            context = json.load(f)
+
+        compaction_context = _load_compaction_context(
+            TEST_CASES_DIR / "schema-context.json"
+        )
+        for raw_json_ld_file in sorted(partition_files.written):
+            document = _read_raw_json_ld(raw_json_ld_file)
+            expected = jsonld.compact(document, context)
+            expected["@context"] = SCHEMA_ORG_OUTPUT_CONTEXT
+
+            assert _compact_json_ld(document, compaction_context) == expected
+
+
+def test_falls_back_to_jsonld_compact_without_pyld_internals(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    node = {
+        "@id": "https://w3id.org/marco-bolo/mbo_TODO_LICENSE_1",
+        "@type": ["http://schema.org/CreativeWork"],
+        "http://schema.org/name": [{"@value": "Creative Commons Zero v1.0 Universal"}],
+    }
+    other_node = {
+        "@id": "https://w3id.org/marco-bolo/mbo_TODO_LICENSE_2",
+        "@type": ["http://schema.org/CreativeWork"],
+    }
+    # A single node, several nodes (compacted into an `@graph`) and nothing at all.
+    documents = [node, [node, other_node], []]
+    compaction_context = _load_compaction_context(
+        TEST_CASES_DIR / "schema-context.json"
+    )
+    expected = [
+        _compact_json_ld(document, compaction_context) for document in documents
+    ]
+    assert "@graph" in expected[1]
+    assert expected[2] == {"@context": SCHEMA_ORG_OUTPUT_CONTEXT}
+
+    # `jsonld.compact` itself uses the internals, so a pyld release without them is simulated by looking for one which
+    # doesn't exist.
+    monkeypatch.setattr(
+        compactjsonld,
+        "_PYLD_INTERNALS",
+        [*compactjsonld._PYLD_INTERNALS, (JsonLdProcessor, "_removed_internal")],
+    )
+    with TemporaryDirectory() as tmp_dir:
+        context_cache_file = Path(tmp_dir) / "schema-context.pickle"
+        compaction_context = _load_compaction_context(
+            TEST_CASES_DIR / "schema-context.json", context_cache_file
+        )
+
+        assert compaction_context.active_context is None
+        assert not context_cache_file.exists()
+
+    assert [
+        _compact_json_ld(document, compaction_context) for document in documents
+    ] == expected
+
+
+def test_up_to_date_outputs_are_skipped():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        raw_dir = tmp_dir / "raw-jsonld"
+        raw_dir.mkdir()
+        partition_files = _partition_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl", raw_dir
+        )
+        files_out = {p: tmp_dir / p.name for p in partition_files.written}
+        _compact_json_ld_files(files_out, TEST_CASES_DIR / "schema-context.json")
+
+        stale_raw_file = raw_dir / "mbo_TODO_LICENSE_1.json"
+        output_mtime = (tmp_dir / "mbo_TODO_LICENSE_1.json").stat().st_mtime_ns
+        os.utime(stale_raw_file, ns=(output_mtime + 1, output_mtime + 1))
+
+        compacted_files = _compact_json_ld_files(
+            files_out, TEST_CASES_DIR / "schema-context.json"
+        )
+
+        assert compacted_files == [tmp_dir / "mbo_TODO_LICENSE_1.json"]
+
+
+def test_processed_context_loaded_from_cache(monkeypatch: pytest.MonkeyPatch):
+    # The cache holds pyld's internal representation of the context, so this needs the pinned pyld release.
+    assert _are_pyld_internals_available(), version("PyLD")
+
+    with TemporaryDirectory() as tmp_dir:
+        context_cache_file = Path(tmp_dir) / "schema-context.pickle"
+        document = {
+            "@id": "https://w3id.org/marco-bolo/mbo_TODO_LICENSE_1",
+            "@type": ["http://schema.org/CreativeWork"],
+            "http://schema.org/name": [
+                {"@value": "Creative Commons Zero v1.0 Universal"}
+            ],
+        }
+        expected = _compact_json_ld(
+            document,
+            _load_compaction_context(
+                TEST_CASES_DIR / "schema-context.json", context_cache_file
+            ),
+        )
+        assert context_cache_file.exists()
+
+        def _fail_process_context(*args, **kwargs):
+            raise Exception("The context should have been loaded from the cache.")
+
+        monkeypatch.setattr(JsonLdProcessor, "process_context", _fail_process_context)
+        compaction_context = _load_compaction_context(
+            TEST_CASES_DIR / "schema-context.json", context_cache_file
+        )
+
+        assert _compact_json_ld(document, compaction_context) == expected
+
+
+def test_context_cache_rewritten_when_context_changes():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        context_file = tmp_dir / "schema-context.json"
+        context_cache_file = tmp_dir / "schema-context.pickle"
+        shutil.copy(TEST_CASES_DIR / "schema-context.json", context_file)
+        _load_compaction_context(context_file, context_cache_file)
+
+        with open(context_file, "r") as f:
+            context = json.load(f)
+        del context["@context"]["name"]
+        with open(context_file, "w") as f:
+            json.dump(context, f)
+
+        cache_key = _get_context_cache_key(context_file)
+        assert _read_context_cache(context_cache_file, cache_key) is None
+
+        compaction_context = _load_compaction_context(context_file, context_cache_file)
+
+        assert "name" not in compaction_context.active_context["mappings"]
+        assert _read_context_cache(context_cache_file, cache_key) is not None
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -0,0 +1,106 @@
+import shutil
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from mbocsvwscripts.csvwtordf import (
+    _compile_url_term,
+    _convert_csvw_to_n_triples_file,
+    _format_literal,
+)
+from .utils import TEST_CASES_DIR, assert_file_contains_only_these_triples
+
+CSVW_TEST_CASES_DIR = TEST_CASES_DIR / "csvw"
+
+
+@pytest.mark.parametrize(
+    "metadata_file_name, expected_ttl_file_name",
+    [
+        # The expected outputs were generated by csv2rdf in minimal mode.
+        ("license.csv-metadata.json", "bulk-licenses.ttl"),
+        ("monetary-grant.csv-metadata.json", "bulk-monetary-grant.ttl"),
+        ("dataset.csv-metadata.json", "dataset.ttl"),
+    ],
+)
+def test_conversion_matches_csv2rdf(
+    metadata_file_name: str, expected_ttl_file_name: str
+):
+    with TemporaryDirectory() as tmp_dir:
+        n_triples_file = Path(tmp_dir) / "out.nt"
+
+        _convert_csvw_to_n_triples_file(
+            CSVW_TEST_CASES_DIR / metadata_file_name,
+            n_triples_file,
+            base_url="file:/work/",
+        )
+
+        assert_file_contains_only_these_triples(
+            n_triples_file,
+            (TEST_CASES_DIR / expected_ttl_file_name).read_text(encoding="utf-8"),
+        )
+
+
+def test_header_mismatch_is_an_error():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        for file_name in ["dataset.csv", "dataset.csv-metadata.json"]:
+            shutil.copy(CSVW_TEST_CASES_DIR / file_name, tmp_dir / file_name)
+
+        csv_file = tmp_dir / "dataset.csv"
+        csv_file.write_text(
+            csv_file.read_text(encoding="utf-8").replace("Title*", "Name*", 1),
+            encoding="utf-8",
+        )
+
+        with pytest.raises(Exception, match="'Name\\*' where 'name' was expected"):
+            _convert_csvw_to_n_triples_file(
+                tmp_dir / "dataset.csv-metadata.json", tmp_dir / "out.nt"
+            )
+
+        # The output file is only written once the conversion has succeeded.
+        assert not (tmp_dir / "out.nt").exists()
+
+
+def test_compiled_url_terms_are_resolved():
+    table_url = "file:/work/license.csv"
+    values = {"id": "mbo_1", "_row": "2", "type": "Dataset"}
+
+    assert _compile_url_term("https://w3id.org/marco-bolo/{+id}", table_url)(
+        values
+    ) == ("<https://w3id.org/marco-bolo/mbo_1>")
+    assert _compile_url_term("#row={_row}", table_url)(values) == (
+        "<file:/work/license.csv#row=2>"
+    )
+    assert _compile_url_term("rdf:type", table_url)(values) == (
+        "<http://www.w3.org/1999/02/22-rdf-syntax-ns#type>"
+    )
+    assert _compile_url_term("schema:{type}", table_url)(values) == (
+        "<http://schema.org/Dataset>"
+    )
+    assert _compile_url_term("other/{+id}", table_url)(values) == (
+        "<file:/work/other/mbo_1>"
+    )
+
+
+def test_literal_formatting():
+    assert (
+        _format_literal(
+            'a "quoted"\nvalue\\', "http://www.w3.org/2001/XMLSchema#string"
+        )
+        == '"a \\"quoted\\"\\nvalue\\\\"'
+    )
+    assert (
+        _format_literal("2025-01-01", "https://schema.org/Date")
+        == '"2025-01-01"^^<https://schema.org/Date>'
+    )
+
+    # Unlike csv2rdf, the lexical form isn't canonicalised.
+    assert (
+        _format_literal("01", "http://www.w3.org/2001/XMLSchema#int")
+        == '"01"^^<http://www.w3.org/2001/XMLSchema#int>'
+    )
+    assert (
+        _format_literal("1.50", "http://www.w3.org/2001/XMLSchema#decimal")
+        == '"1.50"^^<http://www.w3.org/2001/XMLSchema#decimal>'
+    )
@@ -0,0 +1,199 @@
+import random
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Dict, Set
+
+import pytest
+from click.testing import CliRunner
+
+from mbocsvwscripts.generatecsvwdefinitions import (
+    _get_model_file_imports,
+    _perform_transitive_dependency_closure,
+    main,
+)
+
+_CLASSES_YAML = Path(__file__).parent.parent.parent / "models" / "classes.yaml"
+"""
+The model the build uses. It is outside of the tools image's build context, so the tests which need it are skipped
+when they're run there.
+"""
+
+
+def _naive_transitive_dependency_closure(
+    map_class_name_to_csv_dependencies: Dict[str, Set[Path]],
+    map_class_name_to_csv_path: Dict[str, Path],
+) -> Dict[str, Set[Path]]:
+    """
+    Repeatedly unions each class's dependencies with those of the classes it depends upon until nothing changes.
+    """
+    map_csv_path_to_class_name = {
+        csv_path: class_name
+        for class_name, csv_path in map_class_name_to_csv_path.items()
+    }
+    closure = {
+        class_name: set(dependencies)
+        for class_name, dependencies in map_class_name_to_csv_dependencies.items()
+    }
+    changed = True
+    while changed:
+        changed = False
+        for class_name, dependencies in closure.items():
+            transitive_dependencies = set(dependencies)
+            for csv_path in dependencies:
+                if csv_path in map_csv_path_to_class_name:
+                    transitive_dependencies |= closure[
+                        map_csv_path_to_class_name[csv_path]
+                    ]
+            if transitive_dependencies != dependencies:
+                closure[class_name] = transitive_dependencies
+                changed = True
+
+    return closure
+
+
+def _generate_synthetic_model(number_of_classes: int, seed: int):
+    random_generator = random.Random(seed)
+    map_class_name_to_csv_path = {
+        f"Class{i}": Path("data") / f"Class{i}.csv" for i in range(number_of_classes)
+    }
+    class_names = list(map_class_name_to_csv_path)
+    map_class_name_to_csv_dependencies = {
+        class_name: {map_class_name_to_csv_path[class_name]}
+        | {
+            map_class_name_to_csv_path[dependency_class_name]
+            for dependency_class_name in random_generator.sample(
+                class_names, random_generator.randint(0, 3)
+            )
+        }
+        for class_name in class_names
+    }
+    # Virtual CSV files aren't owned by any class.
+    map_class_name_to_csv_dependencies["Class0"].add(
+        Path("out") / "validation" / "person-or-organization.csv"
+    )
+
+    return map_class_name_to_csv_dependencies, map_class_name_to_csv_path
+
+
+def test_transitive_dependency_closure_matches_naive_closure():
+    for seed in range(3):
+        map_class_name_to_csv_dependencies, map_class_name_to_csv_path = (
+            _generate_synthetic_model(300, seed)
+        )
+        expected = _naive_transitive_dependency_closure(
+            map_class_name_to_csv_dependencies, map_class_name_to_csv_path
+        )
+
+        _perform_transitive_dependency_closure(
+            map_class_name_to_csv_dependencies, map_class_name_to_csv_path
+        )
+
+        assert map_class_name_to_csv_dependencies == expected
+
+
+def test_transitive_dependency_closure_of_long_chain():
+    number_of_classes = 2000
+    map_class_name_to_csv_path = {
+        f"Class{i}": Path(f"Class{i}.csv") for i in range(number_of_classes)
+    }
+    map_class_name_to_csv_dependencies = {
+        f"Class{i}": {Path(f"Class{i}.csv"), Path(f"Class{i + 1}.csv")}
+        for i in range(number_of_classes - 1)
+    }
+    map_class_name_to_csv_dependencies[f"Class{number_of_classes - 1}"] = {
+        Path(f"Class{number_of_classes - 1}.csv")
+    }
+
+    cycles = _perform_transitive_dependency_closure(
+        map_class_name_to_csv_dependencies, map_class_name_to_csv_path
+    )
+
+    assert cycles == []
+    assert map_class_name_to_csv_dependencies["Class0"] == set(
+        map_class_name_to_csv_path.values()
+    )
+    assert map_class_name_to_csv_dependencies["Class1500"] == {
+        Path(f"Class{i}.csv") for i in range(1500, number_of_classes)
+    }
+
+
+def test_transitive_dependency_closure_reports_cycles():
+    map_class_name_to_csv_path = {
+        class_name: Path(f"{class_name}.csv") for class_name in ["A", "B", "C", "D"]
+    }
+    map_class_name_to_csv_dependencies = {
+        "A": {Path("A.csv"), Path("B.csv")},
+        "B": {Path("B.csv"), Path("C.csv")},
+        "C": {Path("C.csv"), Path("A.csv"), Path("D.csv")},
+        "D": {Path("D.csv")},
+    }
+
+    cycles = _perform_transitive_dependency_closure(
+        map_class_name_to_csv_dependencies, map_class_name_to_csv_path
+    )
+
+    assert cycles == [["A", "B", "C"]]
+    for class_name in ["A", "B", "C"]:
+        assert map_class_name_to_csv_dependencies[class_name] == set(
+            map_class_name_to_csv_path.values()
+        )
+    assert map_class_name_to_csv_dependencies["D"] == {Path("D.csv")}
+
+
+def test_model_file_imports_read_in_any_yaml_style():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        block_style = tmp_dir / "block.yaml"
+        block_style.write_text(
+            "id: https://example.com/block\n"
+            "imports:\n"
+            "  # A comment\n"
+            "  - linkml:types\n"
+            "  - './slots'\n"
+            "classes: {}\n"
+        )
+        flow_style = tmp_dir / "flow.yaml"
+        flow_style.write_text('classes: {}\nimports: [linkml:types, "./slots"]\n')
+        no_imports = tmp_dir / "none.yaml"
+        no_imports.write_text("classes: {}\n")
+
+        assert _get_model_file_imports(block_style) == ["linkml:types", "./slots"]
+        assert _get_model_file_imports(flow_style) == ["linkml:types", "./slots"]
+        assert _get_model_file_imports(no_imports) == []
+
+
+@pytest.mark.skipif(
+    not _CLASSES_YAML.exists(),
+    reason=f"{_CLASSES_YAML} is only available in a checkout of the repository.",
+)
+def test_parallel_generation_matches_serial_generation():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+
+        for jobs in [1, 3]:
+            result = CliRunner().invoke(
+                main,
+                [
+                    str(_CLASSES_YAML),
+                    "--output-dir",
+                    str(tmp_dir / f"jobs-{jobs}"),
+                    "--jobs",
+                    str(jobs),
+                    "--no-cache",
+                ],
+            )
+            assert result.exit_code == 0, result.output
+
+        serial_files = {
+            p.relative_to(tmp_dir / "jobs-1"): p.read_bytes()
+            for p in (tmp_dir / "jobs-1").rglob("*")
+            if p.is_file()
+        }
+        parallel_files = {
+            p.relative_to(tmp_dir / "jobs-3"): p.read_bytes()
+            for p in (tmp_dir / "jobs-3").rglob("*")
+            if p.is_file()
+        }
+
+        assert any(serial_files)
+        assert serial_files == parallel_files
@@ -1,6 +1,17 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pandas as pd
 import pytest
+from click.testing import CliRunner
 
-from mbocsvwscripts.listcolumnforeignkeycheck import _get_invalid_list_column_values
+from mbocsvwscripts.listcolumnforeignkeycheck import (
+    _get_invalid_list_column_value_rows,
+    _get_invalid_list_column_values,
+    _read_csv_columns,
+    batch,
+)
 from .utils import TEST_CASES_DIR
 
 
@@ -40,5 +51,111 @@ def test_list_column_foreign_key_success_comma_separator():
     assert not any(invalid_values)
 
 
+def test_invalid_values_reported_with_rows():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        child_table = tmp_dir / "child.csv"
+        # The quoted value spans two lines of the file, but is a single record.
+        child_table.write_text('Codes,Notes\na|x,"one\ntwo"\n,\nx|b|y|y,\nc,\n')
+        parent_table = tmp_dir / "parent.csv"
+        parent_table.write_text("Code\na\nb\nc\n")
+
+        invalid_value_rows = _get_invalid_list_column_value_rows(
+            child_table, "Codes", parent_table, "Code", separator="|"
+        )
+
+    assert invalid_value_rows == {"x": [2, 4], "y": [4]}
+
+
+def test_values_compared_as_written():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        child_table = tmp_dir / "child.csv"
+        child_table.write_text("Name,Codes\na,007|NA\nb,\nc,1.50\n")
+        parent_table = tmp_dir / "parent.csv"
+        parent_table.write_text("Code,Other\n7,x\n007,y\n1.5,z\n")
+
+        assert set(_read_csv_columns(child_table, {"Codes"}).columns) == {"Codes"}
+
+        invalid_values = _get_invalid_list_column_values(
+            child_table, "Codes", parent_table, "Code", separator="|"
+        )
+
+    # No type inference ("1.50" isn't "1.5") and no NA inference ("NA" is a value, the empty cell isn't).
+    assert invalid_values == {"NA", "1.50"}
+
+
+def test_batch_writes_logs_for_each_class(monkeypatch: pytest.MonkeyPatch):
+    tables_read = []
+    read_csv = pd.read_csv
+
+    def _read_csv_counted(filepath_or_buffer, *args, **kwargs):
+        tables_read.append(Path(filepath_or_buffer))
+        return read_csv(filepath_or_buffer, *args, **kwargs)
+
+    monkeypatch.setattr(pd, "read_csv", _read_csv_counted)
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        manifest_file = tmp_dir / "foreign-keys.json"
+        with open(manifest_file, "w") as f:
+            json.dump(
+                {
+                    "Invalid": [
+                        _get_manifest_check("child_table_invalid.csv", "|"),
+                    ],
+                    "Valid": [
+                        _get_manifest_check("child_table_valid.csv", "|"),
+                        _get_manifest_check("child_table_valid_comma.csv", ","),
+                    ],
+                },
+                f,
+            )
+
+        result = CliRunner().invoke(
+            batch, [str(manifest_file), "--out", str(tmp_dir / "validation")]
+        )
+        assert result.exit_code == 0, result.output
+
+        validation_dir = tmp_dir / "validation"
+        assert not (
+            validation_dir / "Invalid-csv-list-column-foreign-key.success.log"
+        ).exists()
+        error_log = (
+            validation_dir / "Invalid-csv-list-column-foreign-key.err.log"
+        ).read_text()
+        assert "'Upperington Youth Orchestra' (record 2)" in error_log
+        assert "'Henry's Chocolate Club' (record 3)" in error_log
+        assert "Foreign Key errors detected:" in result.output
+
+        assert (
+            validation_dir / "Valid-csv-list-column-foreign-key.success.log"
+        ).exists()
+        assert not (
+            validation_dir / "Valid-csv-list-column-foreign-key.err.log"
+        ).exists()
+
+    # The parent table takes part in every check but is only read once.
+    assert sorted(tables_read) == sorted(
+        TEST_CASES_DIR / f
+        for f in [
+            "child_table_invalid.csv",
+            "child_table_valid.csv",
+            "child_table_valid_comma.csv",
+            "parent_table.csv",
+        ]
+    )
+
+
+def _get_manifest_check(child_table: str, separator: str) -> dict:
+    return {
+        "childTable": str(TEST_CASES_DIR / child_table),
+        "childColumn": "Associated Organizations",
+        "parentTable": str(TEST_CASES_DIR / "parent_table.csv"),
+        "parentColumn": "Known Organizations",
+        "separator": separator,
+    }
+
+
 if __name__ == "__main__":
     pytest.main()
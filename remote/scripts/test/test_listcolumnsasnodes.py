@@ -1,16 +1,42 @@
+import os
 import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pytest
 import rdflib
+from rdflib.compare import isomorphic
 
 from mbocsvwscripts.listcolumnsasnodes import (
+    CONVERT_IRI_TO_NODE_DATA_TYPE_URI,
     _convert_literals_to_nodes_in_file,
+    _convert_literals_to_nodes_in_n_triples_file,
     _get_number_to_be_converted_in_graph,
+    _update_literals_to_nodes_in_graph_assert_success,
 )
 from .utils import TEST_CASES_DIR
 
+_ACCEPTED_IRIS = [
+    "https://example.com/a?b=c&d=e#f",
+    "https://example.com/caf\u00e9",
+    "https://example.com/a%20b",
+    "urn:isbn:0451450523",
+]
+_REJECTED_IRIS = [
+    "https://example.com/a b",
+    "https://example.com/a\tb",
+    "https://example.com/<a>",
+    'https://example.com/"a"',
+    "https://example.com/{a}",
+    "https://example.com/a|b",
+    "https://example.com/a^b",
+    "https://example.com/a`b",
+    "https://example.com/a\\b",
+]
+"""
+IRIs containing these characters can't be written in N-Triples, and so aren't converted.
+"""
+
 
 def test_mbo_list_columns_values_converted_to_node_references():
     with TemporaryDirectory() as tmp_dir:
@@ -60,5 +86,182 @@ def test_number_literals_to_be_converted_in_graph():
     assert num_to_be_converted == 10
 
 
+def test_literals_converted_in_place():
+    graph = rdflib.Graph()
+    graph = graph.parse(TEST_CASES_DIR / "dataset.ttl", format="ttl")
+    num_triples = len(graph)
+
+    graph = _update_literals_to_nodes_in_graph_assert_success(graph)
+
+    assert _get_number_to_be_converted_in_graph(graph) == 0
+    assert len(graph) == num_triples
+    assert (
+        rdflib.URIRef("https://w3id.org/marco-bolo/mbo_TODO_DATASET_2"),
+        rdflib.URIRef("https://schema.org/isBasedOn"),
+        rdflib.URIRef("https://w3id.org/marco-bolo/mbo_TODO_DATASET_1"),
+    ) in graph
+
+
+def test_n_triples_output_is_valid_turtle():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        tmp_dataset_ttl = tmp_dir / "dataset.ttl"
+        tmp_dataset_nt = tmp_dir / "dataset-nt.ttl"
+        shutil.copy(TEST_CASES_DIR / "dataset.ttl", tmp_dataset_ttl)
+        shutil.copy(TEST_CASES_DIR / "dataset.ttl", tmp_dataset_nt)
+
+        _convert_literals_to_nodes_in_file(tmp_dataset_ttl)
+        _convert_literals_to_nodes_in_file(tmp_dataset_nt, output_format="nt")
+
+        assert isomorphic(
+            rdflib.Graph().parse(tmp_dataset_nt, format="ttl"),
+            rdflib.Graph().parse(tmp_dataset_ttl, format="ttl"),
+        )
+
+
+def test_file_untouched_when_serialization_fails(monkeypatch: pytest.MonkeyPatch):
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        tmp_dataset_ttl = tmp_dir / "dataset.ttl"
+        shutil.copy(TEST_CASES_DIR / "dataset.ttl", tmp_dataset_ttl)
+
+        def _fail_part_way_through(self, destination, *args, **kwargs):
+            Path(destination).write_text("@prefix schema: <https://sch")
+            raise Exception("Serialization failed.")
+
+        monkeypatch.setattr(rdflib.Graph, "serialize", _fail_part_way_through)
+
+        with pytest.raises(Exception, match="Serialization failed."):
+            _convert_literals_to_nodes_in_file(tmp_dataset_ttl)
+
+        assert (
+            tmp_dataset_ttl.read_bytes()
+            == (TEST_CASES_DIR / "dataset.ttl").read_bytes()
+        )
+        assert list(tmp_dir.iterdir()) == [tmp_dataset_ttl]
+
+
+def test_streaming_conversion_matches_graph_conversion():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        tmp_dataset_ttl = tmp_dir / "dataset.ttl"
+        tmp_dataset_nt = tmp_dir / "dataset.nt"
+        shutil.copy(TEST_CASES_DIR / "dataset.ttl", tmp_dataset_ttl)
+        rdflib.Graph().parse(tmp_dataset_ttl, format="ttl").serialize(
+            tmp_dataset_nt, format="nt"
+        )
+
+        _convert_literals_to_nodes_in_file(tmp_dataset_ttl)
+        _convert_literals_to_nodes_in_n_triples_file(tmp_dataset_nt)
+
+        streamed_graph = rdflib.Graph().parse(tmp_dataset_nt, format="nt")
+        assert _get_number_to_be_converted_in_graph(streamed_graph) == 0
+        assert isomorphic(
+            streamed_graph, rdflib.Graph().parse(tmp_dataset_ttl, format="ttl")
+        )
+
+
+def _get_graph_with_iri_literal(iri: str) -> rdflib.Graph:
+    graph = rdflib.Graph()
+    graph.add(
+        (
+            rdflib.URIRef("https://w3id.org/marco-bolo/a"),
+            rdflib.URIRef("https://schema.org/url"),
+            rdflib.Literal(iri, datatype=CONVERT_IRI_TO_NODE_DATA_TYPE_URI),
+        )
+    )
+    return graph
+
+
+@pytest.mark.parametrize("iri", _ACCEPTED_IRIS)
+def test_valid_iris_converted(iri: str):
+    graph = _update_literals_to_nodes_in_graph_assert_success(
+        _get_graph_with_iri_literal(iri)
+    )
+    assert rdflib.URIRef(iri) in graph.objects()
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_nt = Path(tmp_dir) / "a.nt"
+        _get_graph_with_iri_literal(iri).serialize(tmp_nt, format="nt")
+
+        _convert_literals_to_nodes_in_n_triples_file(tmp_nt)
+
+        assert rdflib.URIRef(iri) in rdflib.Graph().parse(tmp_nt).objects()
+
+
+@pytest.mark.parametrize("iri", _REJECTED_IRIS)
+def test_invalid_iris_rejected(iri: str):
+    with pytest.raises(Exception, match="is not a valid IRI"):
+        _update_literals_to_nodes_in_graph_assert_success(
+            _get_graph_with_iri_literal(iri)
+        )
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_nt = Path(tmp_dir) / "a.nt"
+        _get_graph_with_iri_literal(iri).serialize(tmp_nt, format="nt")
+
+        with pytest.raises(Exception, match="is not a valid IRI"):
+            _convert_literals_to_nodes_in_n_triples_file(tmp_nt)
+
+
+def test_streaming_conversion_leaves_file_untouched_when_nothing_to_convert():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        tmp_nt = tmp_dir / "license.nt"
+        rdflib.Graph().parse(TEST_CASES_DIR / "bulk-licenses.ttl").serialize(
+            tmp_nt, format="nt"
+        )
+        os.utime(tmp_nt, ns=(0, 0))
+        contents_before = tmp_nt.read_bytes()
+
+        _convert_literals_to_nodes_in_n_triples_file(tmp_nt)
+
+        assert tmp_nt.read_bytes() == contents_before
+        assert tmp_nt.stat().st_mtime_ns == 0
+        assert list(tmp_dir.iterdir()) == [tmp_nt]
+
+
+def test_streaming_conversion_unescapes_literals():
+    lines = [
+        '<https://w3id.org/marco-bolo/a> <https://schema.org/url> "https://example.com/caf\\u00E9"^^<https://w3id.org/marco-bolo/ConvertIriToNode> .\n',
+        '<https://w3id.org/marco-bolo/a> <https://schema.org/isBasedOn> "mbo_\\U00000041"^^<https://w3id.org/marco-bolo/ConvertMboIdToNode> .\n',
+        '<https://w3id.org/marco-bolo/a> <https://schema.org/name> "Mentions \\"^^<https://w3id.org/marco-bolo/ConvertIriToNode> ." .\n',
+    ]
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_nt = Path(tmp_dir) / "a.nt"
+        tmp_nt.write_text("".join(lines), encoding="utf-8")
+
+        _convert_literals_to_nodes_in_n_triples_file(tmp_nt)
+
+        converted_lines = tmp_nt.read_text(encoding="utf-8").splitlines(keepends=True)
+
+    assert converted_lines[0] == (
+        "<https://w3id.org/marco-bolo/a> <https://schema.org/url> <https://example.com/café> .\n"
+    )
+    assert converted_lines[1] == (
+        "<https://w3id.org/marco-bolo/a> <https://schema.org/isBasedOn> <https://w3id.org/marco-bolo/mbo_A> .\n"
+    )
+    assert converted_lines[2] == lines[2]
+
+
+def test_streaming_conversion_rejects_invalid_iris():
+    lines = [
+        "# A comment\n",
+        '<https://w3id.org/marco-bolo/a> <https://schema.org/url> "not an IRI"^^<https://w3id.org/marco-bolo/ConvertIriToNode> .\n',
+    ]
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        tmp_nt = tmp_dir / "a.nt"
+        tmp_nt.write_text("".join(lines), encoding="utf-8")
+
+        with pytest.raises(Exception, match="line 2"):
+            _convert_literals_to_nodes_in_n_triples_file(tmp_nt)
+
+        assert tmp_nt.read_text(encoding="utf-8") == "".join(lines)
+        assert list(tmp_dir.iterdir()) == [tmp_nt]
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -0,0 +1,36 @@
+import pytest
+
+from mbocsvwscripts.parallel import run_tasks, TaskFailures
+
+
+def _square(value: int) -> int:
+    return value * value
+
+
+def _fail_on_odd_values(value: int) -> int:
+    if value % 2 == 1:
+        raise ValueError(f"{value} is odd")
+    return value
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_results_keyed_in_task_order(jobs: int):
+    tasks = {f"task-{i}": (i,) for i in reversed(range(10))}
+
+    results = run_tasks(_square, tasks, jobs)
+
+    assert list(results.keys()) == list(tasks.keys())
+    assert results == {f"task-{i}": i * i for i in range(10)}
+
+
+@pytest.mark.parametrize("jobs", [1, 3])
+def test_all_failures_reported_together(jobs: int):
+    with pytest.raises(TaskFailures) as exception_info:
+        run_tasks(_fail_on_odd_values, {f"task-{i}": (i,) for i in range(6)}, jobs)
+
+    assert set(exception_info.value.failures.keys()) == {"task-1", "task-3", "task-5"}
+    assert "task-3: ValueError: 3 is odd" in str(exception_info.value)
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,11 +1,19 @@
+import json
+import shutil
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
 import pytest
+import rdflib
 
 from mbocsvwscripts.partition import (
     _partition_to_individual_files,
     _list_partition_files_out,
+    _partition_triples,
+    _partition_to_individual_files_streaming,
+    _list_partition_files_out_streaming,
+    _split_to_individual_files,
+    _list_partition_files_out_cached,
 )
 from .utils import TEST_CASES_DIR, assert_file_contains_only_these_triples
 
@@ -176,5 +184,250 @@ def test_partitions_contains_expected_hash_urls():
         )
 
 
+def test_partition_triples_buckets_every_triple_once():
+    bulk_ttl_graph = rdflib.Graph()
+    bulk_ttl_graph.parse(TEST_CASES_DIR / "bulk-monetary-grant.ttl", format="ttl")
+
+    partitions = _partition_triples(bulk_ttl_graph)
+
+    assert set(partitions.keys()) == {
+        "https://w3id.org/marco-bolo/mbo_todo_monetary_grant_1"
+    }
+    partitioned_triples = [t for triples in partitions.values() for t in triples]
+    assert len(partitioned_triples) == len(bulk_ttl_graph)
+    assert set(partitioned_triples) == set(bulk_ttl_graph)
+
+
+def test_streaming_partitions_listed_match_in_memory_partitions():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        partitioned_files = _list_partition_files_out_streaming(
+            TEST_CASES_DIR / "bulk-licenses.nt", tmp_dir
+        )
+
+        assert partitioned_files == _list_partition_files_out(
+            TEST_CASES_DIR / "bulk-licenses.ttl", tmp_dir
+        )
+
+
+@pytest.mark.parametrize("target_spill_file_bytes", [1, 1024 * 1024])
+def test_streaming_partitions_contain_same_triples_as_in_memory_partitions(
+    target_spill_file_bytes: int,
+):
+    """
+    The N-Triples test case has its statements sorted by predicate, so each subject's triples arrive out of order.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        in_memory_dir = tmp_dir / "in-memory"
+        in_memory_dir.mkdir()
+        streaming_dir = tmp_dir / "streaming"
+        streaming_dir.mkdir()
+
+        for test_case in ["bulk-licenses", "bulk-monetary-grant"]:
+            _partition_to_individual_files(
+                TEST_CASES_DIR / f"{test_case}.ttl", in_memory_dir
+            )
+            _partition_to_individual_files_streaming(
+                TEST_CASES_DIR / f"{test_case}.nt",
+                streaming_dir,
+                target_spill_file_bytes=target_spill_file_bytes,
+            )
+
+        in_memory_files = sorted(p.name for p in in_memory_dir.iterdir())
+        assert sorted(p.name for p in streaming_dir.iterdir()) == in_memory_files
+
+        for file_name in in_memory_files:
+            assert_file_contains_only_these_triples(
+                streaming_dir / file_name,
+                (in_memory_dir / file_name).read_text(),
+                expected_format="json-ld",
+            )
+
+
+def test_split_writes_manifest_of_partition_files():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        manifest_file = tmp_dir / "manifests" / "bulk-licenses.json"
+
+        partition_files = _split_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl", tmp_dir, manifest_file, False
+        )
+
+        assert set(partition_files.digests.keys()) == _list_partition_files_out(
+            TEST_CASES_DIR / "bulk-licenses.ttl", tmp_dir
+        )
+        assert partition_files.written == set(partition_files.digests.keys())
+        assert all(p.exists() for p in partition_files.written)
+
+        with open(manifest_file, "r") as f:
+            manifest = json.load(f)
+        assert manifest["partitionDigests"] == {
+            p.name: digest for p, digest in partition_files.digests.items()
+        }
+
+
+def test_list_uses_manifest_when_bulk_file_unchanged():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        manifest_file = tmp_dir / "bulk-licenses.json"
+        _split_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl", tmp_dir, manifest_file, False
+        )
+
+        # Prove that the answer comes from the manifest rather than from parsing the bulk file.
+        with open(manifest_file, "r") as f:
+            manifest = json.load(f)
+        manifest["partitionDigests"] = {"from-the-manifest.json": "digest"}
+        with open(manifest_file, "w") as f:
+            json.dump(manifest, f)
+
+        partitioned_files = _list_partition_files_out_cached(
+            TEST_CASES_DIR / "bulk-licenses.ttl", tmp_dir, manifest_file, False
+        )
+
+        assert partitioned_files == {tmp_dir / "from-the-manifest.json"}
+
+
+def test_list_ignores_manifest_when_bulk_file_changed():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        bulk_ttl_file = tmp_dir / "bulk.ttl"
+        manifest_file = tmp_dir / "bulk.json"
+
+        shutil.copy(TEST_CASES_DIR / "bulk-licenses.ttl", bulk_ttl_file)
+        _split_to_individual_files(bulk_ttl_file, tmp_dir, manifest_file, False)
+        manifest_contents = manifest_file.read_text()
+
+        shutil.copy(TEST_CASES_DIR / "bulk-monetary-grant.ttl", bulk_ttl_file)
+        partitioned_files = _list_partition_files_out_cached(
+            bulk_ttl_file, tmp_dir, manifest_file, False
+        )
+
+        assert partitioned_files == {tmp_dir / "mbo_todo_monetary_grant_1.json"}
+        # Only `split` writes the manifest, otherwise it would claim partitions which haven't been written yet.
+        assert manifest_file.read_text() == manifest_contents
+
+
+def test_split_writes_nothing_when_bulk_file_unchanged():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        manifest_file = tmp_dir / "bulk-licenses.json"
+        first_split = _split_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl", tmp_dir, manifest_file, False
+        )
+        modification_times = {p: p.stat().st_mtime_ns for p in first_split.written}
+
+        second_split = _split_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl", tmp_dir, manifest_file, False
+        )
+
+        assert second_split.written == set()
+        assert second_split.digests == first_split.digests
+        assert {
+            p: p.stat().st_mtime_ns for p in first_split.written
+        } == modification_times
+
+
+@pytest.mark.parametrize("streaming", [False, True])
+def test_split_only_rewrites_changed_partitions(streaming: bool):
+    bulk_file_name = "bulk-licenses.nt" if streaming else "bulk-licenses.ttl"
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        bulk_file = tmp_dir / bulk_file_name
+        manifest_file = tmp_dir / "bulk-licenses.json"
+
+        shutil.copy(TEST_CASES_DIR / bulk_file_name, bulk_file)
+        _split_to_individual_files(bulk_file, tmp_dir, manifest_file, streaming)
+
+        with open(bulk_file, "a") as f:
+            f.write(
+                "\n<https://w3id.org/marco-bolo/mbo_TODO_LICENSE_2> "
+                '<https://schema.org/alternateName> "EUPL-1.0" .\n'
+            )
+        (tmp_dir / "mbo_TODO_LICENSE_3.json").unlink()
+
+        partition_files = _split_to_individual_files(
+            bulk_file, tmp_dir, manifest_file, streaming
+        )
+
+        assert partition_files.written == {
+            tmp_dir / "mbo_TODO_LICENSE_2.json",
+            tmp_dir / "mbo_TODO_LICENSE_3.json",
+        }
+        assert_file_contains_only_these_triples(
+            tmp_dir / "mbo_TODO_LICENSE_2.json",
+            """
+            <https://w3id.org/marco-bolo/mbo_TODO_LICENSE_2> a <https://schema.org/CreativeWork>;
+              <https://schema.org/name> "European Union Public License 1.0";
+              <https://schema.org/alternateName> "EUPL-1.0";
+              <https://schema.org/url> <https://spdx.org/licenses/EUPL-1.0>;
+              <https://schema.org/description> "The European Commission has approved the EUPL on 9 January 2007." .
+            """,
+        )
+
+
+def test_split_force_rewrites_every_partition():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        manifest_file = tmp_dir / "bulk-licenses.json"
+        first_split = _split_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl", tmp_dir, manifest_file, False
+        )
+
+        forced_split = _split_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl",
+            tmp_dir,
+            manifest_file,
+            False,
+            force=True,
+        )
+
+        assert forced_split.written == first_split.written
+
+
+def test_partitions_identical_when_written_in_parallel():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        serial_dir = tmp_dir / "serial"
+        serial_dir.mkdir()
+        parallel_dir = tmp_dir / "parallel"
+        parallel_dir.mkdir()
+
+        _partition_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl", serial_dir, jobs=1
+        )
+        _partition_to_individual_files(
+            TEST_CASES_DIR / "bulk-licenses.ttl", parallel_dir, jobs=3
+        )
+
+        serial_files = sorted(p.name for p in serial_dir.iterdir())
+        assert sorted(p.name for p in parallel_dir.iterdir()) == serial_files
+        for file_name in serial_files:
+            assert (parallel_dir / file_name).read_bytes() == (
+                serial_dir / file_name
+            ).read_bytes()
+
+
+def test_partition_serialization_is_pinned():
+    """
+    Partitions are written as a JSON-LD array of nodes sorted by `@id`, with sorted keys, two-space indentation and
+    unescaped non-ASCII characters, so the output is byte-for-byte the same whichever process serializes it.
+    """
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        _partition_to_individual_files(
+            TEST_CASES_DIR / "bulk-monetary-grant.ttl", tmp_dir
+        )
+        _partition_to_individual_files(TEST_CASES_DIR / "dataset.ttl", tmp_dir)
+
+        assert (tmp_dir / "mbo_todo_monetary_grant_1.json").read_bytes() == (
+            TEST_CASES_DIR / "partition-mbo_todo_monetary_grant_1.json"
+        ).read_bytes()
+        assert "I don’t want to publish it please." in (
+            tmp_dir / "mbo_TODO_DATASET_5.json"
+        ).read_text(encoding="utf-8")
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -1,3 +1,4 @@
+import json
 import shutil
 from datetime import date
 from pathlib import Path
@@ -6,9 +7,12 @@ from typing import Tuple, Optional
 
 import pytest
 import rdflib
+from rdflib.compare import isomorphic
 
 from mbocsvwscripts.processparametadata import (
     _process_para_metadata,
+    _process_para_metadata_files,
+    _extract_input_metadata_triples_and_remove,
     INPUT_METADATA_DATA_TYPE_URI,
     MBO_ORGANIZATION_URI,
     MBO,
@@ -43,6 +47,31 @@ def test_removal_of_triples_from_input():
         )
 
 
+def test_extracted_triples_match_sparql_construct():
+    metadata_file = TEST_CASES_DIR / "parametadata" / "mbo_TODO_LICENSE_1.json"
+    original_graph = rdflib.Graph()
+    original_graph.parse(metadata_file)
+    expected_triples = set(
+        original_graph.query(
+            f"""
+            CONSTRUCT {{ ?inputMetadata ?p ?o. }}
+            WHERE {{
+                ?inputMetadata a <{INPUT_METADATA_DATA_TYPE_URI}>;
+                               ?p ?o.
+            }}
+        """
+        )
+    )
+
+    input_graph, input_metadata_triples = _extract_input_metadata_triples_and_remove(
+        metadata_file
+    )
+
+    assert any(expected_triples)
+    assert set(input_metadata_triples) == expected_triples
+    assert set(input_graph) == set(original_graph) - expected_triples
+
+
 def test_expected_output_triples_present():
     with TemporaryDirectory() as tmp_dir:
         tmp_dir = Path(tmp_dir)
@@ -112,17 +141,103 @@ def test_github_output_triples_present():
         )
 
 
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_batch_matches_processing_each_file(jobs: int):
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        single_dir = tmp_dir / "single"
+        single_dir.mkdir()
+        batch_dir = tmp_dir / "batch"
+        batch_dir.mkdir()
+
+        single_input_file, single_output_file = _augment_input_metadata_tmp_dir(
+            TEST_CASES_DIR / "parametadata" / "mbo_TODO_LICENSE_1.json",
+            "mbo_TODO_LICENSE_1-input-metadata.json",
+            single_dir,
+        )
+
+        batch_files_out = {}
+        for name in ["mbo_TODO_LICENSE_1", "mbo_TODO_LICENSE_1-copy"]:
+            shutil.copy(
+                TEST_CASES_DIR / "parametadata" / "mbo_TODO_LICENSE_1.json",
+                batch_dir / f"{name}.json",
+            )
+            batch_files_out[batch_dir / f"{name}.json"] = (
+                batch_dir / f"{name}-input-metadata.json"
+            )
+        _process_para_metadata_files(
+            batch_files_out, date.fromisoformat("2020-01-01"), jobs=jobs
+        )
+
+        for batch_input_file, batch_output_file in batch_files_out.items():
+            assert isomorphic(
+                rdflib.Graph().parse(batch_input_file),
+                rdflib.Graph().parse(single_input_file),
+            )
+            assert isomorphic(
+                rdflib.Graph().parse(batch_output_file),
+                rdflib.Graph().parse(single_output_file),
+            )
+
+
+_PARA_METADATA_FRAME_FILE = (
+    Path(__file__).resolve().parent.parent.parent / "para-metadata.frame.json"
+)
+"""
+The frame the build uses. It is outside of the tools image's build context, so the tests which need it are skipped
+when they're run there.
+"""
+
+
+@pytest.mark.skipif(
+    not _PARA_METADATA_FRAME_FILE.exists(),
+    reason=f"{_PARA_METADATA_FRAME_FILE} is only available in a checkout of the repository.",
+)
+def test_para_metadata_framed():
+    with open(_PARA_METADATA_FRAME_FILE, "r", encoding="utf-8") as f:
+        frame = json.load(f)
+
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        _, unframed_output_file = _augment_input_metadata_tmp_dir(
+            TEST_CASES_DIR / "parametadata" / "mbo_TODO_LICENSE_1.json",
+            "mbo_TODO_LICENSE_1-input-metadata.json",
+            tmp_dir / "unframed",
+        )
+        _, framed_output_file = _augment_input_metadata_tmp_dir(
+            TEST_CASES_DIR / "parametadata" / "mbo_TODO_LICENSE_1.json",
+            "mbo_TODO_LICENSE_1-input-metadata.json",
+            tmp_dir / "framed",
+            frame=frame,
+        )
+
+        with open(framed_output_file, "r") as f:
+            framed = json.load(f)
+        assert framed["@type"] == "https://schema.org/Dataset"
+        assert {
+            distribution["@type"]
+            for distribution in framed["https://schema.org/distribution"]
+        } == {"https://schema.org/DataDownload"}
+
+        assert isomorphic(
+            rdflib.Graph().parse(framed_output_file),
+            rdflib.Graph().parse(unframed_output_file),
+        )
+
+
 def _augment_input_metadata_tmp_dir(
     input_file: Path,
     output_file_name: str,
     tmp_dir: Path,
     date_created: date = date.fromisoformat("2020-01-01"),
     git_repo_commit_file_url: Optional[str] = None,
+    frame: Optional[dict] = None,
 ) -> Tuple[Path, Path]:
     """
     We don't want to overwrite our test cases file. So this copies it to the given temporary dir for us.
     """
 
+    tmp_dir.mkdir(parents=True, exist_ok=True)
     tmp_input_file = tmp_dir / input_file.name
     shutil.copy(input_file, tmp_input_file)
     output_file = tmp_dir / output_file_name
@@ -131,6 +246,7 @@ def _augment_input_metadata_tmp_dir(
         output_file,
         date_created,
         git_repo_commit_file_url=git_repo_commit_file_url,
+        frame=frame,
     )
 
     return tmp_input_file, output_file
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 
@@ -37,5 +38,42 @@ def test_mbo_list_columns_values_converted_to_node_references():
         pd.testing.assert_frame_equal(expected_df, actual_df)
 
 
+@pytest.mark.parametrize("max_identifiers_in_memory", [None, 1, 2, 100])
+def test_external_sort_matches_in_memory_sort(max_identifiers_in_memory):
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        first_csv = tmp_dir / "first.csv"
+        first_csv.write_text("PID,Other\nmbo_3,x\nmbo_1,y\n,z\nmbo_3,w\n")
+        second_csv = tmp_dir / "second.csv"
+        second_csv.write_text('PID,Other\nmbo_2,"multi\nline"\nmbo_1,v\n')
+
+        unioned_file_out = tmp_dir / "unioned.csv"
+        _union_identifiers(
+            [first_csv, second_csv],
+            unioned_file_out,
+            pid_column_name="MBO PID",
+            max_identifiers_in_memory=max_identifiers_in_memory,
+        )
+
+        assert unioned_file_out.read_text() == "MBO PID\nmbo_1\nmbo_2\nmbo_3\n"
+
+
+def test_unchanged_union_not_rewritten():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        csv_files = [TEST_CASES_DIR / "a.csv", TEST_CASES_DIR / "b.csv"]
+        unioned_file_out = tmp_dir / "a-and-b.csv"
+
+        assert _union_identifiers(csv_files, unioned_file_out, "MBO PID")
+        os.utime(unioned_file_out, ns=(0, 0))
+
+        assert not _union_identifiers(csv_files, unioned_file_out, "MBO PID")
+        assert unioned_file_out.stat().st_mtime_ns == 0
+        assert list(tmp_dir.iterdir()) == [unioned_file_out]
+
+        assert _union_identifiers(csv_files[:1], unioned_file_out, "MBO PID")
+        assert unioned_file_out.stat().st_mtime_ns != 0
+
+
 if __name__ == "__main__":
     pytest.main()
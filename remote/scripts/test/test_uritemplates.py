@@ -0,0 +1,54 @@
+import pytest
+
+from mbocsvwscripts.uritemplates import compile_uri_template
+
+
+def test_uri_template_expansion():
+    values = {
+        "id": "mbo_1",
+        "name": "a b/c",
+        "encoded": "a%20b%c",
+        "list": ["x", "y z"],
+        "empty": None,
+    }
+
+    def _expand(template: str) -> str:
+        return compile_uri_template(template).expand(values)
+
+    assert _expand("https://w3id.org/marco-bolo/{+id}") == (
+        "https://w3id.org/marco-bolo/mbo_1"
+    )
+    assert _expand("{name}") == "a%20b%2Fc"
+    assert _expand("{+name}") == "a%20b/c"
+    assert _expand("{#name}") == "#a%20b/c"
+    assert _expand("{+encoded}") == "a%20b%25c"
+    assert _expand("{list}") == "x,y%20z"
+    assert _expand("x{empty}{#empty}{missing}") == "x"
+    assert _expand("{+id}#{name}-{id,empty,list}") == "mbo_1#a%20b%2Fc-mbo_1,x,y%20z"
+
+
+def test_empty_string_values_are_defined():
+    values = {"id": "mbo_1", "blank": "", "empty": None, "list": []}
+
+    def _expand(template: str) -> str:
+        return compile_uri_template(template).expand(values)
+
+    assert _expand("x{#blank}") == "x#"
+    assert _expand("x{#blank,empty}") == "x#"
+    assert _expand("{id,blank}") == "mbo_1,"
+    assert _expand("x{blank,empty}y") == "xy"
+    assert _expand("x{#empty,list}y") == "xy"
+
+
+def test_compiled_uri_template_properties():
+    compiled_template = compile_uri_template("https://w3id.org/marco-bolo/{+id}#{_row}")
+    assert compiled_template.variable_names == {"id", "_row"}
+    assert compiled_template.literal_prefix == "https://w3id.org/marco-bolo/"
+    assert not compiled_template.is_constant
+
+    assert compile_uri_template("rdf:type").is_constant
+
+
+def test_unsupported_operator_is_an_error():
+    with pytest.raises(Exception, match="Unsupported URI template expression"):
+        compile_uri_template("{?query}")
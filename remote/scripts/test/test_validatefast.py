@@ -0,0 +1,154 @@
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+from click.testing import CliRunner
+
+from mbocsvwscripts.validatefast import main
+
+
+def test_valid_references():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        _write_repository(
+            tmp_dir,
+            person_csv="Id,Name\nmbo_1,Alice\nmbo_2,Bob\n",
+            dataset_csv="Id,Creator,Contributors\nmbo_3,mbo_1,mbo_1|mbo_2\nmbo_4,mbo_2,\n",
+        )
+
+        result = _run_in(tmp_dir)
+
+    assert result.exit_code == 0, result.output
+    assert "0 problem(s) found" in result.output
+
+
+def test_invalid_references_and_duplicate_primary_keys():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        _write_repository(
+            tmp_dir,
+            person_csv="Id,Name\nmbo_1,Alice\nmbo_2,Bob\nmbo_2,Robert\n",
+            dataset_csv="Id,Creator,Contributors\nmbo_3,mbo_9,mbo_1|mbo_8\nmbo_4,mbo_2,mbo_8\n",
+        )
+
+        result = _run_in(tmp_dir)
+
+    assert result.exit_code == 1
+    assert "3 problem(s) found" in result.output
+    assert "'mbo_2' (records 3, 4)" in result.output
+    # The table schema's foreign key.
+    assert "'mbo_9' (record 2)" in result.output
+    # The manual list column foreign key.
+    assert "'mbo_8' (records 2, 3)" in result.output
+
+
+def test_missing_table_reported():
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        _write_repository(
+            tmp_dir,
+            person_csv="Id,Name\nmbo_1,Alice\n",
+            dataset_csv="Id,Creator,Contributors\nmbo_3,mbo_1,\n",
+        )
+        (tmp_dir / "data" / "Person.csv").unlink()
+
+        result = _run_in(tmp_dir)
+
+    assert result.exit_code == 1
+    assert "Table data/Person.csv does not exist." in result.output
+
+
+def _run_in(repository_dir: Path):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.chdir(repository_dir)
+        return CliRunner().invoke(main, [])
+
+
+def _write_repository(repository_dir: Path, person_csv: str, dataset_csv: str):
+    """
+    Writes a cut-down repository laid out like this one, with a `Dataset.csv` referencing `Person.csv` through both a
+    table schema foreign key and a manual (list column) foreign key check.
+    """
+    remote_dir = repository_dir / "remote"
+    data_dir = repository_dir / "data"
+    remote_dir.mkdir()
+    data_dir.mkdir()
+
+    (data_dir / "Person.csv").write_text(person_csv)
+    (data_dir / "Dataset.csv").write_text(dataset_csv)
+
+    _write_json(
+        remote_dir / "Person.schema.json",
+        {
+            "columns": [
+                _get_column("id", "Id"),
+                _get_column("name", "Name"),
+            ],
+            "primaryKey": ["id"],
+        },
+    )
+    _write_json(
+        remote_dir / "Dataset.schema.json",
+        {
+            "columns": [
+                _get_column("id", "Id"),
+                _get_column("creatorId", "Creator"),
+                _get_column("contributorIds", "Contributors"),
+            ],
+            "primaryKey": ["id"],
+            "foreignKeys": [
+                {
+                    "columnReference": "creatorId",
+                    "reference": {
+                        "resource": "../data/Person.csv",
+                        "columnReference": "id",
+                    },
+                }
+            ],
+        },
+    )
+    for class_name, tables in {
+        "Person": ["Person"],
+        "Dataset": ["Dataset", "Person"],
+    }.items():
+        _write_json(
+            remote_dir / f"{class_name}.csv-metadata.json",
+            {
+                "tables": [
+                    {
+                        "url": f"../data/{table}.csv",
+                        "tableSchema": f"{table}.schema.json",
+                    }
+                    for table in tables
+                ]
+            },
+        )
+
+    _write_json(
+        remote_dir / "foreign-keys.json",
+        {
+            "Dataset": [
+                {
+                    "childTable": "data/Dataset.csv",
+                    "childColumn": "Contributors",
+                    "parentTable": "data/Person.csv",
+                    "parentColumn": "Id",
+                    "separator": "|",
+                }
+            ]
+        },
+    )
+
+
+def _get_column(name: str, title: str) -> dict:
+    return {"name": name, "titles": {"en": [title]}}
+
+
+def _write_json(file: Path, content: dict):
+    with open(file, "w") as f:
+        json.dump(content, f)
+
+
+if __name__ == "__main__":
+    pytest.main()
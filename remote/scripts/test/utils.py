@@ -12,10 +12,10 @@ TEST_CASES_DIR = _get_test_cases_dir()
 
 
 def assert_file_contains_only_these_triples(
-    actual_triples_file: Path, expected_ttl: str
+    actual_triples_file: Path, expected_ttl: str, expected_format: str = "ttl"
 ) -> None:
     expected_graph = rdflib.Graph()
-    expected_graph.parse(data=expected_ttl, format="ttl")
+    expected_graph.parse(data=expected_ttl, format=expected_format)
     actual_graph: rdflib.Graph = rdflib.Graph()
     actual_graph.parse(actual_triples_file)
     (_, in_first, in_second) = graph_diff(expected_graph, actual_graph)
@@ -1,4 +1,4 @@
-.PHONY: split clean output-directories init remove-orphaned
+.PHONY: split clean output-directories init remove-orphaned FORCE
 
 GIT_HASH			:= $(shell git rev-parse --verify HEAD)
 GIT_HASH_REPO_URL	:= https://github.com/marco-bolo/csv-to-json-ld/tree/$(GIT_HASH)
@@ -14,20 +14,23 @@ RIOT					:= docker run --rm -v "$(WORKING_DIR)":/work -u "$(UID)":"$(GID)" -w /w
 SPARQL					:= docker run --rm -v "$(WORKING_DIR)":/work -u "$(UID)":"$(GID)" -w /work $(JENA_CLI_DOCKER) sparql
 MBO_TOOLS_DOCKER_RUN	:= docker run -i --rm -v "$(WORKING_DIR)":/work -u "$(UID)":"$(GID)" -w /work "$(MBO_TOOLS_DOCKER)"
 JQ						:= $(MBO_TOOLS_DOCKER_RUN) jq
-JSONLD_CLI				:= $(MBO_TOOLS_DOCKER_RUN) jsonld
-PARTITON_CLI			:= $(MBO_TOOLS_DOCKER_RUN) partition execute
+PARTITON_SPLIT_CLI		:= $(MBO_TOOLS_DOCKER_RUN) partition split
 PARTITON_LIST_CLI		:= $(MBO_TOOLS_DOCKER_RUN) partition list
-PROCESS_PARA_METADATA	:= $(MBO_TOOLS_DOCKER_RUN) processparametadata
+PROCESS_PARA_METADATA_BATCH	:= $(MBO_TOOLS_DOCKER_RUN) processparametadatabatch
+COMPACT_JSON_LD			:= $(MBO_TOOLS_DOCKER_RUN) compactjsonld
 
 
 SCHEMA_ORG_CONTEXT_URL 	:= https://schema.org/docs/jsonldcontext.json
 SCHEMA_ORG_FILE			:= out/resources/schema-context.json
+PARTITION_MANIFESTS_DIR	:= out/partition-manifests
+COMPACT_FILE_LIST		:= out/resources/compact-file-list.txt
 
 BULK_TTL_FILES 			:= $(wildcard out/bulk/*.ttl)
 	
 output-directories:
 	@mkdir -p out/raw-jsonld
 	@mkdir -p out/resources
+	@mkdir -p $(PARTITION_MANIFESTS_DIR)
 
 $(SCHEMA_ORG_FILE):
 	@curl --silent -H "Accept: application/json" --compressed --output "$(SCHEMA_ORG_FILE).tmp" "$(SCHEMA_ORG_CONTEXT_URL)";
@@ -40,24 +43,6 @@ $(SCHEMA_ORG_FILE):
 
 init: output-directories $(SCHEMA_ORG_FILE)
 
-out/%.json: out/raw-jsonld/%.json
-	@echo "=============================== Converting $< to schema.org JSON-LD $@ ===============================" ;
-
-	@# 1. We do a raw conversion of the raw JSON-LD into tidier schema.org JSON-LD
-	@# 2. We change all https://schema.org/ URIs to http://schema.org/ in preparation for compaction 
-	@# 		against the schema.org JSON-LD context (which uses exclusively http://schema.org URIs).
-	@# 3. We now compact against the schema.org JSON-LD context so we can have things like `"@type": "Dataset"` 
-	@# 		instead of `"@type": "https://schema.org/Dataset"`
-	@# 4. Then we set the context to make use of the schema.org context, but tell it to use https URIs instead 
-	@# 		of http.
-
-	@cat "$<" \
-		| sed 's/https:\/\/schema.org\//http:\/\/schema.org\//g' \
-		| $(JSONLD_CLI) compact --context "$(SCHEMA_ORG_FILE)" --allow all \
-		| $(JQ) '.["@context"] = { "@import": "https://schema.org/", "schema": "https://schema.org/" }' > "$@";
-
-	@echo "";
-
 define SPLIT_TTL =
 # The following line is a bit of a beast.
 # 	It creates a variable called `INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1)` which is unique to each bulk TTL file.
@@ -66,31 +51,63 @@ define SPLIT_TTL =
 #   Overall it queries the bulk TTL file for the unique subjects defined therein, pulls out the slug
 #	from each of them and then converts that into an `out/raw-jsonld/file-name.json` which is where that subject's 
 #	data will be placed. 
+#
+#	The answer is cached in the bulk TTL file's partition manifest (keyed on the TTL file's hash), so the bulk TTL
+#	file is only parsed here when it has changed since it was last split.
+$(eval PARTITION_MANIFEST_$(1) := $(1:out/bulk/%.ttl=$(PARTITION_MANIFESTS_DIR)/%.json))
 $(eval INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1) = \
-  $(shell $(PARTITON_LIST_CLI) --out out/raw-jsonld "$(1)" ))
-$(eval SPLIT_RAW_JSON_LD_FILES += $(INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1)) $(INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1):%.json=%-input-metadata.json))
-
-$(INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1)) $(INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1):%.json=%-input-metadata.json)  &: $(1)
+  $(shell $(PARTITON_LIST_CLI) --manifest "$(PARTITION_MANIFEST_$(1))" --out out/raw-jsonld "$(1)" ))
+$(eval SPLIT_FILES_$(1) := $(INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1)) $(INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1):%.json=%-input-metadata.json))
+$(eval SPLIT_RAW_JSON_LD_FILES += $(SPLIT_FILES_$(1)))
+$(eval MISSING_SPLIT_FILES_$(1) := $(filter-out $(wildcard $(SPLIT_FILES_$(1))),$(SPLIT_FILES_$(1))))
+
+# `partition split` only rewrites the partitions whose triples have changed since the last split and prints those it
+# wrote, so only their para-metadata is regenerated. Partitions which were left untouched keep their old modification
+# times and the (empty) rule below doesn't trigger rebuilds of anything downstream of them.
+#
+# The empty rule means make can't recreate a partition or para-metadata file which has been deleted, so where any are
+# missing the bulk TTL file is split again with `--force`, rewriting every partition and its para-metadata.
+$(PARTITION_MANIFEST_$(1)): $(1) $(if $(MISSING_SPLIT_FILES_$(1)),FORCE)
 	@echo "=============================== Splitting $(1) into $(INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1)) and associated para-metadata files ==============================="
-	@$(PARTITON_CLI) --out out/raw-jsonld "$(1)"
-	@$(foreach file,$(INDIVIDUAL_RAW_JSON_LD_FILE_NAMES_$(1)),\
-		$(eval INPUT_METADATA_FILE_$(file) := $(file:%.json=%-input-metadata.json)) \
-		$(eval INPUT_METADATA_FILE_TMP_$(file) := $(file:%.json=%-input-metadata-tmp.json)) \
-		$(PROCESS_PARA_METADATA) --git_repo_commit_file_url "$(GIT_HASH_REPO_URL)" "$(file)" "$(INPUT_METADATA_FILE_TMP_$(file))"; \
-		$(JSONLD_CLI) frame --frame remote/para-metadata.frame.json "$(INPUT_METADATA_FILE_TMP_$(file))" > "$(INPUT_METADATA_FILE_$(file))"; \
-		rm -f "$(INPUT_METADATA_FILE_TMP_$(file))"; \
-	)
+	@WRITTEN_FILES="$$$$($(PARTITON_SPLIT_CLI) $(if $(MISSING_SPLIT_FILES_$(1)),--force) --manifest "$(PARTITION_MANIFEST_$(1))" --out out/raw-jsonld "$(1)")" || { rm -f "$$@"; exit 1; }; \
+	printf '%s\n' $$$$WRITTEN_FILES \
+		| $(PROCESS_PARA_METADATA_BATCH) --git_repo_commit_file_url "$(GIT_HASH_REPO_URL)" --frame remote/para-metadata.frame.json --file-list - \
+		|| { rm -f "$$@"; exit 1; }
+	@touch "$$@"
 	@echo "Done".
 	@echo ""
 
+$(SPLIT_FILES_$(1)): $(PARTITION_MANIFEST_$(1)) ;
 
 endef
 
+FORCE:
+
 $(foreach file,$(BULK_TTL_FILES),$(eval $(call SPLIT_TTL,$(file))))
 
 TIDY_JSON_LD_FILES				:= $(SPLIT_RAW_JSON_LD_FILES:out/raw-jsonld/%=out/%)
 EXPECTED_INDIVIDUAL_OUT_FILES 	:= $(TIDY_JSON_LD_FILES) $(SPLIT_RAW_JSON_LD_FILES)
 
+ifneq ($(TIDY_JSON_LD_FILES),)
+# Converts the raw JSON-LD into tidier schema.org JSON-LD in one batch so that the schema.org context is only
+# processed once. `compactjsonld` skips any file whose output is already newer than its raw JSON-LD.
+#
+# 1. We change all https://schema.org/ URIs to http://schema.org/ in preparation for compaction 
+# 		against the schema.org JSON-LD context (which uses exclusively http://schema.org URIs).
+# 2. We now compact against the schema.org JSON-LD context so we can have things like `"@type": "Dataset"` 
+# 		instead of `"@type": "https://schema.org/Dataset"`
+# 3. Then we set the context to make use of the schema.org context, but tell it to use https URIs instead 
+# 		of http.
+#
+# The file list is written by make rather than passed on the command line, which could grow too long.
+$(TIDY_JSON_LD_FILES) &: $(SPLIT_RAW_JSON_LD_FILES)
+	@echo "=============================== Converting raw JSON-LD to schema.org JSON-LD ===============================" ;
+	$(file >$(COMPACT_FILE_LIST),$^)
+	@$(COMPACT_JSON_LD) --context "$(SCHEMA_ORG_FILE)" --out out --file-list "$(COMPACT_FILE_LIST)"
+	@rm -f "$(COMPACT_FILE_LIST)"
+	@echo "";
+endif
+
 define DELETE_UNEXPECTED_INDIVIDUAL_FILES
 ifeq ($$(filter $$(file),$(EXPECTED_INDIVIDUAL_OUT_FILES)),) 
   $$(shell rm -f "$$(file)")
@@ -107,6 +124,7 @@ clean:
 	@rm -f $(SCHEMA_ORG_FILE)
 	@rm -rf out/resources
 	@rm -rf out/raw-jsonld
+	@rm -rf $(PARTITION_MANIFESTS_DIR)
 	@rm -f $(TIDY_JSON_LD_FILES)
 
 .DEFAULT_GOAL := jsonld
\ No newline at end of file
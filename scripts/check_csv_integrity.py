@@ -1,49 +1,210 @@
 #!/usr/bin/env python3
 
+import argparse
 import csv
-import sys
 import glob
+import hashlib
+import json
 import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+# Bump this whenever check_file's rules change so that cached results are discarded.
+CHECKER_VERSION = 2
+
 
 def check_file(file_path):
-    with open(file_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-        expected = None
-        error_found = 0
-        for line_num, row in enumerate(reader, start=1):
+    """
+    Checks that no row in the file has fewer fields than its header row.
+
+    Problems are reported against the line a row starts on, since a quoted value may span several lines.
+
+    The file is read once, as bytes, so that its hash is computed in the same pass as the check.
+    Returns the file's SHA-256 digest, the number of lines read and the list of problems found.
+    """
+    digest = hashlib.sha256()
+    problems = []
+
+    def lines():
+        with open(file_path, "rb") as f:
+            for raw_line in f:
+                digest.update(raw_line)
+                yield raw_line.decode("utf-8")
+
+    reader = csv.reader(lines())
+    expected = None
+    start_line = 1
+    try:
+        while True:
+            # `line_num` is the last line of the previous row, so it has to be read before this row is.
+            start_line = reader.line_num + 1
+            row = next(reader, None)
+            if row is None:
+                break
             if expected is None:
                 expected = len(row)
                 continue
             if len(row) < expected:
-                print(f"{file_path}: line {line_num} has {len(row)} fields, expected at least {expected}")
-                error_found = 1
-        return error_found
-
-# Determine the data directory path relative to this script
-script_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(script_dir)  # Go up one level from scripts/ to project root
-data_dir = os.path.join(project_root, "data")
-
-# Check if data directory exists
-if not os.path.exists(data_dir):
-    print(f"❌ Data directory not found: {data_dir}")
-    sys.exit(1)
-
-errors = 0
-csv_pattern = os.path.join(data_dir, "*.csv")
-csv_files = glob.glob(csv_pattern)
-
-if not csv_files:
-    print(f"⚠️  No CSV files found in {data_dir}")
-    sys.exit(1)
-
-for f in csv_files:
-    filename = os.path.basename(f)
-    print(f"Checking {filename}")
-    errors += check_file(f)
-
-if errors:
-    print("❌ CSV format errors found. Fix them before continuing.")
-    sys.exit(1)
-else:
-    print("✅ All CSV files passed field count check.")
+                problems.append({
+                    "line": start_line,
+                    "fields": len(row),
+                    "expected": expected,
+                    "message": f"line {start_line} has {len(row)} fields, expected at least {expected}",
+                })
+    except (UnicodeDecodeError, csv.Error) as e:
+        # A file which can't be parsed is reported like any other problem. It is hashed in full so that the result
+        # can still be cached.
+        problems.append({"line": start_line, "message": f"line {start_line} could not be read: {e}"})
+        return {"sha256": hash_file(file_path), "lines": reader.line_num, "problems": problems}
+
+    return {"sha256": digest.hexdigest(), "lines": reader.line_num, "problems": problems}
+
+
+def hash_file(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cache(cache_path):
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != CHECKER_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def write_json_atomically(path, value):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(value, f, indent=2)
+            f.write("\n")
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def get_cached_result(file_path, stat, cached):
+    """
+    Returns the cached result for the file if its contents are unchanged, otherwise None.
+
+    A matching size and mtime is trusted as is. When only the mtime differs (e.g. after a fresh checkout) the file is
+    hashed and the cached result is reused if the hash still matches.
+    """
+    if cached is None or cached.get("size") != stat.st_size:
+        return None
+    if cached.get("mtime_ns") == stat.st_mtime_ns:
+        return cached
+    if cached.get("sha256") == hash_file(file_path):
+        return cached
+    return None
+
+
+def main():
+    # Determine the data directory path relative to this script
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(script_dir)  # Go up one level from scripts/ to project root
+
+    parser = argparse.ArgumentParser(
+        description="Checks that no row in the data/*.csv files has fewer fields than the file's header row."
+    )
+    parser.add_argument("--data-dir", default=os.path.join(project_root, "data"),
+                        help="The directory containing the CSV files to check.")
+    parser.add_argument("--cache", default=os.path.join(project_root, "out", "validation", "csv-integrity-cache.json"),
+                        help="Where the results for unchanged files are cached. Pass an empty string to disable.")
+    parser.add_argument("--summary",
+                        help="Write a JSON summary of every file's result, including all problems found, to this path.")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="The number of files to check concurrently.")
+    args = parser.parse_args()
+
+    data_dir = args.data_dir
+
+    # Check if data directory exists
+    if not os.path.exists(data_dir):
+        print(f"❌ Data directory not found: {data_dir}")
+        sys.exit(1)
+
+    csv_pattern = os.path.join(data_dir, "*.csv")
+    csv_files = sorted(glob.glob(csv_pattern))
+
+    if not csv_files:
+        print(f"⚠️  No CSV files found in {data_dir}")
+        sys.exit(1)
+
+    cache = load_cache(args.cache) if args.cache else {}
+    results = {}
+    stats = {}
+    to_check = []
+    for f in csv_files:
+        stats[f] = os.stat(f)
+        cached = get_cached_result(f, stats[f], cache.get(os.path.abspath(f)))
+        if cached is None:
+            to_check.append(f)
+        else:
+            results[f] = dict(cached, cached=True)
+
+    if len(to_check) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(to_check))) as executor:
+            for f, result in zip(to_check, executor.map(check_file, to_check)):
+                results[f] = dict(result, cached=False)
+    else:
+        for f in to_check:
+            results[f] = dict(check_file(f), cached=False)
+
+    errors = 0
+    for f in csv_files:
+        filename = os.path.basename(f)
+        result = results[f]
+        print(f"Checking {filename}" + (" (unchanged)" if result["cached"] else ""))
+        for problem in result["problems"]:
+            print(f"{f}: {problem['message']}")
+        errors += len(result["problems"])
+
+    if args.cache:
+        # Only the files checked this time are kept, so entries for deleted files don't accumulate.
+        new_cache = {
+            os.path.abspath(f): {
+                "size": stats[f].st_size,
+                "mtime_ns": stats[f].st_mtime_ns,
+                "sha256": results[f]["sha256"],
+                "lines": results[f]["lines"],
+                "problems": results[f]["problems"],
+            }
+            for f in csv_files
+        }
+        write_json_atomically(args.cache, {"version": CHECKER_VERSION, "files": new_cache})
+
+    if args.summary:
+        write_json_atomically(args.summary, {
+            "errorCount": errors,
+            "files": [
+                {
+                    "file": os.path.relpath(f, project_root),
+                    "cached": results[f]["cached"],
+                    "lines": results[f]["lines"],
+                    "problems": results[f]["problems"],
+                }
+                for f in csv_files
+            ],
+        })
+
+    if errors:
+        print("❌ CSV format errors found. Fix them before continuing.")
+        sys.exit(1)
+    else:
+        print("✅ All CSV files passed field count check.")
+
+
+if __name__ == "__main__":
+    main()
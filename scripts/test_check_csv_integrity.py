@@ -0,0 +1,86 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+import pytest
+
+from check_csv_integrity import CHECKER_VERSION, check_file
+
+_CHECK_CSV_INTEGRITY_SCRIPT = Path(__file__).parent / "check_csv_integrity.py"
+
+
+def _run(data_dir: Path, *args: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(_CHECK_CSV_INTEGRITY_SCRIPT), "--data-dir", str(data_dir), *args],
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_problems_reported_against_the_line_a_row_starts_on():
+    with TemporaryDirectory() as tmp_dir:
+        csv_file = Path(tmp_dir) / "a.csv"
+        csv_file.write_text('a,b,c\n1,"x\ny",3\n4,"p\nq"\n5,6,7\n', encoding="utf-8")
+
+        result = check_file(str(csv_file))
+
+    assert result["lines"] == 6
+    assert [(problem["line"], problem["fields"]) for problem in result["problems"]] == [(4, 2)]
+
+
+def test_unreadable_row_reported_against_the_line_it_starts_on():
+    with TemporaryDirectory() as tmp_dir:
+        csv_file = Path(tmp_dir) / "a.csv"
+        csv_file.write_bytes(b'a,b\n1,"x\n\xff"\n')
+
+        result = check_file(str(csv_file))
+
+    assert [problem["line"] for problem in result["problems"]] == [2]
+    assert "could not be read" in result["problems"][0]["message"]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_results_cached_until_files_change(jobs: str):
+    with TemporaryDirectory() as tmp_dir:
+        tmp_dir = Path(tmp_dir)
+        data_dir = tmp_dir / "data"
+        data_dir.mkdir()
+        (data_dir / "a.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+        (data_dir / "b.csv").write_text("a,b\n1\n", encoding="utf-8")
+        cache_file = tmp_dir / "cache.json"
+        summary_file = tmp_dir / "summary.json"
+        args = ["--cache", str(cache_file), "--summary", str(summary_file), "--jobs", jobs]
+
+        result = _run(data_dir, *args)
+        assert result.returncode == 1
+        assert "Checking a.csv\n" in result.stdout
+        assert "b.csv: line 2 has 1 fields, expected at least 2" in result.stdout
+
+        summary = json.loads(summary_file.read_text(encoding="utf-8"))
+        assert summary["errorCount"] == 1
+        assert [(f["cached"], len(f["problems"])) for f in summary["files"]] == [(False, 0), (False, 1)]
+
+        # Unchanged files aren't checked again, but their problems are still reported.
+        result = _run(data_dir, *args)
+        assert result.returncode == 1
+        assert "Checking a.csv (unchanged)" in result.stdout
+        assert "b.csv: line 2 has 1 fields, expected at least 2" in result.stdout
+
+        (data_dir / "b.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+        result = _run(data_dir, *args)
+        assert result.returncode == 0
+        assert "Checking b.csv\n" in result.stdout
+
+        # Entries for files which no longer exist are dropped from the cache.
+        (data_dir / "a.csv").unlink()
+        _run(data_dir, *args)
+        cache = json.loads(cache_file.read_text(encoding="utf-8"))
+        assert cache["version"] == CHECKER_VERSION
+        assert list(cache["files"]) == [os.path.abspath(data_dir / "b.csv")]
+
+
+if __name__ == "__main__":
+    pytest.main()